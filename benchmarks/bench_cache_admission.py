@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark result cache hit rates with and without TinyLFU admission.
+
+Replays a request trace against a result cache, storing each missed key as a
+server does, and reports the hit rate of LRU alone and of LRU behind a
+TinyLFU admission filter. Without a trace file, synthetic traffic is used:
+interactive requests for genes with Zipf-distributed popularity, interleaved
+with bulk sweeps over genes that are each requested once.
+
+A trace file holds one cache key per line (e.g. extracted from request
+logs); lines starting with "#" are ignored. Keys starting with "bulk:" are
+counted as scan traffic in the per-class hit rates.
+
+Usage:
+    python benchmarks/bench_cache_admission.py [--trace FILE] [--cache-size N]
+        [--requests N] [--genes N] [--sweep N] [--sweep-every N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from genome_mcp.core import ResultCache, TinyLFU
+
+
+def synthetic_trace(
+    requests: int, genes: int, sweep: int, sweep_every: int, seed: int = 0
+) -> Iterator[str]:
+    """Generate interactive Zipf traffic interleaved with bulk sweeps."""
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, genes + 1)]
+    interactive = rng.choices(range(genes), weights=weights, k=requests)
+    swept = 0
+    for index, gene in enumerate(interactive, start=1):
+        yield f"ncbi_gene:get_gene_info:{gene}"
+        if index % sweep_every == 0:
+            for _ in range(sweep):
+                yield f"bulk:ncbi_gene:get_gene_info:{genes + swept}"
+                swept += 1
+
+
+def load_trace(path: Path) -> Iterator[str]:
+    """Read one cache key per line from a trace file."""
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+def replay(trace: List[str], cache_size: int, admission: Optional[TinyLFU]) -> dict:
+    """Replay a trace against a cache; returns hit counts per traffic class."""
+    cache = ResultCache(max_size=cache_size, ttl=86400, admission=admission)
+    value = {"gene_id": "TP53"}
+    counts = {"bulk": [0, 0], "interactive": [0, 0]}
+    start = time.perf_counter()
+    for key in trace:
+        kind = counts["bulk" if key.startswith("bulk:") else "interactive"]
+        kind[1] += 1
+        if cache.get(key) is not None:
+            kind[0] += 1
+        else:
+            cache.set(key, value)
+    elapsed = time.perf_counter() - start
+    return {"counts": counts, "elapsed": elapsed}
+
+
+def hit_rate(hits: int, total: int) -> str:
+    return f"{100 * hits / total:6.2f}%" if total else "     -"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--trace", type=Path, help="Trace file, one key per line")
+    parser.add_argument("--cache-size", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--genes", type=int, default=50_000)
+    parser.add_argument("--sweep", type=int, default=5000)
+    parser.add_argument("--sweep-every", type=int, default=10_000)
+    args = parser.parse_args()
+
+    if args.trace:
+        trace = list(load_trace(args.trace))
+        print(f"trace: {args.trace}, {len(trace)} requests")
+    else:
+        trace = list(
+            synthetic_trace(args.requests, args.genes, args.sweep, args.sweep_every)
+        )
+        print(
+            f"synthetic trace: {args.requests} interactive requests over "
+            f"{args.genes} genes, sweeps of {args.sweep} every {args.sweep_every}"
+        )
+    print(f"cache size: {args.cache_size}\n")
+
+    print(f"{'policy':<10} {'overall':>8} {'interactive':>12} {'bulk':>8} {'time':>8}")
+    for name, admission in (
+        ("lru", None),
+        ("tinylfu", TinyLFU(args.cache_size)),
+    ):
+        result = replay(trace, args.cache_size, admission)
+        bulk_hits, bulk_total = result["counts"]["bulk"]
+        hits, total = result["counts"]["interactive"]
+        print(
+            f"{name:<10} {hit_rate(hits + bulk_hits, total + bulk_total):>8} "
+            f"{hit_rate(hits, total):>12} {hit_rate(bulk_hits, bulk_total):>8} "
+            f"{result['elapsed']:7.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory used per cached gene result.
+
+Fills a result cache with synthetic gene information results shaped like
+NCBI esummary documents and reports the traced bytes per cached gene for
+plain dictionaries, compact records, compressed values and content-addressed
+values.
+
+Usage:
+    python benchmarks/bench_cache_memory.py [--genes N]
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from genome_mcp.core import (
+    CompactRecordCodec,
+    CompressedCodec,
+    ContentAddressedCodec,
+    IdentityCodec,
+    ResultCache,
+)
+
+
+def make_gene_result(index: int) -> dict:
+    """Build a gene information result resembling a decoded esummary response."""
+    document = {
+        "uid": str(1000 + index),
+        "name": f"GENE{index}",
+        "description": f"synthetic gene {index} protein",
+        "status": "",
+        "chromosome": str(index % 22 + 1),
+        "maplocation": f"{index % 22 + 1}p13.{index % 9}",
+        "otheraliases": f"ALIAS{index}, G{index}",
+        "summary": "This gene encodes a protein. " * 8,
+        "organism": {
+            "scientificname": "Homo sapiens",
+            "commonname": "human",
+            "taxid": 9606,
+        },
+        "genomicinfo": [
+            {
+                "chrloc": str(index % 22 + 1),
+                "chraccver": "NC_000017.11",
+                "chrstart": 7687489 + index,
+                "chrstop": 7668401 + index,
+                "exoncount": 12,
+            }
+        ],
+        "locationhist": [
+            {
+                "annotationrelease": "RS_2023_10",
+                "assemblyaccver": "GCF_000001405.40",
+                "chraccver": "NC_000017.11",
+                "chrstart": 7687489 + index,
+                "chrstop": 7668401 + index,
+            }
+        ],
+    }
+    # Round-trip through JSON so strings are fresh objects, as after decoding
+    return json.loads(
+        json.dumps(
+            {
+                "gene_id": f"GENE{index}",
+                "species": "human",
+                "uid": str(1000 + index),
+                "info": document,
+                "source": "NCBI Gene",
+            }
+        )
+    )
+
+
+def measure(codec, genes: int) -> float:
+    """Return traced bytes per cached gene for a codec."""
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+
+    cache = ResultCache(max_size=genes, codec=codec)
+    for i in range(genes):
+        cache.set(f"gene:{i}", make_gene_result(i))
+
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot.compare_to(baseline, "filename")
+    return sum(stat.size_diff for stat in stats) / genes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--genes", type=int, default=5000)
+    args = parser.parse_args()
+
+    codecs = [
+        ("plain dicts", IdentityCodec()),
+        ("compact records", CompactRecordCodec()),
+        ("zlib", CompressedCodec("zlib")),
+        ("lzma", CompressedCodec("lzma")),
+        ("content-addressed", ContentAddressedCodec()),
+    ]
+
+    print(f"genes cached: {args.genes}")
+    plain = None
+    for name, codec in codecs:
+        bytes_per_gene = measure(codec, args.genes)
+        plain = plain or bytes_per_gene
+        print(
+            f"{name:<18} {bytes_per_gene:8.0f} bytes/gene "
+            f"({plain / bytes_per_gene:4.1f}x vs plain)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON decoding and encoding with the available codecs.
+
+Decodes a synthetic esummary response and encodes the cached gene results
+with each installed JSON codec, reporting the best time of several rounds.
+Codecs that are not installed fall back to the standard library and are
+skipped.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--genes N] [--rounds N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_cache_memory import make_gene_result
+
+from genome_mcp.core import get_json_codec
+from genome_mcp.core.json_codec import JSON_CODECS
+
+
+def best_time(func, rounds: int) -> float:
+    """Return the best wall time of a function over several rounds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--genes", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    results = [make_gene_result(i) for i in range(args.genes)]
+    esummary = {
+        "header": {"type": "esummary", "version": "0.3"},
+        "result": {
+            "uids": [result["uid"] for result in results],
+            **{result["uid"]: result["info"] for result in results},
+        },
+    }
+    body = get_json_codec("json").dumps(esummary)
+
+    print(f"esummary response: {args.genes} genes, {len(body) / 1024:.0f} KiB")
+    baseline = None
+    for name in reversed(JSON_CODECS):
+        codec = get_json_codec(name)
+        if codec.name != name:
+            print(f"{name:<8} not installed")
+            continue
+
+        decode = best_time(lambda: codec.loads(body), args.rounds)
+        encode = best_time(
+            lambda: [codec.dumps(result) for result in results], args.rounds
+        )
+        keys = best_time(
+            lambda: [codec.dumps(result, sort_keys=True) for result in results],
+            args.rounds,
+        )
+        baseline = baseline or decode + encode
+        print(
+            f"{name:<8} decode {decode * 1000:7.2f} ms  "
+            f"encode {encode * 1000:7.2f} ms  "
+            f"sorted {keys * 1000:7.2f} ms  "
+            f"({baseline / (decode + encode):4.1f}x vs json)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ from .exceptions import (
     RateLimitError,
     ResourceError,
     ServerError,
+    ServerOverloadedError,
     TimeoutError,
     ValidationError,
     create_error_from_exception,
@@ -61,6 +62,7 @@ __all__ = [
     "BatchProcessingError",
     "QuerySyntaxError",
     "ServerError",
+    "ServerOverloadedError",
     "DatabaseError",
     "create_error_from_exception",
 ]
@@ -7,12 +7,15 @@ including environment-based configuration, validation, and settings management.
 
 import json
 import os
+import warnings
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from genome_mcp.core.json_codec import json_codec
 
 
 class LogLevel(str, Enum):
@@ -40,7 +43,133 @@ class CacheConfig(BaseModel):
     enabled: bool = Field(True, description="Enable caching")
     ttl: int = Field(3600, ge=60, le=86400, description="Cache TTL in seconds")
     max_size: int = Field(1000, ge=100, le=10000, description="Maximum cache entries")
-    backend: str = Field("memory", description="Cache backend (memory, redis, file)")
+    backend: str = Field(
+        "memory",
+        description="Cache backend (memory, or tiered for memory in front of disk; "
+        "the deprecated redis and file backends mean memory)",
+    )
+    admission_policy: str = Field(
+        "none",
+        description="Admission policy of a full cache (none, or tinylfu to keep "
+        "one-off keys from evicting frequently requested results)",
+    )
+    compact_records: bool = Field(
+        False,
+        description="Store cached results as compact records with interned strings",
+    )
+    dedup: bool = Field(
+        False,
+        description="Store each distinct document once, shared by all cached "
+        "results containing it (not combined with compression or compact records)",
+    )
+    raw_responses: bool = Field(
+        False,
+        description="Cache raw upstream response bodies and decode them on read",
+    )
+    raw_decoded_entries: int = Field(
+        64,
+        ge=0,
+        description="Decoded documents of the most recently read raw responses "
+        "kept to serve repeated reads without decoding",
+    )
+    compression: str = Field(
+        "none",
+        description="Store cached results as compressed bytes (none, zlib, lzma, zstd)",
+    )
+    compression_level: int = Field(6, ge=1, le=22, description="Compression level")
+    disk_path: str = Field(
+        "~/.genome_mcp/cache.sqlite3", description="Disk tier database file"
+    )
+    disk_max_entries: int = Field(
+        1_000_000, ge=1000, description="Maximum entries in the disk tier"
+    )
+    snapshot_path: Optional[str] = Field(
+        None,
+        description="Cache snapshot file loaded at startup and saved at shutdown",
+    )
+    region_index_max_genes: int = Field(
+        20000,
+        ge=0,
+        description="Maximum genes held to answer region searches inside "
+        "already fetched regions locally (0 disables)",
+    )
+    compression_min_size: int = Field(
+        256,
+        ge=0,
+        description="Serialized size in bytes below which values stay " "uncompressed",
+    )
+
+    operation_ttls: Dict[str, int] = Field(
+        default_factory=lambda: {
+            "get_gene_homologs": 30 * 86400,
+            "batch_gene_homologs": 30 * 86400,
+            "search_genes": 900,
+            "search_by_region": 900,
+            "search_by_region_enhanced": 900,
+        },
+        description="Cache TTL in seconds per server operation (default: ttl)",
+    )
+
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        """Validate cache backend."""
+        if v in ("redis", "file"):
+            # Accepted but never implemented: results were always cached in
+            # memory, which existing configurations keep getting
+            warnings.warn(
+                f"Cache backend '{v}' is deprecated and uses the memory backend; "
+                "use 'memory' or 'tiered'",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            return "memory"
+        if v not in ("memory", "tiered"):
+            raise ValueError("backend must be one of: memory, tiered")
+        return v
+
+    @field_validator("compression")
+    @classmethod
+    def validate_compression(cls, v: str) -> str:
+        """Validate compression algorithm."""
+        if v not in ("none", "zlib", "lzma", "zstd"):
+            raise ValueError("compression must be one of: none, zlib, lzma, zstd")
+        return v
+
+    @field_validator("admission_policy")
+    @classmethod
+    def validate_admission_policy(cls, v: str) -> str:
+        """Validate cache admission policy."""
+        if v not in ("none", "tinylfu"):
+            raise ValueError("admission_policy must be one of: none, tinylfu")
+        return v
+
+    @field_validator("operation_ttls")
+    @classmethod
+    def validate_operation_ttls(cls, v: Dict[str, int]) -> Dict[str, int]:
+        """Validate per-operation TTLs."""
+        for operation, ttl in v.items():
+            if not 0 < ttl <= 365 * 86400:
+                raise ValueError(
+                    f"TTL for '{operation}' must be between 1 second and 365 days"
+                )
+        return v
+
+    @model_validator(mode="after")
+    def validate_codec(self) -> "CacheConfig":
+        """Validate that at most one stored value format is selected."""
+        formats = [
+            name
+            for name, selected in (
+                ("compression", self.compression != "none"),
+                ("dedup", self.dedup),
+                ("compact_records", self.compact_records),
+            )
+            if selected
+        ]
+        if len(formats) > 1:
+            raise ValueError(f"{' and '.join(formats)} cannot be combined")
+        return self
 
 
 class RateLimitConfig(BaseModel):
@@ -56,6 +185,245 @@ class RateLimitConfig(BaseModel):
     burst_size: int = Field(10, ge=1, le=100, description="Burst request limit")
 
 
+class AdmissionConfig(BaseModel):
+    """Admission control and load shedding configuration."""
+
+    enabled: bool = Field(True, description="Enable admission control")
+    max_in_flight: int = Field(
+        32,
+        ge=1,
+        le=1000,
+        description="Maximum concurrently executing requests, split across lanes",
+    )
+    max_queue_size: int = Field(
+        100, ge=0, le=10000, description="Maximum requests waiting for a slot"
+    )
+    max_queue_wait: float = Field(
+        10.0, ge=0.0, le=300.0, description="Maximum seconds to wait for a slot"
+    )
+    lane_max_in_flight: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Maximum in-flight requests per scheduling lane "
+        "(default: max_in_flight split by lane weight)",
+    )
+    overload_mode: str = Field(
+        "reject", description="Overload behaviour (reject, degrade)"
+    )
+
+    @field_validator("overload_mode")
+    @classmethod
+    def validate_overload_mode(cls, v: str) -> str:
+        """Validate overload mode."""
+        if v not in ("reject", "degrade"):
+            raise ValueError("overload_mode must be 'reject' or 'degrade'")
+        return v
+
+    @field_validator("lane_max_in_flight")
+    @classmethod
+    def validate_lane_max_in_flight(cls, v: Dict[str, int]) -> Dict[str, int]:
+        """Validate per-lane in-flight limits."""
+        for lane, limit in v.items():
+            if limit < 1:
+                raise ValueError(f"In-flight limit for lane '{lane}' must be positive")
+        return v
+
+
+class SchedulingConfig(BaseModel):
+    """Priority lane scheduling configuration."""
+
+    enabled: bool = Field(True, description="Enable priority lane scheduling")
+    lane_weights: Dict[str, int] = Field(
+        default_factory=lambda: {"interactive": 4, "bulk": 1},
+        description="Relative share of upstream capacity per lane",
+    )
+    default_lane: str = Field(
+        "interactive", description="Lane used by tools without an explicit lane"
+    )
+    batch_lane: str = Field(
+        "bulk", description="Lane used by items of execute_batch requests"
+    )
+    tool_lanes: Dict[str, str] = Field(
+        default_factory=lambda: {
+            "batch_gene_info": "bulk",
+            "batch_gene_homologs": "bulk",
+        },
+        description="Lane assignment per FastMCP tool / server operation",
+    )
+    client_max_in_flight: int = Field(
+        0,
+        ge=0,
+        le=1000,
+        description="Maximum in-flight requests per client session (0 disables)",
+    )
+    max_tracked_clients: int = Field(
+        1000, ge=1, le=100000, description="Maximum clients kept in statistics"
+    )
+
+    @field_validator("lane_weights")
+    @classmethod
+    def validate_lane_weights(cls, v: Dict[str, int]) -> Dict[str, int]:
+        """Validate lane weights."""
+        if not v:
+            raise ValueError("At least one lane must be configured")
+        for lane, weight in v.items():
+            if weight < 1:
+                raise ValueError(f"Lane weight for '{lane}' must be positive")
+        return v
+
+    @model_validator(mode="after")
+    def validate_lane_names(self) -> "SchedulingConfig":
+        """Validate that referenced lanes are configured."""
+        lanes = [self.default_lane, self.batch_lane, *self.tool_lanes.values()]
+        for lane in lanes:
+            if lane not in self.lane_weights:
+                raise ValueError(f"Unknown scheduling lane: {lane}")
+        return self
+
+
+class JobsConfig(BaseModel):
+    """Background batch job configuration."""
+
+    enabled: bool = Field(True, description="Enable background batch jobs")
+    checkpoint_dir: str = Field(
+        "~/.genome_mcp/jobs", description="Directory for job checkpoints"
+    )
+    chunk_size: int = Field(
+        50, ge=1, le=500, description="Genes processed per checkpointed chunk"
+    )
+    max_concurrent_jobs: int = Field(
+        2, ge=1, le=32, description="Maximum jobs running at the same time"
+    )
+    page_size: int = Field(
+        100, ge=1, le=1000, description="Default number of results per page"
+    )
+
+
+class BulkConfig(BaseModel):
+    """Bulk file processing configuration."""
+
+    base_dir: Optional[str] = Field(
+        None,
+        description="Directory the process_gene_file tool may read and write "
+        "files in (unset: bulk files can only be processed from the command line)",
+    )
+
+
+class MemoryConfig(BaseModel):
+    """Memory pressure configuration."""
+
+    max_rss_mb: int = Field(
+        0,
+        ge=0,
+        description="Process RSS ceiling in MiB that caches shrink under "
+        "(0 disables)",
+    )
+    high_watermark: float = Field(
+        0.9,
+        gt=0.0,
+        le=1.0,
+        description="Fraction of the ceiling from which caches are shrunk",
+    )
+    low_watermark: float = Field(
+        0.8,
+        gt=0.0,
+        le=1.0,
+        description="Fraction of the ceiling below which memory pressure has "
+        "passed and shrinking backs off no longer",
+    )
+    shrink_fraction: float = Field(
+        0.25, gt=0.0, le=1.0, description="Fraction of cache entries evicted per shrink"
+    )
+    min_entries: int = Field(
+        100, ge=0, description="Entries every cache keeps under memory pressure"
+    )
+    check_interval: float = Field(
+        1.0, gt=0.0, le=60.0, description="Seconds between memory checks"
+    )
+    max_backoff: float = Field(
+        60.0,
+        gt=0.0,
+        le=3600.0,
+        description="Maximum seconds between shrinks while memory stays high",
+    )
+
+    @model_validator(mode="after")
+    def validate_watermarks(self) -> "MemoryConfig":
+        """Validate that the low watermark is not above the high watermark."""
+        if self.low_watermark > self.high_watermark:
+            raise ValueError("low_watermark must not exceed high_watermark")
+        return self
+
+
+class WarmerConfig(BaseModel):
+    """Startup cache warming configuration."""
+
+    enabled: bool = Field(False, description="Warm the result cache at startup")
+    genes: List[str] = Field(
+        default_factory=list, description="Gene panel to fetch at startup"
+    )
+    panel_file: Optional[str] = Field(
+        None,
+        description="File with one gene ID per line (first tab-separated column; "
+        "# starts a comment), added to genes",
+    )
+    species: str = Field("human", description="Species of the gene panel")
+    operations: List[str] = Field(
+        default_factory=lambda: ["get_gene_info", "get_gene_homologs"],
+        description="Per-gene operations whose results are cached",
+    )
+    lane: Optional[str] = Field(
+        None, description="Scheduling lane for warming requests (default: batch lane)"
+    )
+    chunk_size: int = Field(
+        50, ge=1, le=500, description="Requests executed per batch chunk"
+    )
+    max_concurrency: int = Field(
+        2,
+        ge=1,
+        le=64,
+        description="Warming requests executed at the same time, leaving the "
+        "other slots of their lane to clients",
+    )
+
+    @field_validator("operations")
+    @classmethod
+    def validate_operations(cls, v: List[str]) -> List[str]:
+        """Validate warmed operations."""
+        if not v:
+            raise ValueError("At least one operation must be warmed")
+        return v
+
+
+class ParsingConfig(BaseModel):
+    """Response parsing configuration."""
+
+    offload_threshold: int = Field(
+        256 * 1024,
+        ge=1024,
+        description="Response size in bytes from which parsing leaves the event loop",
+    )
+    executor: str = Field(
+        "thread", description="Parsing worker pool (thread, process, none)"
+    )
+    max_workers: int = Field(
+        2, ge=1, le=32, description="Maximum parsing worker threads or processes"
+    )
+    loop_lag_interval: float = Field(
+        0.5,
+        ge=0.0,
+        le=60.0,
+        description="Seconds between event loop lag samples (0 disables)",
+    )
+
+    @field_validator("executor")
+    @classmethod
+    def validate_executor(cls, v: str) -> str:
+        """Validate parsing executor."""
+        if v not in ("thread", "process", "none"):
+            raise ValueError("executor must be one of: thread, process, none")
+        return v
+
+
 class APIConfig(BaseModel):
     """API endpoint configurations."""
 
@@ -112,6 +480,11 @@ class ServerConfig(BaseModel):
     debug: bool = Field(False, description="Enable debug mode")
     cors_enabled: bool = Field(True, description="Enable CORS")
     cors_origins: List[str] = Field(["*"], description="Allowed CORS origins")
+    admin_tools: bool = Field(
+        False,
+        description="Expose cache administration tools (snapshots, invalidation) "
+        "to MCP clients",
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -145,6 +518,13 @@ class GenomeMCPConfig(BaseModel):
     # Component configurations
     cache: CacheConfig = Field(default_factory=CacheConfig)
     rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+    scheduling: SchedulingConfig = Field(default_factory=SchedulingConfig)
+    jobs: JobsConfig = Field(default_factory=JobsConfig)
+    bulk: BulkConfig = Field(default_factory=BulkConfig)
+    parsing: ParsingConfig = Field(default_factory=ParsingConfig)
+    warmer: WarmerConfig = Field(default_factory=WarmerConfig)
+    memory: MemoryConfig = Field(default_factory=MemoryConfig)
     api: APIConfig = Field(default_factory=APIConfig)
     data_sources: DataSourceConfig = Field(default_factory=DataSourceConfig)
     server: ServerConfig = Field(default_factory=ServerConfig)
@@ -206,7 +586,7 @@ class ConfigManager:
                     if self.config_file.suffix.lower() in [".yaml", ".yml"]:
                         file_config = yaml.safe_load(f)
                     elif self.config_file.suffix.lower() == ".json":
-                        file_config = json.load(f)
+                        file_config = json_codec.loads(f.read())
                     else:
                         raise ValueError(
                             f"Unsupported config file format: {self.config_file.suffix}"
@@ -248,12 +628,36 @@ class ConfigManager:
             "LOG_FILE": "logging.file_path",
             "SERVER_HOST": "server.host",
             "SERVER_PORT": "server.port",
+            "SERVER_ADMIN_TOOLS": "server.admin_tools",
             "CACHE_ENABLED": "cache.enabled",
             "CACHE_TTL": "cache.ttl",
             "CACHE_MAX_SIZE": "cache.max_size",
+            "CACHE_COMPRESSION": "cache.compression",
+            "CACHE_RAW_RESPONSES": "cache.raw_responses",
+            "CACHE_COMPACT_RECORDS": "cache.compact_records",
+            "CACHE_DEDUP": "cache.dedup",
+            "CACHE_BACKEND": "cache.backend",
+            "CACHE_DISK_PATH": "cache.disk_path",
+            "CACHE_ADMISSION_POLICY": "cache.admission_policy",
+            "CACHE_SNAPSHOT_PATH": "cache.snapshot_path",
+            "CACHE_REGION_INDEX_MAX_GENES": "cache.region_index_max_genes",
             "RATE_LIMIT_ENABLED": "rate_limit.enabled",
             "RATE_LIMIT_RPM": "rate_limit.requests_per_minute",
             "RATE_LIMIT_RPH": "rate_limit.requests_per_hour",
+            "ADMISSION_ENABLED": "admission.enabled",
+            "ADMISSION_MAX_IN_FLIGHT": "admission.max_in_flight",
+            "ADMISSION_MAX_QUEUE_WAIT": "admission.max_queue_wait",
+            "ADMISSION_OVERLOAD_MODE": "admission.overload_mode",
+            "CLIENT_MAX_IN_FLIGHT": "scheduling.client_max_in_flight",
+            "JOBS_ENABLED": "jobs.enabled",
+            "JOBS_CHECKPOINT_DIR": "jobs.checkpoint_dir",
+            "BULK_BASE_DIR": "bulk.base_dir",
+            "PARSE_OFFLOAD_THRESHOLD": "parsing.offload_threshold",
+            "PARSE_EXECUTOR": "parsing.executor",
+            "WARMER_ENABLED": "warmer.enabled",
+            "WARMER_PANEL_FILE": "warmer.panel_file",
+            "WARMER_SPECIES": "warmer.species",
+            "MEMORY_MAX_RSS_MB": "memory.max_rss_mb",
             "API_TIMEOUT": "api.timeout",
             "API_RETRY_ATTEMPTS": "api.retry_attempts",
             "NCBI_API_KEY": "data_sources.ncbi.api_key",
@@ -4,19 +4,30 @@ Core functionality module for Genome MCP.
 This module contains core utility functions for caching, formatting, and async operations.
 """
 
-from .async_utils import async_timeout, log_execution_time, retry_async
+from .async_utils import (
+    async_timeout,
+    log_execution_time,
+    pipeline_chunks,
+    retry_async,
+)
+from .cache_snapshot import load_snapshot, save_snapshot
 from .caching import (
     calculate_similarity,
+    canonical_cache_key,
+    canonicalize_params,
     chunk_list,
     ensure_directory,
     flatten_list,
     generate_cache_key,
+    iter_chunks,
     memory_usage,
     merge_dictionaries,
     normalize_dict,
     safe_get_nested,
     validate_required_fields,
 )
+from .dedup import ContentAddressedCodec
+from .disk_cache import DiskCache, TieredResultCache
 from .formatting import (
     format_duration,
     format_file_size,
@@ -24,14 +35,33 @@ from .formatting import (
     sanitize_filename,
     truncate_string,
 )
+from .json_codec import JSONCodec, get_json_codec, json_codec
+from .memory_monitor import MemoryPressureMonitor, Shrinkable
+from .offload import LoopLagMonitor, ParseOffloader
+from .progress import ProgressCallback, ProgressTracker, progress_reporting
+from .records import CompactRecordCodec, GeneRecord, intern_value
+from .region_index import RegionIndex
+from .response_cache import ResponseCache
+from .result_cache import (
+    AdmissionPolicy,
+    CompressedCodec,
+    IdentityCodec,
+    ResultCache,
+    ValueCodec,
+)
+from .scheduling import AdmissionController, PriorityScheduler
+from .tinylfu import CountMinSketch, TinyLFU
 
 __all__ = [
     # Caching utilities
     "generate_cache_key",
+    "canonical_cache_key",
+    "canonicalize_params",
     "ensure_directory",
     "merge_dictionaries",
     "flatten_list",
     "chunk_list",
+    "iter_chunks",
     "validate_required_fields",
     "normalize_dict",
     "safe_get_nested",
@@ -43,8 +73,43 @@ __all__ = [
     "get_timestamp",
     "sanitize_filename",
     "truncate_string",
+    # JSON codec
+    "JSONCodec",
+    "get_json_codec",
+    "json_codec",
+    # Offloading utilities
+    "ParseOffloader",
+    "LoopLagMonitor",
+    "MemoryPressureMonitor",
+    "Shrinkable",
+    # Progress utilities
+    "ProgressCallback",
+    "ProgressTracker",
+    "progress_reporting",
+    # Result cache
+    "ResultCache",
+    "ValueCodec",
+    "IdentityCodec",
+    "CompactRecordCodec",
+    "CompressedCodec",
+    "ContentAddressedCodec",
+    "GeneRecord",
+    "DiskCache",
+    "TieredResultCache",
+    "AdmissionPolicy",
+    "TinyLFU",
+    "CountMinSketch",
+    "save_snapshot",
+    "load_snapshot",
+    "RegionIndex",
+    "ResponseCache",
+    "intern_value",
+    # Scheduling utilities
+    "AdmissionController",
+    "PriorityScheduler",
     # Async utilities
     "retry_async",
     "async_timeout",
     "log_execution_time",
+    "pipeline_chunks",
 ]
@@ -5,7 +5,17 @@ This module provides async decorators and utility functions.
 """
 
 import asyncio
-from typing import Any, Callable, Optional
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+)
 
 from genome_mcp.exceptions import TimeoutError
 
@@ -117,3 +127,36 @@ def log_execution_time(func_name: Optional[str] = None) -> Callable:
             return sync_wrapper
 
     return decorator
+
+
+async def pipeline_chunks(
+    chunks: Iterable[List[Any]],
+    worker: Callable[[List[Any]], Awaitable[Any]],
+    prefetch: int = 1,
+) -> AsyncIterator[Any]:
+    """
+    Process chunks in order, overlapping work on upcoming chunks.
+
+    Up to ``prefetch`` chunks beyond the one being consumed are processed in
+    the background, so at most ``prefetch + 1`` chunks are held in memory.
+
+    Args:
+        chunks: Iterable of chunks (consumed lazily)
+        worker: Async function processing one chunk
+        prefetch: Number of chunks to process ahead of the consumer
+
+    Yields:
+        Worker results in chunk order
+    """
+    pending: Deque[asyncio.Future] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(asyncio.ensure_future(worker(chunk)))
+            if len(pending) > prefetch:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,139 @@
+"""
+Result cache snapshots for Genome MCP.
+
+A snapshot is a gzip-compressed file of JSON lines: a header line followed by
+one ``[key, expires, tags, result]`` array per fresh cache entry. Snapshots
+are written and read one entry at a time, so saving or loading a large cache
+never holds a second copy of it in memory. Loading a snapshot at startup lets
+a freshly deployed server answer from a warm cache instead of refilling it
+against rate-limited upstream APIs.
+"""
+
+import gzip
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import structlog
+
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.core.result_cache import ResultCache
+from genome_mcp.exceptions import DataFormatError
+
+logger = structlog.get_logger(__name__)
+
+SNAPSHOT_FORMAT = "genome-mcp-cache-snapshot"
+SNAPSHOT_VERSION = 1
+
+
+def save_snapshot(
+    cache: ResultCache, path: Union[str, Path], compress_level: int = 6
+) -> Dict[str, Any]:
+    """
+    Write the fresh entries of a cache to a snapshot file.
+
+    The snapshot is written to a temporary file that replaces ``path`` once
+    complete, so an interrupted save never leaves a truncated snapshot.
+    Entries are written least recently used first, so restoring them into a
+    smaller cache keeps the most recently used ones.
+
+    Args:
+        cache: Cache to snapshot
+        path: Snapshot file
+        compress_level: gzip compression level
+
+    Returns:
+        Snapshot path, number of entries and file size
+    """
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    start_time = time.time()
+
+    entries = 0
+    try:
+        with gzip.open(temp_path, "wb", compresslevel=compress_level) as f:
+            header = {
+                "format": SNAPSHOT_FORMAT,
+                "version": SNAPSHOT_VERSION,
+                "created": start_time,
+            }
+            f.write(json_codec.dumps(header) + b"\n")
+            for key, data, expires, tags in cache.iter_entries():
+                f.write(json_codec.dumps([key, expires, list(tags), data]) + b"\n")
+                entries += 1
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+    summary = {
+        "path": str(path),
+        "entries": entries,
+        "size_bytes": path.stat().st_size,
+        "elapsed": round(time.time() - start_time, 3),
+    }
+    logger.info("Cache snapshot saved", **summary)
+    return summary
+
+
+def load_snapshot(cache: ResultCache, path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Restore cache entries from a snapshot file.
+
+    Entries that expired since the snapshot was taken are skipped; the others
+    keep their original expiry time.
+
+    Args:
+        cache: Cache to restore entries into
+        path: Snapshot file
+
+    Returns:
+        Snapshot path and the numbers of restored and expired entries
+
+    Raises:
+        DataFormatError: If the file is not a valid snapshot
+    """
+    path = Path(path).expanduser()
+    start_time = time.time()
+    restored = 0
+    expired = 0
+    line_number = 1
+
+    try:
+        with gzip.open(path, "rb") as f:
+            header = json_codec.loads(f.readline() or b"null")
+            if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+                raise DataFormatError(
+                    f"Not a cache snapshot: {path}", expected_format=SNAPSHOT_FORMAT
+                )
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise DataFormatError(
+                    f"Unsupported cache snapshot version: {header.get('version')}",
+                    expected_format=f"{SNAPSHOT_FORMAT} v{SNAPSHOT_VERSION}",
+                )
+
+            for line_number, line in enumerate(f, start=2):
+                key, expires, tags, data = json_codec.loads(line)
+                if expires <= start_time:
+                    expired += 1
+                    continue
+                cache.restore(key, data, expires, tags)
+                restored += 1
+    except (OSError, EOFError, zlib.error, ValueError, TypeError) as e:
+        if isinstance(e, FileNotFoundError):
+            raise
+        raise DataFormatError(
+            f"Invalid cache snapshot {path} at line {line_number}: {e}",
+            expected_format=SNAPSHOT_FORMAT,
+        ) from e
+
+    summary = {
+        "path": str(path),
+        "restored": restored,
+        "expired": expired,
+        "elapsed": round(time.time() - start_time, 3),
+    }
+    logger.info("Cache snapshot loaded", **summary)
+    return summary
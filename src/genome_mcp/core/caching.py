@@ -6,14 +6,20 @@ and common operations.
 """
 
 import hashlib
-import json
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
+from genome_mcp.core.json_codec import json_codec
 from genome_mcp.exceptions import ValidationError
 
 
+def _digest(data: bytes) -> str:
+    """Hash serialized key data to a short hex digest."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 def generate_cache_key(prefix: str, *args: Any, **kwargs: Any) -> str:
     """
     Generate consistent cache key from arguments.
@@ -29,13 +35,73 @@ def generate_cache_key(prefix: str, *args: Any, **kwargs: Any) -> str:
     # Create a dictionary with all arguments
     key_data = {"args": args, "kwargs": kwargs}
 
-    # Convert to JSON string for consistent hashing
-    key_json = json.dumps(key_data, sort_keys=True, default=str)
+    # Convert to JSON for consistent hashing
+    key_json = json_codec.dumps(key_data, sort_keys=True)
+
+    return f"{prefix}:{_digest(key_json)}"
+
+
+def canonicalize_params(
+    params: Dict[str, Any],
+    defaults: Optional[Dict[str, Any]] = None,
+    normalizers: Optional[Dict[str, Callable[[Any], Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Reduce request parameters to a canonical form.
+
+    Args:
+        params: Request parameters
+        defaults: Default value of each optional parameter
+        normalizers: Function normalizing the value of each parameter
+            (e.g. symbol case or species aliases)
 
-    # Generate hash
-    key_hash = hashlib.md5(key_json.encode()).hexdigest()
+    Returns:
+        Normalized parameters without None values and without parameters
+        equal to their default
+    """
+    defaults = defaults or {}
+    normalizers = normalizers or {}
+
+    canonical = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        normalize = normalizers.get(key)
+        if normalize is not None:
+            value = normalize(value)
+        if key in defaults:
+            default = defaults[key]
+            if normalize is not None and default is not None:
+                default = normalize(default)
+            if value == default:
+                continue
+        canonical[key] = value
+    return canonical
+
+
+def canonical_cache_key(
+    prefix: str,
+    params: Dict[str, Any],
+    defaults: Optional[Dict[str, Any]] = None,
+    normalizers: Optional[Dict[str, Callable[[Any], Any]]] = None,
+) -> str:
+    """
+    Generate a cache key from canonical request parameters.
+
+    Requests that differ only in spelling (see canonicalize_params) get the
+    same key.
+
+    Args:
+        prefix: Key prefix for categorization
+        params: Request parameters
+        defaults: Default value of each optional parameter
+        normalizers: Function normalizing the value of each parameter
 
-    return f"{prefix}:{key_hash}"
+    Returns:
+        Cache key string
+    """
+    canonical = canonicalize_params(params, defaults, normalizers)
+    return f"{prefix}:{_digest(json_codec.dumps(canonical, sort_keys=True))}"
 
 
 def format_duration(seconds: float) -> str:
@@ -198,6 +264,31 @@ def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
     return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Lazily split an iterable into chunks of specified size.
+
+    Unlike chunk_list, only one chunk is materialized at a time, so this works
+    with generators and inputs of arbitrary size.
+
+    Args:
+        items: Iterable to chunk
+        chunk_size: Size of each chunk
+
+    Yields:
+        Lists of at most chunk_size items
+    """
+    if chunk_size <= 0:
+        raise ValidationError("Chunk size must be positive")
+
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -> None:
     """
     Validate that required fields are present in data dictionary.
@@ -0,0 +1,190 @@
+"""
+Content-addressed cache values for Genome MCP.
+
+The same gene document ends up in the cache several times: in get_gene_info
+results with and without a summary, in batch results, and in the results of
+region searches made through different tools. This module stores the parts
+of cached results by the hash of their content, so every distinct document
+is held once no matter how many cache entries refer to it.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.core.records import intern_value
+
+
+class ContentRef:
+    """Reference to a stored document by content digest."""
+
+    __slots__ = ("digest", "size")
+
+    def __init__(self, digest: bytes, size: int):
+        self.digest = digest
+        self.size = size
+
+
+class _StoredNode:
+    """A stored document, its reference count and the references it holds."""
+
+    __slots__ = ("value", "children", "refcount", "own_size")
+
+    def __init__(self, value: Any, children: List[ContentRef], own_size: int):
+        self.value = value
+        self.children = children
+        self.refcount = 1
+        self.own_size = own_size
+
+
+class ContentAddressedCodec:
+    """Cache codec storing each distinct document once.
+
+    Every dictionary or list in a result whose canonical JSON is at least
+    ``min_size`` bytes is stored under a digest of its content and replaced
+    by a reference; smaller values stay inline with interned strings.
+    Digests are computed bottom-up: a document is hashed over its scalars
+    and the digests of its child documents, so encoding serializes every
+    scalar once however deeply documents are nested. Documents are
+    reference counted and dropped when the last cache entry using them is
+    removed, which the cache reports through ``release``.
+    """
+
+    def __init__(self, min_size: int = 256):
+        """
+        Initialize content-addressed codec.
+
+        Args:
+            min_size: Serialized size from which documents are shared
+        """
+        self.min_size = min_size
+        self._nodes: Dict[bytes, _StoredNode] = {}
+        self.logical_bytes = 0
+        self.stored_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def encode(self, data: Dict[str, Any]) -> Any:
+        digests: Dict[int, Tuple[bytes, int]] = {}
+        if isinstance(data, (dict, list)):
+            self._digest(data, digests)
+        stored = self._encode_value(data, digests)
+        if isinstance(stored, ContentRef):
+            self.logical_bytes += stored.size
+        return stored
+
+    def _digest(
+        self, value: Any, digests: Dict[int, Tuple[bytes, int]]
+    ) -> Tuple[bytes, int]:
+        """Compute the digest and canonical JSON size of a document.
+
+        Child documents are digested first and recorded in ``digests`` by
+        object id; the document is hashed over its scalars and their digests.
+
+        Returns:
+            Digest and size in bytes of the document
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        if isinstance(value, dict):
+            hasher.update(b"{")
+            size = 2
+            for key in sorted(value):
+                key_json = json_codec.dumps(key)
+                hasher.update(key_json + b":")
+                size += len(key_json) + 1
+                size += self._digest_item(value[key], hasher, digests)
+        else:
+            hasher.update(b"[")
+            size = 2
+            for item in value:
+                size += self._digest_item(item, hasher, digests)
+        # Separators between items
+        size += max(len(value) - 1, 0)
+
+        result = (hasher.digest(), size)
+        digests[id(value)] = result
+        return result
+
+    def _digest_item(
+        self, item: Any, hasher: Any, digests: Dict[int, Tuple[bytes, int]]
+    ) -> int:
+        """Add a document item to its parent's hash; returns the item size."""
+        if isinstance(item, (dict, list)):
+            digest, size = self._digest(item, digests)
+            hasher.update(b"#" + digest + b",")
+            return size
+        payload = json_codec.dumps(item)
+        hasher.update(payload + b",")
+        return len(payload)
+
+    def _encode_value(self, value: Any, digests: Dict[int, Tuple[bytes, int]]) -> Any:
+        """Replace large documents in a value by references, top-down."""
+        if not isinstance(value, (dict, list)):
+            return intern_value(value)
+
+        digest, size = digests[id(value)]
+        if size < self.min_size:
+            return intern_value(value)
+
+        ref = ContentRef(digest, size)
+        node = self._nodes.get(digest)
+        if node is not None:
+            node.refcount += 1
+            return ref
+
+        if isinstance(value, dict):
+            stored: Any = {
+                intern_value(key): self._encode_value(item, digests)
+                for key, item in value.items()
+            }
+            items = stored.values()
+        else:
+            stored = [self._encode_value(item, digests) for item in value]
+            items = stored
+        children = [item for item in items if isinstance(item, ContentRef)]
+
+        own_size = size - sum(child.size for child in children)
+        self._nodes[digest] = _StoredNode(stored, children, own_size)
+        self.stored_bytes += own_size
+        return ref
+
+    def decode(self, stored: Any) -> Dict[str, Any]:
+        if isinstance(stored, ContentRef):
+            stored = self._nodes[stored.digest].value
+        if isinstance(stored, dict):
+            return {key: self.decode(item) for key, item in stored.items()}
+        if isinstance(stored, list):
+            return [self.decode(item) for item in stored]  # type: ignore[return-value]
+        return cast(Dict[str, Any], stored)
+
+    def release(self, stored: Any) -> None:
+        """Drop a cache entry's references to its documents."""
+        if isinstance(stored, ContentRef):
+            self.logical_bytes -= stored.size
+            self._release_ref(stored)
+
+    def _release_ref(self, ref: ContentRef) -> None:
+        """Drop one reference, removing documents no longer referenced."""
+        pending = [ref]
+        while pending:
+            digest = pending.pop().digest
+            node = self._nodes[digest]
+            node.refcount -= 1
+            if node.refcount == 0:
+                del self._nodes[digest]
+                self.stored_bytes -= node.own_size
+                pending.extend(node.children)
+
+    def get_stats(self) -> Dict[str, Optional[float]]:
+        """Get deduplication statistics."""
+        return {
+            "documents": len(self._nodes),
+            "logical_bytes": self.logical_bytes,
+            "stored_bytes": self.stored_bytes,
+            "dedup_ratio": (
+                round(self.logical_bytes / self.stored_bytes, 3)
+                if self.stored_bytes
+                else None
+            ),
+        }
@@ -0,0 +1,544 @@
+"""
+Disk cache tier for Genome MCP.
+
+This module provides an SQLite-backed result store and a two-tier cache that
+keeps a small in-memory LRU (L1) in front of it (L2). Entries evicted from L1
+are demoted to disk and promoted back to memory when they are requested
+again, so far more results stay available than fit in memory while hot
+results are served at memory latency.
+"""
+
+import asyncio
+import sqlite3
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+import structlog
+
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.core.result_cache import (
+    AdmissionPolicy,
+    CacheEntry,
+    ResultCache,
+    ValueCodec,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Upper bound for key range scans by prefix
+_MAX_CHAR = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    compressed INTEGER NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entry_tags_key ON entry_tags (key);
+"""
+
+
+class DiskCache:
+    """SQLite store of cached results with expiry times and tags.
+
+    Values are stored as JSON, zlib-compressed above ``compress_min_size``
+    bytes. When the store grows beyond ``max_entries``, expired entries are
+    removed first, then the entries closest to expiry.
+    """
+
+    # Writes between capacity checks
+    TRIM_INTERVAL = 1000
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 1_000_000,
+        compress_min_size: int = 256,
+    ):
+        """
+        Initialize disk cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            max_entries: Maximum number of stored entries
+            compress_min_size: Serialized size from which values are compressed
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.compress_min_size = compress_min_size
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        count: int = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return count
+
+    def __contains__(self, key: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,))
+        return row.fetchone() is not None
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], float, Tuple[str, ...]]]:
+        """
+        Get a stored result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Result, expiry time and tags, or None if missing
+        """
+        row = self._conn.execute(
+            "SELECT value, compressed, expires FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        value, compressed, expires = row
+        return self._decode(value, compressed), expires, self._tags_of(key)
+
+    def iter_entries(
+        self,
+    ) -> Iterator[Tuple[str, Dict[str, Any], float, Tuple[str, ...]]]:
+        """
+        Iterate over fresh entries, soonest to expire first.
+
+        Rows are read from a cursor one at a time, so the store is never
+        loaded into memory as a whole.
+
+        Yields:
+            Key, result, expiry time and tags of each entry
+        """
+        cursor = self._conn.execute(
+            "SELECT key, value, compressed, expires FROM entries "
+            "WHERE expires > ? ORDER BY expires",
+            (time.time(),),
+        )
+        for key, value, compressed, expires in cursor:
+            yield key, self._decode(value, compressed), expires, self._tags_of(key)
+
+    @staticmethod
+    def _decode(value: bytes, compressed: int) -> Dict[str, Any]:
+        """Decode a stored value."""
+        if compressed:
+            value = zlib.decompress(value)
+        return cast(Dict[str, Any], json_codec.loads(value))
+
+    def _tags_of(self, key: str) -> Tuple[str, ...]:
+        """Get the tags of an entry."""
+        return tuple(
+            tag
+            for (tag,) in self._conn.execute(
+                "SELECT tag FROM entry_tags WHERE key = ?", (key,)
+            )
+        )
+
+    def put(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        expires: float,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Store a result, replacing any previous value.
+
+        Args:
+            key: Cache key
+            data: Result to store
+            expires: Expiry time (epoch seconds)
+            tags: Invalidation tags
+        """
+        self.put_many([(key, data, expires, tuple(tags))])
+
+    def put_many(
+        self, items: Iterable[Tuple[str, Dict[str, Any], float, Tuple[str, ...]]]
+    ) -> None:
+        """Store several results in one transaction."""
+        count = 0
+        with self._conn:
+            for key, data, expires, tags in items:
+                value = json_codec.dumps(data)
+                compressed = len(value) >= self.compress_min_size
+                if compressed:
+                    value = zlib.compress(value)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (key, value, int(compressed), expires),
+                )
+                self._conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entry_tags VALUES (?, ?)",
+                    [(tag, key) for tag in tags],
+                )
+                count += 1
+
+        previous_writes = self._writes
+        self._writes += count
+        if self._writes // self.TRIM_INTERVAL != previous_writes // self.TRIM_INTERVAL:
+            self.trim()
+
+    def _delete_keys(self, keys: List[str]) -> None:
+        """Delete entries and their tags."""
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+            )
+            self._conn.executemany(
+                "DELETE FROM entry_tags WHERE key = ?", [(key,) for key in keys]
+            )
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry; returns whether it existed."""
+        existed = key in self
+        if existed:
+            self._delete_keys([key])
+        return existed
+
+    def invalidate(
+        self, prefix: Optional[str] = None, tags: Iterable[str] = ()
+    ) -> Set[str]:
+        """
+        Remove entries by key prefix and/or tag.
+
+        Args:
+            prefix: Only remove entries whose key starts with this prefix
+            tags: Only remove entries carrying at least one of these tags
+
+        Returns:
+            Removed keys
+        """
+        tags = list(tags)
+        if tags:
+            placeholders = ",".join("?" * len(tags))
+            keys = {
+                key
+                for (key,) in self._conn.execute(
+                    f"SELECT key FROM entry_tags WHERE tag IN ({placeholders})", tags
+                )
+            }
+            if prefix is not None:
+                keys = {key for key in keys if key.startswith(prefix)}
+        elif prefix is not None:
+            keys = {
+                key
+                for (key,) in self._conn.execute(
+                    "SELECT key FROM entries WHERE key >= ? AND key < ?",
+                    (prefix, prefix + _MAX_CHAR),
+                )
+            }
+        else:
+            keys = {key for (key,) in self._conn.execute("SELECT key FROM entries")}
+
+        self._delete_keys(list(keys))
+        return keys
+
+    def expire(self, key: Optional[str] = None) -> bool:
+        """Mark one entry, or all entries, as expired without removing them.
+
+        Returns:
+            Whether any entry was marked (False for a missing key)
+        """
+        with self._conn:
+            if key is None:
+                cursor = self._conn.execute("UPDATE entries SET expires = 0")
+            else:
+                cursor = self._conn.execute(
+                    "UPDATE entries SET expires = 0 WHERE key = ?", (key,)
+                )
+        return cursor.rowcount > 0
+
+    def purge_expired(self) -> int:
+        """Remove expired entries; returns the number removed."""
+        keys = [
+            key
+            for (key,) in self._conn.execute(
+                "SELECT key FROM entries WHERE expires < ?", (time.time(),)
+            )
+        ]
+        self._delete_keys(keys)
+        return len(keys)
+
+    def trim(self) -> int:
+        """Shrink the store to ``max_entries``; returns the number removed."""
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return 0
+
+        removed = self.purge_expired()
+        excess -= removed
+        if excess > 0:
+            keys = [
+                key
+                for (key,) in self._conn.execute(
+                    "SELECT key FROM entries ORDER BY expires LIMIT ?", (excess,)
+                )
+            ]
+            self._delete_keys(keys)
+            removed += len(keys)
+
+        logger.debug("Disk cache trimmed", removed=removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._conn:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM entry_tags")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get disk cache statistics."""
+        return {
+            "path": str(self.path),
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "size_bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class TieredResultCache(ResultCache):
+    """Result cache with an in-memory LRU tier (L1) in front of a disk tier (L2).
+
+    Results are written to L1. Entries evicted from L1 while still fresh are
+    demoted to L2, and L1 misses are looked up in L2 and promoted back to L1.
+    L2 keeps its copy of promoted entries, so demoting them again only
+    rewrites the row. Demotions are buffered and written in batches of
+    ``DEMOTION_BATCH`` entries, one transaction per batch. Closing the cache
+    demotes all fresh L1 entries, so the disk tier survives restarts.
+
+    All disk tier operations run in order on one worker thread. Demotion
+    batches are written in the background and ``get_async`` waits for disk
+    reads without blocking the event loop; synchronous methods wait for
+    their own disk operation.
+    """
+
+    # Demoted entries buffered before they are written to disk
+    DEMOTION_BATCH = 64
+
+    def __init__(
+        self,
+        disk: DiskCache,
+        max_size: int = 1000,
+        ttl: float = 3600,
+        codec: Optional[ValueCodec] = None,
+        admission: Optional[AdmissionPolicy] = None,
+        measure_sizes: bool = False,
+    ):
+        """
+        Initialize tiered result cache.
+
+        Args:
+            disk: Disk tier
+            max_size: Maximum number of in-memory entries
+            ttl: Default time to live in seconds
+            codec: Codec for in-memory values
+            admission: Policy deciding which entries enter the memory tier
+                when it is full (rejected entries go to disk)
+            measure_sizes: Record the sizes of in-memory entries for shrinking
+        """
+        super().__init__(
+            max_size=max_size,
+            ttl=ttl,
+            codec=codec,
+            admission=admission,
+            measure_sizes=measure_sizes,
+        )
+        self.disk = disk
+        self.promotions = 0
+        self.demotions = 0
+        self._demoted: Dict[str, Tuple[Dict[str, Any], float, Tuple[str, ...]]] = {}
+        # One worker keeps disk operations in submission order
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+
+    def _disk(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a disk tier operation on the disk thread and wait for it."""
+        return self._io.submit(function, *args).result()
+
+    def __contains__(self, key: str) -> bool:
+        return (
+            super().__contains__(key)
+            or key in self._demoted
+            or self._disk(self.disk.__contains__, key)
+        )
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        if key in self._entries:
+            # L1 holds the newest version; a copy on disk is never fresher
+            return super().get(key, allow_stale=allow_stale)
+
+        if self.admission is not None:
+            self.admission.record(key)
+        stored = self._demoted.pop(key, None) or self._disk(self.disk.get, key)
+        return self._promote(key, stored, allow_stale)
+
+    async def get_async(
+        self, key: str, allow_stale: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        if key in self._entries:
+            return super().get(key, allow_stale=allow_stale)
+
+        if self.admission is not None:
+            self.admission.record(key)
+        stored = self._demoted.pop(key, None)
+        if stored is None:
+            stored = await asyncio.wrap_future(self._io.submit(self.disk.get, key))
+            # The key may have been stored or demoted while the disk was read
+            if key in self._entries:
+                return super().get(key, allow_stale=allow_stale)
+            stored = self._demoted.pop(key, None) or stored
+        return self._promote(key, stored, allow_stale)
+
+    def _promote(
+        self,
+        key: str,
+        stored: Optional[Tuple[Dict[str, Any], float, Tuple[str, ...]]],
+        allow_stale: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Move an entry read from the disk tier to the memory tier."""
+        if stored is None:
+            return None
+        data, expires, tags = stored
+        if not allow_stale and time.time() >= expires:
+            return None
+
+        self.promotions += 1
+        self._store(key, self._make_entry(data, expires, tags))
+        return data
+
+    def iter_entries(
+        self,
+    ) -> Iterator[Tuple[str, Dict[str, Any], float, Tuple[str, ...]]]:
+        """Iterate over fresh entries of both tiers, disk tier first.
+
+        Pending disk writes are completed first; the disk tier is then read
+        on the calling thread.
+        """
+        self._write_demoted()
+        self._disk(lambda: None)
+        for item in self.disk.iter_entries():
+            if item[0] not in self._entries:
+                yield item
+        yield from super().iter_entries()
+
+    def _evicted(self, key: str, entry: CacheEntry) -> None:
+        if entry.expires > time.time():
+            self.demotions += 1
+            self._demoted[key] = (
+                self.codec.decode(entry.value),
+                entry.expires,
+                entry.tags,
+            )
+            if len(self._demoted) >= self.DEMOTION_BATCH:
+                self._write_demoted()
+
+    def _write_demoted(self) -> None:
+        """Write buffered demotions to disk in the background.
+
+        Later disk operations run after the write, so they see its entries.
+        """
+        if self._demoted:
+            items = [(key, *stored) for key, stored in self._demoted.items()]
+            self._demoted.clear()
+            self._io.submit(self.disk.put_many, items).add_done_callback(
+                _log_write_error
+            )
+
+    def delete(self, key: str) -> bool:
+        self._write_demoted()
+        deleted = super().delete(key)
+        return self._disk(self.disk.delete, key) or deleted
+
+    def _invalidate_keys(self, prefix: Optional[str], tags: Iterable[str]) -> Set[str]:
+        self._write_demoted()
+        tags = list(tags)
+        removed: Set[str] = self._disk(self.disk.invalidate, prefix, tags)
+        return super()._invalidate_keys(prefix, tags) | removed
+
+    def expire(self, key: Optional[str] = None) -> bool:
+        self._write_demoted()
+        expired = super().expire(key)
+        on_disk: bool = self._disk(self.disk.expire, key)
+        return expired or on_disk
+
+    def purge_expired(self) -> int:
+        self._write_demoted()
+        removed: int = self._disk(self.disk.purge_expired)
+        return super().purge_expired() + removed
+
+    def clear(self) -> None:
+        super().clear()
+        self._demoted.clear()
+        self._disk(self.disk.clear)
+
+    def flush(self) -> int:
+        """Write all fresh in-memory entries to disk; returns the number written."""
+        self._write_demoted()
+        current_time = time.time()
+        items = [
+            (key, self.codec.decode(entry.value), entry.expires, entry.tags)
+            for key, entry in self._entries.items()
+            if entry.expires > current_time
+        ]
+        self._disk(self.disk.put_many, items)
+        return len(items)
+
+    def close(self) -> None:
+        """Write in-memory entries to disk and close the disk tier."""
+        self.flush()
+        self._disk(self.disk.close)
+        self._io.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats.update(
+            {
+                "promotions": self.promotions,
+                "demotions": self.demotions,
+                "pending_demotions": len(self._demoted),
+                "disk": self._disk(self.disk.get_stats),
+            }
+        )
+        return stats
+
+
+def _log_write_error(future: "Future[None]") -> None:
+    """Log a failed background write to the disk tier."""
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to write demoted cache entries", error=str(error))
@@ -0,0 +1,145 @@
+"""
+JSON codec for Genome MCP.
+
+This module selects the fastest available JSON implementation and exposes it
+behind one interface, so hot paths (HTTP response decoding, cache keys and
+cache serialization) are not tied to a particular library. orjson is used when
+installed, then msgspec, falling back to the standard library ``json``.
+
+All codecs produce the same compact output for JSON-compatible data, so cache
+keys do not depend on which implementation is active. The implementation can
+be forced with the ``GENOME_MCP_JSON_CODEC`` environment variable
+("orjson", "msgspec" or "json").
+"""
+
+import json
+import os
+from typing import Any, Optional, Union
+
+import structlog
+
+from genome_mcp.exceptions import ValidationError
+
+logger = structlog.get_logger(__name__)
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+JSON_CODECS = ("orjson", "msgspec", "json")
+
+
+class JSONCodec:
+    """JSON codec backed by the standard library."""
+
+    name = "json"
+
+    def loads(self, data: JSONInput) -> Any:
+        """Decode JSON from bytes or text."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        """Encode an object as compact UTF-8 JSON.
+
+        Values that are not JSON serializable are encoded as strings.
+        """
+        return json.dumps(
+            obj,
+            sort_keys=sort_keys,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        ).encode()
+
+    def dumps_str(self, obj: Any, sort_keys: bool = False) -> str:
+        """Encode an object as compact JSON text."""
+        return self.dumps(obj, sort_keys=sort_keys).decode()
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        # Datetimes and dataclasses go through default=str like the stdlib codec
+        self._options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        self._sorted_options = self._options | orjson.OPT_SORT_KEYS
+
+    def loads(self, data: JSONInput) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        options = self._sorted_options if sort_keys else self._options
+        try:
+            return self._orjson.dumps(obj, default=str, option=options)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which orjson does not support
+            return super().dumps(obj, sort_keys=sort_keys)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found]
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._sorted_encoder = msgspec.json.Encoder(enc_hook=str, order="sorted")
+
+    def loads(self, data: JSONInput) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        encoder = self._sorted_encoder if sort_keys else self._encoder
+        try:
+            payload: bytes = encoder.encode(obj)
+            return payload
+        except TypeError:
+            return super().dumps(obj, sort_keys=sort_keys)
+
+
+_CODEC_CLASSES = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": JSONCodec}
+
+
+def get_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Get a JSON codec.
+
+    Args:
+        name: Codec name, or None for the fastest installed implementation
+
+    Returns:
+        JSON codec instance
+    """
+    if name is not None:
+        if name not in _CODEC_CLASSES:
+            raise ValidationError(
+                f"Unknown JSON codec: {name}", field_name="codec", field_value=name
+            )
+        try:
+            return _CODEC_CLASSES[name]()
+        except ImportError:
+            logger.warning("JSON codec not installed, using stdlib json", codec=name)
+            return JSONCodec()
+
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+# Process-wide codec used by Genome MCP
+json_codec = get_json_codec(os.getenv("GENOME_MCP_JSON_CODEC") or None)
@@ -0,0 +1,187 @@
+"""
+Memory pressure monitoring for Genome MCP.
+
+Large batch jobs hold many results in memory at once on top of a full result
+cache, and the process can grow until it is killed for running out of
+memory. This module samples the resident set size (RSS) of the process and
+shrinks caches once it approaches a configured ceiling, so memory is handed
+to in-flight work before the process hits the limit.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol
+
+import structlog
+
+from genome_mcp.core.caching import memory_usage
+from genome_mcp.exceptions import ValidationError
+
+logger = structlog.get_logger(__name__)
+
+
+class Shrinkable(Protocol):
+    """A cache that can release part of its entries."""
+
+    def shrink(self, fraction: float, floor: int = 0) -> int:
+        """Evict a fraction of the entries, keeping at least ``floor``."""
+        ...
+
+
+def _read_rss_mb() -> float:
+    """Read the resident set size of the process in MiB."""
+    return memory_usage()["rss"]
+
+
+class MemoryPressureMonitor:
+    """Shrink caches when the process RSS approaches a ceiling.
+
+    Every ``interval`` seconds the RSS is compared to ``high_watermark``
+    times ``max_rss_mb``; above it, ``shrink_fraction`` of the entries of
+    every cache is evicted, never going below ``min_entries`` per cache.
+    Freed memory is not always returned to the operating system right away,
+    so the RSS may stay high for a while; the freed memory is still reused
+    by the process before it grows further. To avoid emptying the caches
+    meanwhile, the delay between shrinks doubles, up to ``max_backoff``
+    seconds, until the RSS falls below ``low_watermark`` times the ceiling.
+    """
+
+    def __init__(
+        self,
+        max_rss_mb: float,
+        caches: Callable[[], Iterable[Shrinkable]],
+        high_watermark: float = 0.9,
+        shrink_fraction: float = 0.25,
+        interval: float = 1.0,
+        read_rss: Callable[[], float] = _read_rss_mb,
+        low_watermark: Optional[float] = None,
+        min_entries: int = 0,
+        max_backoff: float = 60.0,
+    ):
+        """
+        Initialize memory pressure monitor.
+
+        Args:
+            max_rss_mb: RSS ceiling in MiB
+            caches: Function returning the caches to shrink
+            high_watermark: Fraction of the ceiling from which caches shrink
+            shrink_fraction: Fraction of cache entries evicted per shrink
+            interval: Seconds between checks
+            read_rss: Function returning the current RSS in MiB
+            low_watermark: Fraction of the ceiling below which the pressure
+                has passed (default: high_watermark)
+            min_entries: Entries every cache keeps however high the RSS
+            max_backoff: Maximum seconds between shrinks under lasting pressure
+        """
+        if low_watermark is None:
+            low_watermark = high_watermark
+        if max_rss_mb <= 0:
+            raise ValidationError("max_rss_mb must be positive")
+        if interval <= 0 or max_backoff <= 0:
+            raise ValidationError("interval and max_backoff must be positive")
+        if not 0 < high_watermark <= 1 or not 0 < shrink_fraction <= 1:
+            raise ValidationError(
+                "high_watermark and shrink_fraction must be between 0 and 1"
+            )
+        if not 0 < low_watermark <= high_watermark:
+            raise ValidationError("low_watermark must be between 0 and high_watermark")
+        if min_entries < 0:
+            raise ValidationError("min_entries must not be negative")
+
+        self.max_rss_mb = max_rss_mb
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.shrink_fraction = shrink_fraction
+        self.min_entries = min_entries
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.checks = 0
+        self.pressure_events = 0
+        self.evicted = 0
+        self.last_rss_mb = 0.0
+        self.peak_rss_mb = 0.0
+        self.errors = 0
+        self._caches = caches
+        self._read_rss = read_rss
+        self._backoff = 0.0
+        self._next_shrink = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start checking on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self) -> None:
+        """Stop checking."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _monitor(self) -> None:
+        """Check memory until cancelled."""
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                self.errors += 1
+                logger.error("Memory check failed", error=str(e))
+            await asyncio.sleep(self.interval)
+
+    def check(self) -> int:
+        """
+        Compare the RSS to the ceiling and shrink caches if it is too high.
+
+        Returns:
+            Number of cache entries evicted
+        """
+        rss_mb = self._read_rss()
+        self.checks += 1
+        self.last_rss_mb = rss_mb
+        self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+        if rss_mb < self.max_rss_mb * self.low_watermark:
+            self._backoff = 0.0
+            self._next_shrink = 0.0
+        now = time.monotonic()
+        if rss_mb < self.max_rss_mb * self.high_watermark or now < self._next_shrink:
+            return 0
+
+        evicted = sum(
+            cache.shrink(self.shrink_fraction, self.min_entries)
+            for cache in self._caches()
+        )
+        self._backoff = min(max(2 * self._backoff, 2 * self.interval), self.max_backoff)
+        self._next_shrink = now + self._backoff
+        self.pressure_events += 1
+        self.evicted += evicted
+        logger.warning(
+            "Memory pressure, caches shrunk",
+            rss_mb=round(rss_mb, 1),
+            max_rss_mb=self.max_rss_mb,
+            evicted=evicted,
+            next_shrink_in=self._backoff,
+        )
+        return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memory pressure statistics."""
+        return {
+            "max_rss_mb": self.max_rss_mb,
+            "high_watermark": self.high_watermark,
+            "low_watermark": self.low_watermark,
+            "last_rss_mb": round(self.last_rss_mb, 1),
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+            "checks": self.checks,
+            "pressure_events": self.pressure_events,
+            "evicted": self.evicted,
+            "errors": self.errors,
+        }
@@ -0,0 +1,187 @@
+"""
+Event loop offloading utilities for Genome MCP.
+
+Decoding a large upstream response (an esummary document for hundreds of
+genes) or recursively transforming a big result is CPU-bound work that blocks
+the event loop, stalling every other in-flight request until it is done. This
+module runs such work in a bounded thread or process pool once the payload
+exceeds a size threshold, and provides a monitor that measures event loop lag
+so the effect can be observed.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+
+from genome_mcp.exceptions import ValidationError
+
+logger = structlog.get_logger(__name__)
+
+OFFLOAD_EXECUTORS = ("thread", "process", "none")
+
+
+class ParseOffloader:
+    """Run parsing of large payloads in a bounded worker pool.
+
+    Payloads smaller than ``threshold`` are parsed inline, since handing them
+    to a worker costs more than parsing them. With the "process" executor,
+    functions and arguments must be picklable.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 256 * 1024,
+        executor: str = "thread",
+        max_workers: int = 2,
+    ):
+        """
+        Initialize parse offloader.
+
+        Args:
+            threshold: Payload size from which parsing is offloaded
+            executor: "thread", "process" or "none" (always parse inline)
+            max_workers: Maximum number of worker threads or processes
+        """
+        if executor not in OFFLOAD_EXECUTORS:
+            raise ValidationError(
+                f"Unsupported offload executor: {executor}",
+                field_name="executor",
+                field_value=executor,
+            )
+        if max_workers <= 0:
+            raise ValidationError("max_workers must be positive")
+
+        self.threshold = threshold
+        self.executor = executor
+        self.max_workers = max_workers
+        self.inline_total = 0
+        self.offloaded_total = 0
+        self.offloaded_size = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        """Get the worker pool, creating it on first use."""
+        if self._executor is None:
+            if self.executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="genome-mcp-parse"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, size: int) -> Any:
+        """
+        Run a parsing function, offloading it if the payload is large.
+
+        Args:
+            func: Function to run
+            *args: Arguments for the function
+            size: Payload size (bytes for raw bodies, items for collections)
+
+        Returns:
+            Function result
+        """
+        if self.executor == "none" or size < self.threshold:
+            self.inline_total += 1
+            return func(*args)
+
+        self.offloaded_total += 1
+        self.offloaded_size += size
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool, waiting for running work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get offloading statistics."""
+        return {
+            "executor": self.executor,
+            "threshold": self.threshold,
+            "max_workers": self.max_workers,
+            "inline_total": self.inline_total,
+            "offloaded_total": self.offloaded_total,
+            "offloaded_size": self.offloaded_size,
+        }
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a periodic callback.
+
+    A task sleeps for ``interval`` seconds in a loop; the time by which each
+    wake-up overshoots the interval is the lag other coroutines experienced
+    at that moment.
+    """
+
+    def __init__(self, interval: float = 0.1):
+        """
+        Initialize loop lag monitor.
+
+        Args:
+            interval: Seconds between samples
+        """
+        if interval <= 0:
+            raise ValidationError("interval must be positive")
+
+        self.interval = interval
+        self.samples = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample(self) -> None:
+        """Sample loop lag until cancelled."""
+        while True:
+            start_time = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.record(time.perf_counter() - start_time - self.interval)
+
+    def record(self, lag: float) -> None:
+        """Record one lag sample in seconds."""
+        lag = max(lag, 0.0)
+        self.samples += 1
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.total_lag += lag
+        if lag >= 0.1:
+            logger.warning("Event loop lag", lag_ms=round(lag * 1000, 1))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get loop lag statistics in milliseconds."""
+        mean_lag = self.total_lag / self.samples if self.samples else 0.0
+        return {
+            "interval_ms": self.interval * 1000,
+            "samples": self.samples,
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "mean_lag_ms": round(mean_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+        }
@@ -0,0 +1,133 @@
+"""
+Progress reporting utilities for Genome MCP.
+
+This module tracks progress of long-running batch and streaming operations and
+forwards it to a progress callback, e.g. MCP progress notifications. The
+callback is bound per request through a context variable, so deeply nested
+batch code reports progress without threading a callback through every call.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sized,
+)
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Called with (completed, total, message)
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+_progress_callback: ContextVar[Optional[ProgressCallback]] = ContextVar(
+    "genome_mcp_progress_callback", default=None
+)
+
+
+@contextmanager
+def progress_reporting(callback: Optional[ProgressCallback]) -> Iterator[None]:
+    """
+    Bind a progress callback for the current request.
+
+    Args:
+        callback: Progress callback, or None to disable reporting
+    """
+    token = _progress_callback.set(callback)
+    try:
+        yield
+    finally:
+        _progress_callback.reset(token)
+
+
+class ProgressTracker:
+    """Track completed items, throughput and ETA of a batch operation."""
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        unit: str = "items",
+        callback: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initialize progress tracker.
+
+        Args:
+            total: Total number of items, if known
+            unit: Name of the items used in progress messages
+            callback: Progress callback (default: callback bound to the request)
+        """
+        self.total = total
+        self.unit = unit
+        self.callback = callback or _progress_callback.get()
+        self.completed = 0
+        self.start_time = time.time()
+
+    @classmethod
+    def for_items(cls, items: Iterable[Any], unit: str = "items") -> "ProgressTracker":
+        """
+        Create a tracker for an iterable, using its length as total if known.
+
+        Args:
+            items: Items to be processed
+            unit: Name of the items used in progress messages
+        """
+        total = len(items) if isinstance(items, Sized) else None
+        return cls(total, unit=unit)
+
+    @property
+    def throughput(self) -> float:
+        """Completed items per second."""
+        elapsed = time.time() - self.start_time
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until completion, if it can be estimated."""
+        if self.total is None or self.throughput <= 0:
+            return None
+        return max(self.total - self.completed, 0) / self.throughput
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current progress."""
+        return {
+            "completed": self.completed,
+            "total": self.total,
+            "throughput": round(self.throughput, 2),
+            "eta": round(self.eta, 1) if self.eta is not None else None,
+        }
+
+    def message(self) -> str:
+        """Format the current progress as a human-readable message."""
+        total = f"/{self.total}" if self.total is not None else ""
+        message = (
+            f"{self.completed}{total} {self.unit} ({self.throughput:.1f} {self.unit}/s"
+        )
+        if self.eta is not None:
+            message += f", ETA {self.eta:.0f}s"
+        return message + ")"
+
+    async def advance(self, count: int = 1) -> None:
+        """
+        Record completed items and report progress.
+
+        Args:
+            count: Number of newly completed items
+        """
+        self.completed += count
+        if self.callback is None:
+            return
+
+        try:
+            await self.callback(self.completed, self.total, self.message())
+        except Exception as e:
+            # Progress is best effort and must never fail the operation
+            logger.debug("Failed to report progress", error=str(e))
@@ -0,0 +1,147 @@
+"""
+Compact record types for Genome MCP.
+
+Cached gene results repeat the same short strings (dictionary keys, species,
+organism and chromosome names, ...) in every entry, and every result carries
+its own dictionary overhead. This module stores such results as slots-based
+records with interned strings, and converts them back to plain dictionaries
+when they leave the cache.
+"""
+
+import sys
+from typing import Any, Dict, Optional, cast
+
+# Strings up to this length are interned; longer strings (descriptions,
+# summaries) are rarely repeated and are stored as they are
+INTERN_MAX_LENGTH = 64
+
+_GENE_RECORD_KEYS = frozenset({"gene_id", "species", "uid", "info", "source"})
+
+
+def _intern_key(key: Any) -> Any:
+    """Intern a dictionary key if it is a string."""
+    return sys.intern(key) if isinstance(key, str) else key
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Intern dictionary keys and short strings in a JSON-like value.
+
+    Args:
+        value: JSON-like value
+
+    Returns:
+        Equal value sharing one copy of each repeated short string
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+    if isinstance(value, dict):
+        return {_intern_key(key): intern_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [intern_value(item) for item in value]
+    return value
+
+
+class GeneRecord:
+    """Compact representation of a gene information result."""
+
+    __slots__ = ("gene_id", "species", "uid", "info", "source", "summary")
+
+    def __init__(
+        self,
+        gene_id: str,
+        species: str,
+        uid: str,
+        info: Dict[str, Any],
+        source: str,
+        summary: Optional[str] = None,
+    ):
+        self.gene_id = gene_id
+        self.species = species
+        self.uid = uid
+        self.info = info
+        self.source = source
+        self.summary = summary
+
+    @staticmethod
+    def matches(data: Dict[str, Any]) -> bool:
+        """Check whether a dictionary has the shape of a gene information result."""
+        keys = data.keys() - {"summary"}
+        return keys == _GENE_RECORD_KEYS and isinstance(data["info"], dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GeneRecord":
+        """Create a record from a gene information result."""
+        return cls(
+            gene_id=intern_value(data["gene_id"]),
+            species=intern_value(data["species"]),
+            uid=data["uid"],
+            info=intern_value(data["info"]),
+            source=intern_value(data["source"]),
+            summary=data.get("summary"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record back to a gene information result."""
+        data = {
+            "gene_id": self.gene_id,
+            "species": self.species,
+            "uid": self.uid,
+            "info": self.info,
+            "source": self.source,
+        }
+        if self.summary is not None:
+            data["summary"] = self.summary
+        return data
+
+
+def compact_value(value: Any) -> Any:
+    """
+    Convert a result to its compact representation.
+
+    Gene information results, also when nested in batch results, become
+    GeneRecord instances; all other dictionaries and lists are kept with
+    interned keys and short strings.
+
+    Args:
+        value: JSON-like result
+
+    Returns:
+        Compact representation, see expand_value
+    """
+    if isinstance(value, dict):
+        if GeneRecord.matches(value):
+            return GeneRecord.from_dict(value)
+        return {_intern_key(key): compact_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [compact_value(item) for item in value]
+    return intern_value(value)
+
+
+def expand_value(value: Any) -> Any:
+    """
+    Convert a compact representation back to a plain JSON-like result.
+
+    Args:
+        value: Value produced by compact_value
+
+    Returns:
+        Equivalent plain result
+    """
+    if isinstance(value, GeneRecord):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: expand_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [expand_value(item) for item in value]
+    return value
+
+
+class CompactRecordCodec:
+    """Cache codec storing results as compact records with interned strings."""
+
+    def encode(self, data: Dict[str, Any]) -> Any:
+        return compact_value(data)
+
+    def decode(self, stored: Any) -> Dict[str, Any]:
+        return cast(Dict[str, Any], expand_value(stored))
@@ -0,0 +1,291 @@
+"""
+Genomic region index for Genome MCP.
+
+Region search results are cached by their exact coordinates, so zooming into
+part of a region that was just fetched would go back upstream. This module
+keeps the genes of completely fetched regions in a per-chromosome interval
+index: searches inside covered regions are answered by filtering the index,
+and searches overlapping them only need the uncovered gaps fetched.
+"""
+
+import bisect
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.exceptions import ValidationError
+
+# A gene of a fetched region: ID, first and last position, and its record
+RegionRecord = Tuple[str, int, int, Any]
+
+
+class _ChromosomeIndex:
+    """Covered intervals of one chromosome and the genes overlapping them.
+
+    Intervals are disjoint and sorted by start. Genes are held sorted by
+    start position; together with the length of the longest gene this
+    bounds the genes that can overlap a query.
+    """
+
+    def __init__(self) -> None:
+        self.intervals: List[Tuple[int, int, float]] = []
+        self.interval_starts: List[int] = []
+        self.genes: Dict[str, Tuple[int, int, bytes]] = {}
+        self.gene_starts: List[Tuple[int, str]] = []
+        self.max_length = 0
+        self.next_expiry = float("inf")
+
+    def gaps(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Get the parts of [start, end] not covered by any interval."""
+        gaps = []
+        cursor = start
+        i = max(bisect.bisect_right(self.interval_starts, start) - 1, 0)
+        for interval_start, interval_end, _ in self.intervals[i:]:
+            if interval_start > end:
+                break
+            if interval_end < cursor:
+                continue
+            if interval_start > cursor:
+                gaps.append((cursor, interval_start - 1))
+            cursor = interval_end + 1
+            if cursor > end:
+                break
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def add(
+        self, start: int, end: int, records: Iterable[RegionRecord], expires: float
+    ) -> int:
+        """Cover [start, end] and add its genes; returns the number of new genes."""
+        for gap_start, gap_end in self.gaps(start, end):
+            i = bisect.bisect_left(self.interval_starts, gap_start)
+            self.intervals.insert(i, (gap_start, gap_end, expires))
+            self.interval_starts.insert(i, gap_start)
+        self.next_expiry = min(self.next_expiry, expires)
+
+        added = 0
+        for gene_id, gene_start, gene_end, record in records:
+            if gene_id in self.genes:
+                continue
+            self.genes[gene_id] = (gene_start, gene_end, json_codec.dumps(record))
+            bisect.insort(self.gene_starts, (gene_start, gene_id))
+            self.max_length = max(self.max_length, gene_end - gene_start)
+            added += 1
+        return added
+
+    def query(self, start: int, end: int) -> List[Any]:
+        """Get the genes overlapping [start, end], ordered by position."""
+        i = bisect.bisect_left(self.gene_starts, (start - self.max_length, ""))
+        records = []
+        for gene_start, gene_id in self.gene_starts[i:]:
+            if gene_start > end:
+                break
+            _, gene_end, record = self.genes[gene_id]
+            if gene_end >= start:
+                records.append(json_codec.loads(record))
+        return records
+
+    def purge_expired(self, now: float) -> int:
+        """Drop expired intervals and the genes they alone covered.
+
+        Returns:
+            Number of genes removed
+        """
+        if now < self.next_expiry:
+            return 0
+
+        self.intervals = [interval for interval in self.intervals if interval[2] > now]
+        self.interval_starts = [interval[0] for interval in self.intervals]
+        self.next_expiry = min(
+            (interval[2] for interval in self.intervals), default=float("inf")
+        )
+
+        removed = [
+            gene_id
+            for gene_id, (gene_start, gene_end, _) in self.genes.items()
+            if not self._covers_any(gene_start, gene_end)
+        ]
+        for gene_id in removed:
+            del self.genes[gene_id]
+        if removed:
+            self.gene_starts = sorted(
+                (gene[0], gene_id) for gene_id, gene in self.genes.items()
+            )
+        return len(removed)
+
+    def _covers_any(self, start: int, end: int) -> bool:
+        """Check whether any interval overlaps [start, end]."""
+        i = bisect.bisect_right(self.interval_starts, end) - 1
+        return i >= 0 and self.intervals[i][1] >= start
+
+
+class RegionIndex:
+    """Genes of completely fetched genomic regions, by chromosome.
+
+    Regions are added with every gene overlapping them, so a search inside
+    the union of fresh regions is answered exactly by the genes overlapping
+    it. Regions are indexed per scope (e.g. species and fetched fields) and
+    chromosome; when the index holds more than ``max_genes`` genes, the
+    least recently used chromosomes are dropped. Records are stored
+    serialized, so results never share objects with the index.
+    """
+
+    def __init__(self, max_genes: int = 20000, ttl: float = 900):
+        """
+        Initialize region index.
+
+        Args:
+            max_genes: Maximum number of genes held
+            ttl: Default time to live of added regions in seconds
+        """
+        if max_genes < 1:
+            raise ValidationError("max_genes must be positive")
+
+        self.max_genes = max_genes
+        self.ttl = ttl
+        self.genes = 0
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._chromosomes: "OrderedDict[Tuple[str, str], _ChromosomeIndex]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return self.genes
+
+    def _get_index(self, scope: str, chromosome: str) -> Optional[_ChromosomeIndex]:
+        """Get the fresh index of a chromosome, marking it recently used."""
+        index = self._chromosomes.get((scope, chromosome))
+        if index is None:
+            return None
+        self.genes -= index.purge_expired(time.time())
+        self._chromosomes.move_to_end((scope, chromosome))
+        return index
+
+    def gaps(
+        self, scope: str, chromosome: str, start: int, end: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the parts of a region that are not covered yet.
+
+        Args:
+            scope: Index scope
+            chromosome: Chromosome
+            start: First position of the region
+            end: Last position of the region
+
+        Returns:
+            Uncovered (start, end) gaps in position order
+        """
+        index = self._get_index(scope, chromosome)
+        gaps = index.gaps(start, end) if index is not None else [(start, end)]
+        if not gaps:
+            self.hits += 1
+        elif gaps == [(start, end)]:
+            self.misses += 1
+        else:
+            self.partial_hits += 1
+        return gaps
+
+    def add(
+        self,
+        scope: str,
+        chromosome: str,
+        start: int,
+        end: int,
+        records: Iterable[RegionRecord],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Add a completely fetched region.
+
+        Args:
+            scope: Index scope
+            chromosome: Chromosome
+            start: First position of the region
+            end: Last position of the region
+            records: Every gene overlapping the region
+            ttl: Time to live in seconds (defaults to the index TTL)
+        """
+        index = self._get_index(scope, chromosome)
+        if index is None:
+            index = self._chromosomes[(scope, chromosome)] = _ChromosomeIndex()
+
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        self.genes += index.add(start, end, records, expires)
+
+        while self.genes > self.max_genes and self._chromosomes:
+            _, evicted = self._chromosomes.popitem(last=False)
+            self.genes -= len(evicted.genes)
+            self.evictions += 1
+
+    def query(
+        self, scope: str, chromosome: str, start: int, end: int
+    ) -> Optional[List[Any]]:
+        """
+        Get the genes overlapping a region from the index.
+
+        Args:
+            scope: Index scope
+            chromosome: Chromosome
+            start: First position of the region
+            end: Last position of the region
+
+        Returns:
+            Gene records ordered by position, or None if the region is not
+            completely covered
+        """
+        index = self._get_index(scope, chromosome)
+        if index is None or index.gaps(start, end):
+            return None
+        return index.query(start, end)
+
+    def shrink(self, fraction: float, floor: int = 0) -> int:
+        """
+        Drop the least recently used chromosomes to release memory.
+
+        Whole chromosomes are dropped until at least ``fraction`` of the
+        genes are gone, unless that would leave fewer than ``floor`` genes.
+
+        Args:
+            fraction: Fraction of genes to drop (0 to 1)
+            floor: Number of genes kept at least
+
+        Returns:
+            Number of genes dropped
+        """
+        target = math.ceil(self.genes * min(max(fraction, 0.0), 1.0))
+        removed = 0
+        while removed < target and self._chromosomes:
+            oldest = next(iter(self._chromosomes.values()))
+            if self.genes - len(oldest.genes) < floor:
+                break
+            self._chromosomes.popitem(last=False)
+            self.genes -= len(oldest.genes)
+            self.evictions += 1
+            removed += len(oldest.genes)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all regions."""
+        self._chromosomes.clear()
+        self.genes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get region index statistics."""
+        lookups = self.hits + self.partial_hits + self.misses
+        return {
+            "chromosomes": len(self._chromosomes),
+            "genes": self.genes,
+            "max_genes": self.max_genes,
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
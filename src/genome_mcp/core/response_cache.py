@@ -0,0 +1,164 @@
+"""
+Raw response cache for Genome MCP.
+
+This module provides the cache of raw upstream response bodies used by the
+HTTP client. Bodies are held as single bytes objects rather than decoded
+object graphs, and their size is simply their length. The decoded documents
+of the most recently read bodies are kept as well, so hot documents are not
+decoded again on every hit.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Optional
+
+
+class _ResponseEntry:
+    """A cached response body, its expiry time and its decoded document."""
+
+    __slots__ = ("body", "expires", "decoded")
+
+    def __init__(self, body: bytes, expires: float):
+        self.body = body
+        self.expires = expires
+        self.decoded: Any = None
+
+
+class ResponseCache:
+    """TTL cache of raw response bodies with LRU eviction.
+
+    Besides the bodies, the decoded documents of the ``decoded_size`` most
+    recently read entries are kept. Decoded documents are shared by all
+    readers and must not be modified.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 3600, decoded_size: int = 64):
+        """
+        Initialize response cache.
+
+        Args:
+            max_size: Maximum number of bodies
+            ttl: Time to live in seconds
+            decoded_size: Maximum number of decoded documents kept (0 keeps none)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.decoded_size = decoded_size
+        self._entries: "OrderedDict[str, _ResponseEntry]" = OrderedDict()
+        self._decoded: "OrderedDict[str, None]" = OrderedDict()
+        self.stored_bytes = 0
+        self.evictions = 0
+        self.decoded_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _fresh_entry(self, key: str) -> Optional[_ResponseEntry]:
+        """Get an unexpired entry, marking it as the most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry.expires:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached response body, or None if missing or expired."""
+        entry = self._fresh_entry(key)
+        return entry.body if entry is not None else None
+
+    def get_decoded(self, key: str) -> Any:
+        """Get the kept decoded document of a body, or None if not kept."""
+        entry = self._fresh_entry(key)
+        if entry is None or entry.decoded is None:
+            return None
+        self._decoded.move_to_end(key)
+        self.decoded_hits += 1
+        return entry.decoded
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store a response body, replacing any previous one."""
+        self._remove(key)
+        self._entries[key] = _ResponseEntry(body, time.time() + self.ttl)
+        self.stored_bytes += len(body)
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def set_decoded(self, key: str, document: Any) -> None:
+        """Keep the decoded document of a cached body."""
+        entry = self._entries.get(key)
+        if entry is None or self.decoded_size <= 0:
+            return
+        entry.decoded = document
+        self._decoded[key] = None
+        self._decoded.move_to_end(key)
+        while len(self._decoded) > self.decoded_size:
+            oldest, _ = self._decoded.popitem(last=False)
+            self._entries[oldest].decoded = None
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry; returns whether it existed."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.stored_bytes -= len(entry.body)
+        self._decoded.pop(key, None)
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry; returns whether it existed."""
+        return self._remove(key)
+
+    def shrink(self, fraction: float, floor: int = 0) -> int:
+        """
+        Evict a fraction of the entries to release memory.
+
+        Among twice as many least recently used entries as need to go, the
+        largest bodies are evicted.
+
+        Args:
+            fraction: Fraction of entries to evict (0 to 1)
+            floor: Number of entries never evicted by shrinking
+
+        Returns:
+            Number of entries removed
+        """
+        target = min(
+            math.ceil(len(self._entries) * min(max(fraction, 0.0), 1.0)),
+            len(self._entries) - floor,
+        )
+        if target <= 0:
+            return 0
+
+        candidates = list(islice(self._entries.items(), 2 * target))
+        candidates.sort(key=lambda item: len(item[1].body), reverse=True)
+        for key, _ in candidates[:target]:
+            self._remove(key)
+        self.evictions += target
+        return target
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._decoded.clear()
+        self.stored_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "evictions": self.evictions,
+            "ttl": self.ttl,
+            "stored_bytes": self.stored_bytes,
+            "decoded_entries": len(self._decoded),
+            "decoded_hits": self.decoded_hits,
+        }
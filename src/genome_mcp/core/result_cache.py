@@ -0,0 +1,543 @@
+"""
+Result cache for Genome MCP servers.
+
+This module provides the in-memory TTL cache used by servers to store
+operation results. Values pass through a codec on the way in and out, so the
+stored representation (plain dicts, compact records, ...) can change without
+affecting callers, which always receive plain dictionaries.
+"""
+
+import lzma
+import math
+import time
+import zlib
+from collections import OrderedDict
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    cast,
+)
+
+import structlog
+
+from genome_mcp.core.dedup import ContentAddressedCodec, ContentRef
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.exceptions import ValidationError
+
+logger = structlog.get_logger(__name__)
+
+COMPRESSION_ALGORITHMS = ("none", "zlib", "lzma", "zstd")
+
+
+class ValueCodec(Protocol):
+    """Converts cache values to and from their stored representation."""
+
+    def encode(self, data: Dict[str, Any]) -> Any:
+        """Convert a result to its stored representation."""
+        ...
+
+    def decode(self, stored: Any) -> Dict[str, Any]:
+        """Convert a stored representation back to a result."""
+        ...
+
+
+class IdentityCodec:
+    """Store results as they are."""
+
+    def encode(self, data: Dict[str, Any]) -> Any:
+        return data
+
+    def decode(self, stored: Any) -> Dict[str, Any]:
+        return cast(Dict[str, Any], stored)
+
+
+def _zstd_functions(level: int) -> Optional[Tuple[Callable, Callable]]:
+    """Get zstd compress/decompress functions if a zstd module is installed."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return (lambda data: zstd.compress(data, level=level)), zstd.decompress
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+
+    compressor = zstandard.ZstdCompressor(level=level)
+    decompressor = zstandard.ZstdDecompressor()
+    return compressor.compress, decompressor.decompress
+
+
+class CompressedValue:
+    """A serialized, possibly compressed cache value."""
+
+    __slots__ = ("payload", "compressed")
+
+    def __init__(self, payload: bytes, compressed: bool):
+        self.payload = payload
+        self.compressed = compressed
+
+    def __len__(self) -> int:
+        return len(self.payload)
+
+
+class CompressedCodec:
+    """Store results as compressed JSON bytes, decoded only on cache hits.
+
+    A serialized result is a single bytes object instead of a graph of many
+    small Python objects, and compression typically shrinks JSON several
+    times, so many more results fit in the same memory at the cost of a
+    decode per hit. Values smaller than ``min_size`` bytes are stored
+    uncompressed since compressing them gains little.
+    """
+
+    def __init__(self, algorithm: str = "zlib", level: int = 6, min_size: int = 256):
+        """
+        Initialize compressed codec.
+
+        Args:
+            algorithm: "zlib", "lzma" or "zstd" (falls back to zlib if no
+                zstd module is installed)
+            level: Compression level
+            min_size: Serialized size below which values are not compressed
+        """
+        if algorithm not in COMPRESSION_ALGORITHMS[1:]:
+            raise ValidationError(
+                f"Unsupported compression algorithm: {algorithm}",
+                field_name="compression",
+                field_value=algorithm,
+            )
+
+        zstd_functions = _zstd_functions(level) if algorithm == "zstd" else None
+        if algorithm == "zstd" and zstd_functions is None:
+            logger.warning("zstd is not installed, falling back to zlib")
+            algorithm = "zlib"
+
+        if zstd_functions is not None:
+            self._compress, self._decompress = zstd_functions
+        elif algorithm == "lzma":
+            self._compress = lambda data: lzma.compress(data, preset=min(level, 9))
+            self._decompress = lzma.decompress
+        else:
+            self._compress = lambda data: zlib.compress(data, min(level, 9))
+            self._decompress = zlib.decompress
+
+        self.algorithm = algorithm
+        self.min_size = min_size
+
+    def encode(self, data: Dict[str, Any]) -> CompressedValue:
+        payload = json_codec.dumps(data)
+        if len(payload) < self.min_size:
+            return CompressedValue(payload, compressed=False)
+        return CompressedValue(self._compress(payload), compressed=True)
+
+    def decode(self, stored: CompressedValue) -> Dict[str, Any]:
+        payload = stored.payload
+        if stored.compressed:
+            payload = self._decompress(payload)
+        return cast(Dict[str, Any], json_codec.loads(payload))
+
+
+class AdmissionPolicy(Protocol):
+    """Decides which new entries a full cache admits."""
+
+    def record(self, key: str) -> None:
+        """Record a request for a key."""
+        ...
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        """Decide whether the candidate key may replace the victim key."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics."""
+        ...
+
+
+class CacheEntry:
+    """A stored cache value with its expiry time, invalidation tags and size.
+
+    The size is the estimated memory held by the value in bytes, recorded
+    when the entry is created, or 0 if it was not measured.
+    """
+
+    __slots__ = ("value", "expires", "tags", "size")
+
+    def __init__(
+        self, value: Any, expires: float, tags: Tuple[str, ...] = (), size: int = 0
+    ):
+        self.value = value
+        self.expires = expires
+        self.tags = tags
+        self.size = size
+
+
+class ResultCache:
+    """TTL cache of operation results with LRU eviction.
+
+    When the cache grows beyond ``max_size`` entries, expired entries are
+    removed first, then the least recently used ones. Keys are expected to
+    start with a namespace prefix, and entries can carry tags (e.g. the genes
+    a result describes), so related entries can be invalidated together.
+
+    With an admission policy, a new entry only replaces the least recently
+    used one if the policy admits it, so one-off keys from a bulk scan cannot
+    flush frequently requested results.
+
+    Entry sizes are taken from stored values that know their size (bytes,
+    compressed values, content references). Other values are serialized to
+    measure them only with ``measure_sizes``, since only shrinking uses sizes.
+    """
+
+    # Minimum seconds between scans for expired entries on insertion
+    PURGE_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float = 3600,
+        codec: Optional[ValueCodec] = None,
+        admission: Optional[AdmissionPolicy] = None,
+        measure_sizes: bool = False,
+    ):
+        """
+        Initialize result cache.
+
+        Args:
+            max_size: Maximum number of entries
+            ttl: Default time to live in seconds
+            codec: Codec for stored values (default: store values as they are)
+            admission: Policy deciding whether new entries may evict old ones
+                when the cache is full (default: always admit)
+            measure_sizes: Serialize values whose stored form does not know
+                its size to record entry sizes for shrinking
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.measure_sizes = measure_sizes
+        self.codec = codec if codec is not None else IdentityCodec()
+        # Codecs sharing data between entries are told when values are dropped
+        self._release_value: Callable[[Any], None] = getattr(
+            self.codec, "release", lambda stored: None
+        )
+        self.admission = admission
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self.evictions = 0
+        self._next_purge = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over cache keys."""
+        return iter(list(self._entries))
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Cache key
+            allow_stale: Return the result even if it has expired
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        if self.admission is not None:
+            self.admission.record(key)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not allow_stale and time.time() >= entry.expires:
+            return None
+
+        self._entries.move_to_end(key)
+        data = self.codec.decode(entry.value)
+        return data if data is not None else {}
+
+    async def get_async(
+        self, key: str, allow_stale: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result from a coroutine.
+
+        Caches with tiers outside memory read them without blocking the
+        event loop; the memory cache answers directly.
+
+        Args:
+            key: Cache key
+            allow_stale: Return the result even if it has expired
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        return self.get(key, allow_stale=allow_stale)
+
+    def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Cache key
+            data: Result to store
+            ttl: Time to live in seconds (default: cache TTL)
+            tags: Tags for invalidating the entry together with related ones
+        """
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        self._store(key, self._make_entry(data, expires, tuple(tags)))
+
+    def restore(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        expires: float,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Store a result with an absolute expiry time, e.g. from a snapshot.
+
+        Restored entries bypass the admission policy, which has no access
+        history for them yet.
+
+        Args:
+            key: Cache key
+            data: Result to store
+            expires: Expiry time (epoch seconds)
+            tags: Tags for invalidating the entry together with related ones
+        """
+        self._store(key, self._make_entry(data, expires, tuple(tags)), admit=True)
+
+    def iter_entries(
+        self,
+    ) -> Iterator[Tuple[str, Dict[str, Any], float, Tuple[str, ...]]]:
+        """
+        Iterate over fresh entries, least recently used first.
+
+        Values are decoded one at a time, so iterating does not copy the
+        cache contents.
+
+        Yields:
+            Key, result, expiry time and tags of each entry
+        """
+        current_time = time.time()
+        for key, entry in list(self._entries.items()):
+            if entry.expires > current_time:
+                yield key, self.codec.decode(entry.value), entry.expires, entry.tags
+
+    def _store(self, key: str, entry: CacheEntry, admit: bool = False) -> None:
+        """Insert an entry as the most recently used, evicting if over capacity.
+
+        Unless ``admit`` is set, a new entry in a full cache must pass the
+        admission policy.
+        """
+        replaced = self._remove(key)
+        if not replaced and len(self._entries) >= self.max_size:
+            # Scanning for expired entries is linear, so it is done at most
+            # once per PURGE_INTERVAL; LRU eviction handles the rest
+            if time.time() >= self._next_purge:
+                self._purge_expired_entries()
+            if not admit and not self._admit(key):
+                self._evicted(key, entry)
+                self._release_value(entry.value)
+                return
+
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._evict(*next(iter(self._entries.items())))
+
+    def shrink(self, fraction: float, floor: int = 0) -> int:
+        """
+        Evict a fraction of the entries to release memory.
+
+        Expired entries go first. The rest are taken from the least recently
+        used entries, largest first: among twice as many LRU entries as still
+        need to go, the largest ones are evicted. Entries whose size was not
+        measured are evicted in LRU order.
+
+        Args:
+            fraction: Fraction of entries to evict (0 to 1)
+            floor: Number of entries never evicted by shrinking
+
+        Returns:
+            Number of entries removed
+        """
+        target = min(
+            math.ceil(len(self._entries) * min(max(fraction, 0.0), 1.0)),
+            len(self._entries) - floor,
+        )
+        if target <= 0:
+            return 0
+
+        removed = self._purge_expired_entries()
+        remaining = target - removed
+        if remaining > 0:
+            candidates = list(islice(self._entries.items(), 2 * remaining))
+            candidates.sort(key=lambda item: item[1].size, reverse=True)
+            for key, entry in candidates[:remaining]:
+                self._evict(key, entry)
+            removed += min(remaining, len(candidates))
+        return removed
+
+    def _make_entry(
+        self, data: Dict[str, Any], expires: float, tags: Tuple[str, ...]
+    ) -> CacheEntry:
+        """Encode a result into an entry, recording its size."""
+        value = self.codec.encode(data)
+        return CacheEntry(value, expires, tags, self._value_size(value, data))
+
+    def _value_size(self, value: Any, data: Any) -> int:
+        """Get the size of a stored value, or 0 if it is not measured."""
+        if isinstance(value, (bytes, str, CompressedValue)):
+            return len(value)
+        if isinstance(value, ContentRef):
+            return value.size
+        if self.measure_sizes:
+            return len(json_codec.dumps(data))
+        return 0
+
+    def _admit(self, key: str) -> bool:
+        """Decide whether a new key may take the place of the LRU entry."""
+        if self.admission is None or len(self._entries) < self.max_size:
+            return True
+        victim_key, victim_entry = next(iter(self._entries.items()))
+        if victim_entry.expires <= time.time():
+            return True
+        return self.admission.admit(key, victim_key)
+
+    def _evict(self, key: str, entry: CacheEntry) -> None:
+        """Evict an entry to make room."""
+        self._evicted(key, entry)
+        self._remove(key)
+        self.evictions += 1
+
+    def _evicted(self, key: str, entry: CacheEntry) -> None:
+        """Handle an entry about to be evicted (dropped by default)."""
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and its tag references; returns whether it existed."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._release_value(entry.value)
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry; returns whether it existed."""
+        return self._remove(key)
+
+    def invalidate(self, prefix: Optional[str] = None, tags: Iterable[str] = ()) -> int:
+        """
+        Remove entries by key namespace and/or tag.
+
+        Args:
+            prefix: Only remove entries whose key starts with this prefix
+            tags: Only remove entries carrying at least one of these tags
+
+        Returns:
+            Number of entries removed
+        """
+        return len(self._invalidate_keys(prefix, tags))
+
+    def _invalidate_keys(self, prefix: Optional[str], tags: Iterable[str]) -> Set[str]:
+        """Remove entries by key namespace and/or tag; returns the removed keys."""
+        tags = list(tags)
+        if tags:
+            candidates = set().union(*(self._tags.get(tag, ()) for tag in tags))
+        else:
+            candidates = set(self._entries)
+        if prefix is not None:
+            candidates = {key for key in candidates if key.startswith(prefix)}
+
+        for key in candidates:
+            self._remove(key)
+        return candidates
+
+    def expire(self, key: Optional[str] = None) -> bool:
+        """Mark one entry, or all entries, as expired without removing them.
+
+        Returns:
+            Whether any entry was marked (False for a missing key)
+        """
+        if key is None:
+            entries = list(self._entries.values())
+        else:
+            entry = self._entries.get(key)
+            entries = [entry] if entry is not None else []
+        for entry in entries:
+            entry.expires = 0
+        return bool(entries)
+
+    def purge_expired(self) -> int:
+        """Remove expired entries; returns the number removed."""
+        return self._purge_expired_entries()
+
+    def _purge_expired_entries(self) -> int:
+        """Remove expired in-memory entries; returns the number removed."""
+        current_time = time.time()
+        self._next_purge = current_time + self.PURGE_INTERVAL
+        expired_keys = [
+            key for key, entry in self._entries.items() if entry.expires < current_time
+        ]
+        for key in expired_keys:
+            self._remove(key)
+        return len(expired_keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for entry in self._entries.values():
+            self._release_value(entry.value)
+        self._entries.clear()
+        self._tags.clear()
+
+    def close(self) -> None:
+        """Release resources held by the cache (none for the memory cache)."""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        stats = {
+            "entries": len(self._entries),
+            "tags": len(self._tags),
+            "max_size": self.max_size,
+            "evictions": self.evictions,
+            "ttl": self.ttl,
+            "codec": type(self.codec).__name__,
+        }
+        if self.admission is not None:
+            stats["admission"] = self.admission.get_stats()
+        if isinstance(self.codec, ContentAddressedCodec):
+            stats["dedup"] = self.codec.get_stats()
+        if isinstance(self.codec, CompressedCodec):
+            stats["compression"] = self.codec.algorithm
+            stats["stored_bytes"] = sum(
+                len(entry.value) for entry in self._entries.values()
+            )
+        return stats
@@ -0,0 +1,344 @@
+"""
+Request scheduling utilities for Genome MCP.
+
+This module provides admission control used by servers to bound the amount of
+concurrent upstream work and to shed excess load before it piles up on the
+rate limiter, and a priority scheduler that orders access to the rate limiter
+across weighted lanes and, within a lane, fairly across clients.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from genome_mcp.exceptions import ServerOverloadedError, ValidationError
+
+
+class AdmissionController:
+    """Bound in-flight requests and reject excess work early.
+
+    Requests waiting for a slot are queued per client and served round-robin
+    when slots free up, so one client queuing many requests cannot make the
+    requests of other clients time out behind them.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        max_queue_size: int = 100,
+        max_queue_wait: float = 10.0,
+        default_client: str = "anonymous",
+    ):
+        """
+        Initialize admission controller.
+
+        Args:
+            max_in_flight: Maximum requests executing at the same time
+            max_queue_size: Maximum requests waiting for a free slot
+            max_queue_wait: Maximum seconds a request may wait for a slot
+            default_client: Client identifier used when none is specified
+        """
+        if max_in_flight <= 0:
+            raise ValidationError("max_in_flight must be positive")
+
+        self.max_in_flight = max_in_flight
+        self.max_queue_size = max_queue_size
+        self.max_queue_wait = max_queue_wait
+        self.default_client = default_client
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self._available = max_in_flight
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+
+    def _reject(self, reason: str, message: str) -> ServerOverloadedError:
+        """Record a rejection and build the error to raise."""
+        self.rejected_total += 1
+        return ServerOverloadedError(
+            message,
+            reason=reason,
+            in_flight=self.in_flight,
+            queued=self.queued,
+            retry_after=self.max_queue_wait,
+        )
+
+    async def acquire(self, client_id: Optional[str] = None) -> float:
+        """
+        Acquire an execution slot.
+
+        Args:
+            client_id: Client identifier used for fair queuing
+
+        Returns:
+            Seconds spent waiting for the slot
+
+        Raises:
+            ServerOverloadedError: If the queue is full or the wait times out
+        """
+        start_time = time.time()
+
+        if self._available > 0:
+            self._available -= 1
+        else:
+            if self.queued >= self.max_queue_size:
+                raise self._reject(
+                    "queue_full",
+                    f"Server overloaded: {self.queued} requests already queued",
+                )
+
+            client_id = client_id or self.default_client
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(client_id, deque()).append(waiter)
+            self.queued += 1
+            try:
+                await asyncio.wait_for(waiter, timeout=self.max_queue_wait)
+            except asyncio.TimeoutError:
+                self._remove_waiter(client_id, waiter)
+                raise self._reject(
+                    "queue_timeout",
+                    f"Server overloaded: no slot available within "
+                    f"{self.max_queue_wait:.1f}s",
+                )
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was handed over concurrently with cancellation
+                    self._grant_next()
+                else:
+                    self._remove_waiter(client_id, waiter)
+                raise
+            finally:
+                self.queued -= 1
+
+        self.in_flight += 1
+        self.admitted_total += 1
+        return time.time() - start_time
+
+    def release(self) -> None:
+        """Release an execution slot."""
+        self.in_flight -= 1
+        self._grant_next()
+
+    def _grant_next(self) -> None:
+        """Hand a free slot to the next waiting client, rotating clients."""
+        while self._waiters:
+            client_id, waiters = next(iter(self._waiters.items()))
+            waiter = waiters.popleft()
+            if waiters:
+                self._waiters.move_to_end(client_id)
+            else:
+                del self._waiters[client_id]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._available += 1
+
+    def _remove_waiter(self, client_id: str, waiter: asyncio.Future) -> None:
+        """Remove a waiter that gave up from its client queue."""
+        waiters = self._waiters.get(client_id)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del self._waiters[client_id]
+
+    @asynccontextmanager
+    async def admit(self, client_id: Optional[str] = None) -> AsyncIterator[float]:
+        """Context manager holding an execution slot for its duration."""
+        wait_time = await self.acquire(client_id)
+        try:
+            yield wait_time
+        finally:
+            self.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics."""
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "waiting_clients": len(self._waiters),
+            "max_in_flight": self.max_in_flight,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+        }
+
+
+class PriorityScheduler:
+    """Grant turns at a shared resource in weighted-fair order across lanes.
+
+    Only one holder owns the turn at a time. When several lanes have waiters,
+    the next turn is chosen by smooth weighted round-robin, so a lane with
+    weight 4 is served four times as often as a lane with weight 1 while
+    neither lane is ever starved. Within a lane, waiters are queued per client
+    and clients are served round-robin, so one client submitting many requests
+    cannot push other clients to the back of the lane.
+    """
+
+    def __init__(
+        self,
+        lane_weights: Dict[str, int],
+        default_lane: str,
+        default_client: str = "anonymous",
+    ):
+        """
+        Initialize priority scheduler.
+
+        Args:
+            lane_weights: Relative weight for each lane
+            default_lane: Lane used when none is specified
+            default_client: Client identifier used when none is specified
+        """
+        if default_lane not in lane_weights:
+            raise ValidationError(
+                f"Unknown scheduling lane: {default_lane}",
+                field_name="lane",
+                field_value=default_lane,
+            )
+
+        self.lane_weights = dict(lane_weights)
+        self.default_lane = default_lane
+        self.default_client = default_client
+        self._queues: Dict[str, "OrderedDict[str, Deque[asyncio.Future]]"] = {
+            lane: OrderedDict() for lane in lane_weights
+        }
+        self._current_weights: Dict[str, int] = {lane: 0 for lane in lane_weights}
+        self._busy = False
+        self._lane_stats: Dict[str, Dict[str, float]] = {
+            lane: {"granted": 0, "total_wait": 0.0} for lane in lane_weights
+        }
+
+    def _check_lane(self, lane: Optional[str]) -> str:
+        """Resolve and validate a lane name."""
+        lane = lane or self.default_lane
+        if lane not in self._queues:
+            raise ValidationError(
+                f"Unknown scheduling lane: {lane}",
+                field_name="lane",
+                field_value=lane,
+            )
+        return lane
+
+    def _next_lane(self) -> Optional[str]:
+        """Pick the next lane to serve using smooth weighted round-robin."""
+        ready = [lane for lane, clients in self._queues.items() if clients]
+        if not ready:
+            return None
+
+        total_weight = 0
+        for lane in ready:
+            self._current_weights[lane] += self.lane_weights[lane]
+            total_weight += self.lane_weights[lane]
+
+        chosen = max(ready, key=lambda lane: self._current_weights[lane])
+        self._current_weights[chosen] -= total_weight
+        return chosen
+
+    def _pop_waiter(self, lane: str) -> asyncio.Future:
+        """Pop the next waiter of a lane, rotating between clients."""
+        clients = self._queues[lane]
+        client_id, waiters = next(iter(clients.items()))
+        waiter = waiters.popleft()
+        if waiters:
+            clients.move_to_end(client_id)
+        else:
+            del clients[client_id]
+        return waiter
+
+    def _remove_waiter(self, lane: str, client_id: str, waiter: asyncio.Future) -> None:
+        """Remove a cancelled waiter from its client queue."""
+        waiters = self._queues[lane].get(client_id)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del self._queues[lane][client_id]
+
+    def _record_grant(self, lane: str, wait_time: float) -> None:
+        """Record lane statistics for a granted turn."""
+        self._lane_stats[lane]["granted"] += 1
+        self._lane_stats[lane]["total_wait"] += wait_time
+
+    async def acquire(
+        self, lane: Optional[str] = None, client_id: Optional[str] = None
+    ) -> float:
+        """
+        Wait for the turn in the given lane.
+
+        Args:
+            lane: Lane name (defaults to the scheduler's default lane)
+            client_id: Client identifier used for fair queuing within the lane
+
+        Returns:
+            Seconds spent waiting for the turn
+        """
+        lane = self._check_lane(lane)
+        client_id = client_id or self.default_client
+        start_time = time.time()
+
+        if not self._busy and not any(self._queues.values()):
+            self._busy = True
+            self._record_grant(lane, 0.0)
+            return 0.0
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues[lane].setdefault(client_id, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Turn was granted concurrently with cancellation; pass it on
+                self.release()
+            else:
+                self._remove_waiter(lane, client_id, waiter)
+            raise
+
+        wait_time = time.time() - start_time
+        self._record_grant(lane, wait_time)
+        return wait_time
+
+    def release(self) -> None:
+        """Release the turn and hand it to the next waiter, if any."""
+        while True:
+            lane = self._next_lane()
+            if lane is None:
+                self._busy = False
+                return
+
+            waiter = self._pop_waiter(lane)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    @asynccontextmanager
+    async def turn(
+        self, lane: Optional[str] = None, client_id: Optional[str] = None
+    ) -> AsyncIterator[float]:
+        """Context manager holding the turn for its duration."""
+        wait_time = await self.acquire(lane, client_id)
+        try:
+            yield wait_time
+        finally:
+            self.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-lane scheduling statistics."""
+        lanes = {}
+        for lane, stats in self._lane_stats.items():
+            granted = stats["granted"]
+            clients = self._queues[lane]
+            lanes[lane] = {
+                "weight": self.lane_weights[lane],
+                "waiting": sum(len(waiters) for waiters in clients.values()),
+                "waiting_clients": len(clients),
+                "granted": int(granted),
+                "avg_wait": stats["total_wait"] / granted if granted else 0.0,
+            }
+        return {"busy": self._busy, "lanes": lanes}
@@ -0,0 +1,185 @@
+"""
+TinyLFU cache admission for Genome MCP.
+
+An LRU cache admits every new entry, so a bulk sweep over thousands of genes
+requested once evicts the genes interactive users keep asking for. TinyLFU
+keeps an approximate access frequency of recently seen keys and only admits a
+new entry when it has been requested more often than the entry it would
+evict.
+
+Frequencies are counted in a count-min sketch of small saturating counters
+behind a "doorkeeper" Bloom filter, so keys seen only once never reach the
+sketch. Counters are halved periodically, so the frequencies follow changes
+in popularity.
+"""
+
+from typing import Dict, Hashable, Tuple
+
+_MASK_64 = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15
+
+
+def _key_hashes(key: Hashable) -> Tuple[int, int]:
+    """Derive two 32-bit hashes of a key for double hashing."""
+    mixed = ((hash(key) & _MASK_64) * _MIX) & _MASK_64
+    return mixed >> 32, (mixed & 0xFFFFFFFF) | 1
+
+
+class CountMinSketch:
+    """Approximate frequency counter with 4-bit saturating counters.
+
+    Row ``i`` counts a key at index ``h1 + i * h2`` (double hashing), so one
+    hash of the key serves all rows.
+    """
+
+    MAX_COUNT = 15
+
+    def __init__(self, width: int, depth: int = 4):
+        """
+        Initialize count-min sketch.
+
+        Args:
+            width: Counters per row (rounded up to a power of two)
+            depth: Number of rows
+        """
+        self.width = 1 << max(width - 1, 1).bit_length()
+        self.depth = max(depth, 1)
+        self._mask = self.width - 1
+        self._rows = [bytearray(self.width) for _ in range(self.depth)]
+
+    def increment(self, key: Hashable) -> None:
+        """Count one occurrence of a key."""
+        h1, h2 = _key_hashes(key)
+        for row in self._rows:
+            index = h1 & self._mask
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+            h1 += h2
+
+    def estimate(self, key: Hashable) -> int:
+        """Estimate how often a key occurred (never an underestimate)."""
+        h1, h2 = _key_hashes(key)
+        count = self.MAX_COUNT
+        for row in self._rows:
+            if row[h1 & self._mask] < count:
+                count = row[h1 & self._mask]
+            h1 += h2
+        return count
+
+    def halve(self) -> None:
+        """Halve all counters, aging past occurrences."""
+        for row in self._rows:
+            row[:] = row.translate(_HALVED)
+
+
+# Translation table halving every byte value
+_HALVED = bytes(count >> 1 for count in range(256))
+
+
+class Doorkeeper:
+    """Bloom filter recording whether a key has been seen before."""
+
+    def __init__(self, size: int, hashes: int = 3):
+        """
+        Initialize doorkeeper.
+
+        Args:
+            size: Number of bits (rounded up to a power of two)
+            hashes: Bits set per key
+        """
+        self.size = 1 << max(size - 1, 8).bit_length()
+        self.hashes = max(hashes, 1)
+        self._mask = self.size - 1
+        self._filter = bytearray(self.size // 8)
+
+    def __contains__(self, key: Hashable) -> bool:
+        h2, h1 = _key_hashes(key)
+        for _ in range(self.hashes):
+            index = h1 & self._mask
+            if not self._filter[index >> 3] & (1 << (index & 7)):
+                return False
+            h1 += h2
+        return True
+
+    def add(self, key: Hashable) -> bool:
+        """Record a key; returns whether it had been seen before."""
+        h2, h1 = _key_hashes(key)
+        seen = True
+        for _ in range(self.hashes):
+            index = h1 & self._mask
+            bit = 1 << (index & 7)
+            if not self._filter[index >> 3] & bit:
+                seen = False
+                self._filter[index >> 3] |= bit
+            h1 += h2
+        return seen
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._filter[:] = bytes(len(self._filter))
+
+
+class TinyLFU:
+    """Frequency-based cache admission filter."""
+
+    def __init__(self, capacity: int, sample_factor: int = 10):
+        """
+        Initialize TinyLFU admission filter.
+
+        Args:
+            capacity: Number of entries of the cache being protected
+            sample_factor: Accesses, per cache entry, after which frequencies
+                are halved
+        """
+        self.sample_size = max(capacity, 16) * sample_factor
+        self.sketch = CountMinSketch(width=max(capacity, 16) * 4)
+        # Up to sample_size distinct keys enter the doorkeeper between resets;
+        # 8 bits per key keeps false positives around 3%
+        self.doorkeeper = Doorkeeper(size=self.sample_size * 8)
+        self.additions = 0
+        self.resets = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    def record(self, key: Hashable) -> None:
+        """Record an access to a key."""
+        if self.doorkeeper.add(key):
+            self.sketch.increment(key)
+
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.sketch.halve()
+            self.doorkeeper.clear()
+            self.additions //= 2
+            self.resets += 1
+
+    def estimate(self, key: Hashable) -> int:
+        """Estimate the recent access frequency of a key."""
+        return self.sketch.estimate(key) + (1 if key in self.doorkeeper else 0)
+
+    def admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        """
+        Decide whether a new entry may replace the eviction victim.
+
+        Args:
+            candidate: Key of the entry to insert
+            victim: Key of the entry that would be evicted
+
+        Returns:
+            Whether the candidate was requested more often than the victim
+        """
+        admitted = self.estimate(candidate) > self.estimate(victim)
+        if admitted:
+            self.admitted += 1
+        else:
+            self.rejected += 1
+        return admitted
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get admission statistics."""
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "resets": self.resets,
+            "sketch_width": self.sketch.width,
+        }
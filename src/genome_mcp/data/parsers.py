@@ -7,7 +7,7 @@ from various sources and formats.
 
 import json
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 import structlog
 
@@ -15,6 +15,9 @@ from genome_mcp.exceptions import DataFormatError, ValidationError
 
 logger = structlog.get_logger(__name__)
 
+# Sentinel for missing values in nested lookups
+_MISSING = object()
+
 
 class GenomicDataParser:
     """Parser for genomic data formats."""
@@ -300,6 +303,76 @@ class JSONDataParser:
         except (KeyError, TypeError, AttributeError):
             return default
 
+    @staticmethod
+    def project_fields(data: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+        """
+        Project a dictionary onto a set of fields.
+
+        Args:
+            data: Dictionary to project
+            fields: Dot-separated field paths to keep (e.g., "organism.taxid")
+
+        Returns:
+            New dictionary containing only the requested fields that exist
+        """
+        projected: Dict[str, Any] = {}
+        for field_path in fields:
+            value = JSONDataParser.extract_nested_value(data, field_path, _MISSING)
+            if value is _MISSING:
+                continue
+
+            keys = field_path.split(".")
+            target = projected
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+
+        return projected
+
+    @staticmethod
+    def iter_flatten_dict(
+        data: Dict[str, Any], parent_key: str = "", separator: str = "."
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the flattened key/value pairs of a nested dictionary.
+
+        Nested dictionaries are walked with an explicit stack instead of
+        recursion, so deep payloads do not hit the recursion limit and no
+        intermediate dictionaries are built.
+
+        Args:
+            data: Dictionary to flatten
+            parent_key: Parent key for nested items
+            separator: Separator for nested keys
+
+        Yields:
+            Flattened (key, value) pairs in depth-first order
+        """
+
+        def dict_items(
+            node: Dict[str, Any], prefix: str
+        ) -> Iterator[Tuple[str, Any, bool]]:
+            for key, value in node.items():
+                yield (f"{prefix}{separator}{key}" if prefix else key), value, False
+
+        def list_items(node: List[Any], prefix: str) -> Iterator[Tuple[str, Any, bool]]:
+            for i, item in enumerate(node):
+                yield f"{prefix}[{i}]", item, True
+
+        stack = [dict_items(data, parent_key)]
+        while stack:
+            for key, value, in_list in stack[-1]:
+                if isinstance(value, dict):
+                    stack.append(dict_items(value, key))
+                    break
+                if isinstance(value, list) and not in_list:
+                    # Handle lists by creating indexed keys
+                    stack.append(list_items(value, key))
+                    break
+                yield key, value
+            else:
+                stack.pop()
+
     @staticmethod
     def flatten_dict(
         data: Dict[str, Any], parent_key: str = "", separator: str = "."
@@ -315,35 +388,18 @@ class JSONDataParser:
         Returns:
             Flattened dictionary
         """
-        items = []
-        for key, value in data.items():
-            new_key = f"{parent_key}{separator}{key}" if parent_key else key
-
-            if isinstance(value, dict):
-                items.extend(
-                    JSONDataParser.flatten_dict(value, new_key, separator).items()
-                )
-            elif isinstance(value, list):
-                # Handle lists by creating indexed keys
-                for i, item in enumerate(value):
-                    if isinstance(item, dict):
-                        items.extend(
-                            JSONDataParser.flatten_dict(
-                                item, f"{new_key}[{i}]", separator
-                            ).items()
-                        )
-                    else:
-                        items.append((f"{new_key}[{i}]", item))
-            else:
-                items.append((new_key, value))
-
-        return dict(items)
+        return dict(JSONDataParser.iter_flatten_dict(data, parent_key, separator))
 
     @staticmethod
     def clean_response_data(data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Clean API response data by removing null values and normalizing.
 
+        None values are dropped, as are dictionaries and lists that are empty
+        after cleaning (dictionaries inside lists are kept). The data is walked
+        with an explicit stack, so deep payloads do not hit the recursion
+        limit.
+
         Args:
             data: Raw response data
 
@@ -353,31 +409,63 @@ class JSONDataParser:
         if not isinstance(data, dict):
             return data
 
-        cleaned = {}
-        for key, value in data.items():
-            if value is None:
-                continue
-            elif isinstance(value, dict):
-                cleaned_dict = JSONDataParser.clean_response_data(value)
-                if cleaned_dict:  # Only add if not empty
-                    cleaned[key] = cleaned_dict
-            elif isinstance(value, list):
-                cleaned_list = [
-                    (
-                        JSONDataParser.clean_response_data(item)
-                        if isinstance(item, dict)
-                        else item
-                    )
-                    for item in value
-                    if item is not None
-                ]
-                if cleaned_list:  # Only add if not empty
-                    cleaned[key] = cleaned_list
+        cleaned: Dict[str, Any] = {}
+        # Frames: (remaining items, cleaned container, parent, key in parent);
+        # a finished container is added to its parent if it is not empty
+        stack: List[Tuple[Iterator[Any], Any, Any, Any]] = [
+            (iter(data.items()), cleaned, None, None)
+        ]
+        while stack:
+            items, target, parent, parent_key = stack[-1]
+            if isinstance(target, dict):
+                for key, value in items:
+                    if value is None:
+                        continue
+                    if isinstance(value, dict):
+                        stack.append((iter(value.items()), {}, target, key))
+                        break
+                    if isinstance(value, list):
+                        stack.append((iter(value), [], target, key))
+                        break
+                    target[key] = value
+                else:
+                    stack.pop()
+                    if parent is not None and target:
+                        parent[parent_key] = target
             else:
-                cleaned[key] = value
+                for item in items:
+                    if item is None:
+                        continue
+                    if isinstance(item, dict):
+                        # Dictionaries inside lists are kept even when empty
+                        item_cleaned: Dict[str, Any] = {}
+                        target.append(item_cleaned)
+                        stack.append((iter(item.items()), item_cleaned, None, None))
+                        break
+                    target.append(item)
+                else:
+                    stack.pop()
+                    if target:
+                        parent[parent_key] = target
 
         return cleaned
 
+    @staticmethod
+    def iter_clean_response_data(records: Iterable[Any]) -> Iterator[Any]:
+        """
+        Clean a stream of response records one at a time.
+
+        Args:
+            records: Iterable of raw records, e.g. decoded NDJSON lines or the
+                documents of an esummary response
+
+        Yields:
+            Cleaned records, skipping null records
+        """
+        for record in records:
+            if record is not None:
+                yield JSONDataParser.clean_response_data(record)
+
 
 class BatchProcessor:
     """Utility for processing batch operations."""
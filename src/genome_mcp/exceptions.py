@@ -359,6 +359,45 @@ class ResourceError(GenomeMCPError):
             self.details["resource_id"] = resource_id
 
 
+class ServerOverloadedError(GenomeMCPError):
+    """Exception raised when a request is shed by admission control."""
+
+    def __init__(
+        self,
+        message: str,
+        reason: Optional[str] = None,
+        in_flight: Optional[int] = None,
+        queued: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize server overloaded error.
+
+        Args:
+            message: Error message
+            reason: Why the request was rejected (e.g., 'queue_full', 'queue_timeout')
+            in_flight: Number of requests executing when rejected
+            queued: Number of requests waiting when rejected
+            retry_after: Suggested seconds to wait before retrying
+            **kwargs: Additional arguments passed to parent class
+        """
+        super().__init__(message, error_code="SERVER_OVERLOADED", **kwargs)
+        self.reason = reason
+        self.in_flight = in_flight
+        self.queued = queued
+        self.retry_after = retry_after
+
+        if reason:
+            self.details["reason"] = reason
+        if in_flight is not None:
+            self.details["in_flight"] = in_flight
+        if queued is not None:
+            self.details["queued"] = queued
+        if retry_after is not None:
+            self.details["retry_after"] = retry_after
+
+
 class BatchProcessingError(GenomeMCPError):
     """Exception raised for batch processing errors."""
 
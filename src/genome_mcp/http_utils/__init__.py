@@ -13,6 +13,9 @@ from urllib.parse import urljoin, urlparse
 import aiohttp
 import structlog
 
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.core.offload import ParseOffloader
+from genome_mcp.core.response_cache import ResponseCache
 from genome_mcp.exceptions import (
     APIError,
     AuthenticationError,
@@ -35,6 +38,8 @@ class HTTPClient:
         retry_delay: float = 1.0,
         user_agent: str = "Genome-MCP/1.0.0",
         api_key: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
+        parse_offloader: Optional[ParseOffloader] = None,
     ):
         """
         Initialize HTTP client.
@@ -46,6 +51,9 @@ class HTTPClient:
             retry_delay: Delay between retries in seconds
             user_agent: User agent string
             api_key: Optional API key for authentication
+            response_cache: Optional cache for raw GET response bodies
+            parse_offloader: Optional offloader decoding large response
+                bodies off the event loop
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
@@ -53,6 +61,8 @@ class HTTPClient:
         self.retry_delay = retry_delay
         self.user_agent = user_agent
         self.api_key = api_key
+        self.response_cache = response_cache
+        self.parse_offloader = parse_offloader
         self.session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
@@ -116,10 +126,36 @@ class HTTPClient:
                     pass
         return None
 
+    @staticmethod
+    def _decode_body(body: bytes) -> Dict[str, Any]:
+        """Decode a raw response body, falling back to raw text."""
+        try:
+            document: Dict[str, Any] = json_codec.loads(body)
+            return document
+        except ValueError:
+            return {"data": body.decode("utf-8", errors="replace")}
+
+    async def _decode(self, body: bytes) -> Dict[str, Any]:
+        """Decode a raw response body, off the event loop if it is large."""
+        if self.parse_offloader is None:
+            return self._decode_body(body)
+        document: Dict[str, Any] = await self.parse_offloader.run(
+            self._decode_body, body, size=len(body)
+        )
+        return document
+
     async def _make_request(
         self, method: str, endpoint: str, **kwargs
     ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic."""
+        """Make HTTP request with retry logic.
+
+        Returns the decoded JSON response, or the raw text if it is not JSON.
+        """
+        body = await self._request_body(method, endpoint, **kwargs)
+        return await self._decode(body)
+
+    async def _request_body(self, method: str, endpoint: str, **kwargs: Any) -> bytes:
+        """Make HTTP request with retry logic and return the raw response body."""
         url = self._build_url(endpoint)
 
         for attempt in range(self.max_retries + 1):
@@ -165,12 +201,8 @@ class HTTPClient:
                             response_data={"response": response_text},
                         )
 
-                    # Parse successful response
-                    try:
-                        return await response.json()
-                    except ValueError:
-                        # Return raw text if JSON parsing fails
-                        return {"data": await response.text()}
+                    body: bytes = await response.read()
+                    return body
 
             except asyncio.TimeoutError:
                 if attempt < self.max_retries:
@@ -212,8 +244,43 @@ class HTTPClient:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        """Make GET request."""
-        return await self._make_request("GET", endpoint, params=params, headers=headers)
+        """Make GET request.
+
+        With a response cache, the raw response body is cached, so hot
+        upstream documents are not refetched. Only the most recently read
+        documents are also kept decoded; they are shared between callers and
+        must not be modified.
+        """
+        if self.response_cache is None:
+            return await self._make_request(
+                "GET", endpoint, params=params, headers=headers
+            )
+
+        cache_key = self._build_url(endpoint)
+        if params:
+            cache_key += "?" + json_codec.dumps_str(params, sort_keys=True)
+
+        document: Optional[Dict[str, Any]] = self.response_cache.get_decoded(cache_key)
+        if document is not None:
+            return document
+
+        body = self.response_cache.get(cache_key)
+        if body is None:
+            body = await self.get_raw(endpoint, params=params, headers=headers)
+            self.response_cache.set(cache_key, body)
+
+        document = await self._decode(body)
+        self.response_cache.set_decoded(cache_key, document)
+        return document
+
+    async def get_raw(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """Make GET request and return the raw response body."""
+        return await self._request_body("GET", endpoint, params=params, headers=headers)
 
     async def post(
         self,
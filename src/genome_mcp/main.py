@@ -6,42 +6,112 @@ A FastMCP-based server that provides unified access to genomic databases
 through the Model Context Protocol interface.
 """
 
+import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from genome_mcp.configuration import get_config
+from genome_mcp.core import ProgressCallback, progress_reporting
+from genome_mcp.exceptions import GenomeMCPError, ValidationError
+from genome_mcp.servers.bulk import FILE_FORMATS, process_bulk_file, resolve_bulk_path
+from genome_mcp.servers.jobs import BatchJobManager
 from genome_mcp.servers.ncbi.gene import NCBIGeneServer
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Shut the gene server down while the MCP event loop is still running."""
+    try:
+        yield {}
+    finally:
+        await shutdown_server()
+
+
 # Create FastMCP server instance
 mcp = FastMCP(
     name="Genome MCP Server",
     version="0.1.5",
     instructions="Genomic data MCP server for NCBI Gene database access",
+    lifespan=_lifespan,
 )
 
 # Global server instance
 _gene_server: Optional[NCBIGeneServer] = None
+_job_manager: Optional[BatchJobManager] = None
+
+# Cache snapshot path given on the command line
+_cache_snapshot_path: Optional[str] = None
 
 
 async def initialize_server() -> None:
-    """Initialize the NCBI Gene server."""
-    global _gene_server
+    """Initialize the NCBI Gene server and resume pending batch jobs."""
+    global _gene_server, _job_manager
     if _gene_server is None:
         try:
             config = get_config()
+            if _cache_snapshot_path:
+                config.cache.snapshot_path = _cache_snapshot_path
             _gene_server = NCBIGeneServer(config)
             await _gene_server.start()
             logging.info("NCBI Gene server initialized successfully")
+
+            if config.jobs.enabled:
+                _job_manager = BatchJobManager(_gene_server, config.jobs)
+                await _job_manager.start()
         except Exception as e:
             logging.error(f"Failed to initialize NCBI Gene server: {e}")
             raise
 
 
+async def shutdown_server() -> None:
+    """Stop batch jobs and the gene server, saving and closing its caches.
+
+    Running jobs are left resumable from their checkpoints.
+    """
+    global _gene_server, _job_manager
+    if _job_manager is not None:
+        await _job_manager.stop()
+        _job_manager = None
+    if _gene_server is not None:
+        await _gene_server.stop()
+        _gene_server = None
+
+
+async def _get_job_manager() -> BatchJobManager:
+    """Get the batch job manager, initializing the server if needed."""
+    await initialize_server()
+    if _job_manager is None:
+        raise RuntimeError("Batch jobs are disabled")
+    return _job_manager
+
+
+def _progress_callback(ctx: Optional[Context]) -> Optional[ProgressCallback]:
+    """Get the callback that sends MCP progress notifications for a request."""
+    return ctx.report_progress if ctx is not None else None
+
+
+def _client_id(ctx: Optional[Context]) -> Optional[str]:
+    """Get the MCP session id used for per-client fair queuing."""
+    if ctx is None:
+        return None
+    try:
+        return ctx.session_id
+    except RuntimeError:
+        return None
+
+
 @mcp.tool()
 async def get_gene_info(
-    gene_id: str, species: str = "human", include_summary: bool = True
+    gene_id: str,
+    species: str = "human",
+    include_summary: bool = True,
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Get detailed information about a specific gene.
@@ -50,6 +120,8 @@ async def get_gene_info(
         gene_id: Gene ID (e.g., TP53)
         species: Species name (default: human)
         include_summary: Include gene summary text (default: True)
+        fields: esummary fields to return, e.g. ["name", "chromosome"]
+            (default: compact field set, ["*"] for the full document)
 
     Returns:
         Dictionary containing gene information
@@ -61,14 +133,21 @@ async def get_gene_info(
         "gene_id": gene_id,
         "species": species,
         "include_summary": include_summary,
+        "fields": fields,
     }
-    result = await _gene_server.execute_request("get_gene_info", params)
+    result = await _gene_server.execute_request(
+        "get_gene_info", params, client_id=_client_id(ctx)
+    )
     return result or {}
 
 
 @mcp.tool()
 async def search_genes(
-    term: str, species: str = "human", max_results: int = 20
+    term: str,
+    species: str = "human",
+    max_results: int = 20,
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Search for genes by term.
@@ -77,6 +156,8 @@ async def search_genes(
         term: Search term
         species: Species name (default: human)
         max_results: Maximum number of results (default: 20)
+        fields: esummary fields to return, e.g. ["name", "chromosome"]
+            (default: compact field set, ["*"] for the full document)
 
     Returns:
         Dictionary containing search results
@@ -84,14 +165,24 @@ async def search_genes(
     await initialize_server()
     if _gene_server is None:
         raise RuntimeError("Gene server not initialized")
-    params = {"term": term, "species": species, "max_results": max_results}
-    result = await _gene_server.execute_request("search_genes", params)
+    params = {
+        "term": term,
+        "species": species,
+        "max_results": max_results,
+        "fields": fields,
+    }
+    result = await _gene_server.execute_request(
+        "search_genes", params, client_id=_client_id(ctx)
+    )
     return result or {}
 
 
 @mcp.tool()
 async def batch_gene_info(
-    gene_ids: List[str], species: str = "human"
+    gene_ids: List[str],
+    species: str = "human",
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Get information for multiple genes in batch.
@@ -99,6 +190,8 @@ async def batch_gene_info(
     Args:
         gene_ids: List of gene IDs
         species: Species name (default: human)
+        fields: esummary fields to return, e.g. ["name", "chromosome"]
+            (default: compact field set, ["*"] for the full document)
 
     Returns:
         Dictionary containing batch results
@@ -106,14 +199,22 @@ async def batch_gene_info(
     await initialize_server()
     if _gene_server is None:
         raise RuntimeError("Gene server not initialized")
-    params = {"gene_ids": gene_ids, "species": species}
-    result = await _gene_server.execute_request("batch_gene_info", params)
+    params = {"gene_ids": gene_ids, "species": species, "fields": fields}
+    with progress_reporting(_progress_callback(ctx)):
+        result = await _gene_server.execute_request(
+            "batch_gene_info", params, client_id=_client_id(ctx)
+        )
     return result or {}
 
 
 @mcp.tool()
 async def search_by_region(
-    chromosome: str, start: int, end: int, species: str = "human"
+    chromosome: str,
+    start: int,
+    end: int,
+    species: str = "human",
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Search for genes in a genomic region.
@@ -123,6 +224,8 @@ async def search_by_region(
         start: Start position
         end: End position
         species: Species name (default: human)
+        fields: esummary fields to return, e.g. ["name", "chromosome"]
+            (default: compact field set, ["*"] for the full document)
 
     Returns:
         Dictionary containing genes in the region
@@ -130,14 +233,26 @@ async def search_by_region(
     await initialize_server()
     if _gene_server is None:
         raise RuntimeError("Gene server not initialized")
-    params = {"chromosome": chromosome, "start": start, "end": end, "species": species}
-    result = await _gene_server.execute_request("search_by_region", params)
+    params = {
+        "chromosome": chromosome,
+        "start": start,
+        "end": end,
+        "species": species,
+        "fields": fields,
+    }
+    result = await _gene_server.execute_request(
+        "search_by_region", params, client_id=_client_id(ctx)
+    )
     return result or {}
 
 
 @mcp.tool()
 async def search_by_region_enhanced(
-    region: str, species: str = "human", max_results: int = 50
+    region: str,
+    species: str = "human",
+    max_results: int = 50,
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Search for genes in a genomic region using standard formats.
@@ -150,6 +265,8 @@ async def search_by_region_enhanced(
         region: Genomic region string (e.g., "chr1:1000-2000", "chr1[1000-2000]")
         species: Species name (default: human)
         max_results: Maximum number of results (default: 50)
+        fields: esummary fields to return, e.g. ["name", "chromosome"]
+            (default: compact field set, ["*"] for the full document)
 
     Returns:
         Dictionary containing genes in the region
@@ -157,14 +274,24 @@ async def search_by_region_enhanced(
     await initialize_server()
     if _gene_server is None:
         raise RuntimeError("Gene server not initialized")
-    params = {"region": region, "species": species, "max_results": max_results}
-    result = await _gene_server.execute_request("search_by_region_enhanced", params)
+    params = {
+        "region": region,
+        "species": species,
+        "max_results": max_results,
+        "fields": fields,
+    }
+    result = await _gene_server.execute_request(
+        "search_by_region_enhanced", params, client_id=_client_id(ctx)
+    )
     return result or {}
 
 
 @mcp.tool()
 async def get_gene_homologs(
-    gene_id: str, species: str = "human", target_species: Optional[str] = None
+    gene_id: str,
+    species: str = "human",
+    target_species: Optional[str] = None,
+    ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Get gene homologs across species.
@@ -181,7 +308,9 @@ async def get_gene_homologs(
     if _gene_server is None:
         raise RuntimeError("Gene server not initialized")
     params = {"gene_id": gene_id, "species": species, "target_species": target_species}
-    result = await _gene_server.execute_request("get_gene_homologs", params)
+    result = await _gene_server.execute_request(
+        "get_gene_homologs", params, client_id=_client_id(ctx)
+    )
     return result or {}
 
 
@@ -191,6 +320,7 @@ async def batch_gene_homologs(
     source_species: str = "human",
     target_species: Optional[List[str]] = None,
     max_batch_size: int = 25,
+    ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Get homologs for multiple genes in batch.
@@ -213,10 +343,277 @@ async def batch_gene_homologs(
         "target_species": target_species,
         "max_batch_size": max_batch_size,
     }
-    result = await _gene_server.execute_request("batch_gene_homologs", params)
+    with progress_reporting(_progress_callback(ctx)):
+        result = await _gene_server.execute_request(
+            "batch_gene_homologs", params, client_id=_client_id(ctx)
+        )
     return result or {}
 
 
+@mcp.tool()
+async def submit_batch_job(
+    operation: str,
+    gene_ids: List[str],
+    species: str = "human",
+    target_species: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """
+    Submit a large batch operation as a resumable background job.
+
+    Args:
+        operation: "batch_gene_info" or "batch_gene_homologs"
+        gene_ids: List of gene IDs or symbols to process
+        species: Species name (source species for homologs, default: human)
+        target_species: Target species filter for homologs (optional)
+
+    Returns:
+        Job status including the job_id used to poll progress and fetch results
+    """
+    manager = await _get_job_manager()
+    params = _batch_params(operation, species, target_species)
+    return await manager.submit(operation, gene_ids, params, _client_id(ctx))
+
+
+@mcp.tool()
+async def get_batch_job_status(job_id: str) -> Dict[str, Any]:
+    """
+    Get progress of a background batch job.
+
+    Args:
+        job_id: Job ID returned by submit_batch_job
+
+    Returns:
+        Job status with completed/total counts and progress fraction
+    """
+    manager = await _get_job_manager()
+    return manager.get_status(job_id)
+
+
+@mcp.tool()
+async def get_batch_job_results(
+    job_id: str, offset: int = 0, limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Fetch a page of results of a background batch job.
+
+    Args:
+        job_id: Job ID returned by submit_batch_job
+        offset: Index of the first result (default: 0)
+        limit: Maximum number of results (default: configured page size)
+
+    Returns:
+        Page of per-gene results and the next_offset to continue from
+    """
+    manager = await _get_job_manager()
+    return manager.get_results(job_id, offset, limit)
+
+
+@mcp.tool()
+async def cancel_batch_job(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a pending or running background batch job.
+
+    Args:
+        job_id: Job ID returned by submit_batch_job
+
+    Returns:
+        Final job status
+    """
+    manager = await _get_job_manager()
+    return await manager.cancel(job_id)
+
+
+def _require_admin_tools() -> NCBIGeneServer:
+    """Get the gene server, unless cache administration tools are disabled."""
+    if _gene_server is None:
+        raise RuntimeError("Gene server not initialized")
+    if not _gene_server.config.server.admin_tools:
+        raise ValidationError(
+            "Cache administration tools are disabled; set server.admin_tools "
+            "to enable them",
+            field_name="server.admin_tools",
+        )
+    return _gene_server
+
+
+@mcp.tool()
+async def save_cache_snapshot(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Save the result cache to a snapshot file (admin).
+
+    Requires server.admin_tools.
+
+    Args:
+        path: Snapshot file in the directory of the configured
+            cache.snapshot_path (default: cache.snapshot_path)
+
+    Returns:
+        Snapshot path, number of entries and file size
+    """
+    await initialize_server()
+    return _require_admin_tools().save_cache_snapshot(path)
+
+
+@mcp.tool()
+async def load_cache_snapshot(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Restore the result cache from a snapshot file (admin).
+
+    Requires server.admin_tools.
+
+    Args:
+        path: Snapshot file in the directory of the configured
+            cache.snapshot_path (default: cache.snapshot_path)
+
+    Returns:
+        Snapshot path and the numbers of restored and expired entries
+    """
+    await initialize_server()
+    return _require_admin_tools().load_cache_snapshot(path)
+
+
+@mcp.tool()
+async def invalidate_cache(
+    namespace: Optional[str] = None,
+    gene_id: Optional[str] = None,
+    uid: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Invalidate cached results (admin).
+
+    At least one selector is required; when several are given, only results
+    matching the namespace and mentioning the gene or UID are removed.
+    Requires server.admin_tools.
+
+    Args:
+        namespace: Operation whose results to invalidate (e.g. search_genes)
+        gene_id: Gene symbol or ID whose results to invalidate (e.g. TP53)
+        uid: NCBI Gene UID whose results to invalidate (e.g. 7157)
+
+    Returns:
+        Number of cached results and raw responses removed
+    """
+    await initialize_server()
+    server = _require_admin_tools()
+    return server.invalidate(namespace=namespace, gene_id=gene_id, uid=uid)
+
+
+def _batch_params(
+    operation: str, species: str, target_species: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build batch operation parameters for job and bulk entry points."""
+    if operation == "batch_gene_homologs":
+        return {"source_species": species, "target_species": target_species}
+    return {"species": species}
+
+
+@mcp.tool()
+async def process_gene_file(
+    input_path: str,
+    output_path: str,
+    operation: str = "batch_gene_info",
+    species: str = "human",
+    target_species: Optional[List[str]] = None,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """
+    Stream gene IDs from a file through a batch operation into a result file.
+
+    Memory use is constant regardless of file size: gene IDs are read and
+    results are written chunk by chunk. Files must be in the configured
+    bulk.base_dir; without one, bulk files can only be processed from the
+    command line.
+
+    Args:
+        input_path: NDJSON or TSV file of gene IDs, relative to bulk.base_dir
+        output_path: NDJSON or TSV file to write per-gene results to, relative
+            to bulk.base_dir
+        operation: "batch_gene_info" or "batch_gene_homologs"
+        species: Species name (source species for homologs, default: human)
+        target_species: Target species filter for homologs (optional)
+        input_format: "ndjson" or "tsv" (default: from file extension)
+        output_format: "ndjson" or "tsv" (default: from file extension)
+
+    Returns:
+        Summary with result counts and elapsed time
+    """
+    await initialize_server()
+    if _gene_server is None:
+        raise RuntimeError("Gene server not initialized")
+    base_dir = _gene_server.config.bulk.base_dir
+    if not base_dir:
+        raise ValidationError(
+            "process_gene_file is disabled; set bulk.base_dir to enable it",
+            field_name="bulk.base_dir",
+        )
+    with progress_reporting(_progress_callback(ctx)):
+        return await process_bulk_file(
+            _gene_server,
+            operation,
+            resolve_bulk_path(input_path, base_dir),
+            resolve_bulk_path(output_path, base_dir),
+            _batch_params(operation, species, target_species),
+            input_format,
+            output_format,
+            client_id=_client_id(ctx),
+        )
+
+
+async def _run_bulk(args: Any) -> Dict[str, Any]:
+    """Run bulk file processing from the command line."""
+    await initialize_server()
+    assert _gene_server is not None
+    try:
+        return await process_bulk_file(
+            _gene_server,
+            args.operation,
+            args.bulk_input,
+            args.bulk_output,
+            _batch_params(args.operation, args.species),
+            args.input_format,
+            args.output_format,
+        )
+    finally:
+        await shutdown_server()
+
+
+def _run_cache_snapshot(args: Any) -> Dict[str, Any]:
+    """Save or load a snapshot of the disk cache tier from the command line.
+
+    Only the tiered backend keeps results between runs, so the server is
+    not started: the snapshot is taken from or restored into its disk tier.
+    """
+    config = get_config()
+    if config.cache.backend != "tiered":
+        raise ValidationError(
+            "Offline cache snapshots require cache.backend = 'tiered'",
+            field_name="cache.backend",
+            field_value=config.cache.backend,
+        )
+    config.cache.snapshot_path = args.save_cache_snapshot or args.load_cache_snapshot
+    server = NCBIGeneServer(config)
+    try:
+        if args.save_cache_snapshot:
+            return server.save_cache_snapshot()
+        return server.load_cache_snapshot()
+    finally:
+        # Closing the tiered cache writes restored entries to disk
+        server.cache.close()
+
+
+def _shutdown_on_exit() -> None:
+    """Stop the gene server if it outlived the MCP server loop."""
+    if _gene_server is None and _job_manager is None:
+        return
+    try:
+        asyncio.run(shutdown_server())
+    except Exception as e:
+        logging.error(f"Failed to stop gene server: {e}")
+
+
 def main() -> None:
     """Main entry point for the MCP server."""
     import argparse
@@ -240,15 +637,72 @@ def main() -> None:
         help="Port for HTTP transports (default: 8080)",
     )
 
+    parser.add_argument(
+        "--cache-snapshot",
+        metavar="PATH",
+        help="Load the result cache from this snapshot at startup and save it "
+        "there at shutdown",
+    )
+
+    snapshot = parser.add_mutually_exclusive_group()
+    snapshot.add_argument(
+        "--save-cache-snapshot",
+        metavar="PATH",
+        help="Save the disk cache tier to this snapshot and exit",
+    )
+    snapshot.add_argument(
+        "--load-cache-snapshot",
+        metavar="PATH",
+        help="Load this snapshot into the disk cache tier and exit",
+    )
+
+    bulk = parser.add_argument_group(
+        "bulk mode", "Process a gene ID file instead of running the server"
+    )
+    bulk.add_argument("--bulk-input", help="NDJSON or TSV file of gene IDs")
+    bulk.add_argument("--bulk-output", help="NDJSON or TSV file to write results")
+    bulk.add_argument(
+        "--operation",
+        choices=list(NCBIGeneServer.BATCH_OPERATIONS),
+        default="batch_gene_info",
+        help="Batch operation to run (default: batch_gene_info)",
+    )
+    bulk.add_argument(
+        "--species", default="human", help="Species name (default: human)"
+    )
+    bulk.add_argument("--input-format", choices=FILE_FORMATS, help="Input format")
+    bulk.add_argument("--output-format", choices=FILE_FORMATS, help="Output format")
+
     args = parser.parse_args()
 
+    global _cache_snapshot_path
+    _cache_snapshot_path = args.cache_snapshot
+
+    if args.save_cache_snapshot or args.load_cache_snapshot:
+        try:
+            summary = _run_cache_snapshot(args)
+        except GenomeMCPError as e:
+            parser.error(str(e))
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+        return
+
+    if args.bulk_input or args.bulk_output:
+        if not (args.bulk_input and args.bulk_output):
+            parser.error("--bulk-input and --bulk-output must be used together")
+        summary = asyncio.run(_run_bulk(args))
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+        return
+
     # Run the server with the specified transport
-    if args.transport == "stdio":
-        mcp.run(transport="stdio")
-    elif args.transport == "sse":
-        mcp.run(transport="sse", host=args.host, port=args.port)
-    elif args.transport == "streamable-http":
-        mcp.run(transport="streamable-http", host=args.host, port=args.port)
+    try:
+        if args.transport == "stdio":
+            mcp.run(transport="stdio")
+        elif args.transport == "sse":
+            mcp.run(transport="sse", host=args.host, port=args.port)
+        elif args.transport == "streamable-http":
+            mcp.run(transport="streamable-http", host=args.host, port=args.port)
+    finally:
+        _shutdown_on_exit()
 
 
 if __name__ == "__main__":
@@ -7,19 +7,57 @@ This module provides the base functionality for all MCP servers in the Genome MC
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 import structlog
 
 from genome_mcp.configuration import GenomeMCPConfig, get_config
-from genome_mcp.core import generate_cache_key, log_execution_time
+from genome_mcp.core import (
+    AdmissionController,
+    CompactRecordCodec,
+    CompressedCodec,
+    ContentAddressedCodec,
+    DiskCache,
+    LoopLagMonitor,
+    MemoryPressureMonitor,
+    ParseOffloader,
+    PriorityScheduler,
+    ProgressTracker,
+    ResponseCache,
+    ResultCache,
+    Shrinkable,
+    TieredResultCache,
+    TinyLFU,
+    ValueCodec,
+    canonical_cache_key,
+    generate_cache_key,
+    iter_chunks,
+    load_snapshot,
+    log_execution_time,
+    pipeline_chunks,
+    save_snapshot,
+)
 from genome_mcp.exceptions import (
     GenomeMCPError,
+    ServerOverloadedError,
     ValidationError,
     create_error_from_exception,
 )
 from genome_mcp.http_utils import HTTPClient, RateLimiter
+from genome_mcp.servers.warmer import CacheWarmer
 
 logger = structlog.get_logger(__name__)
 
@@ -61,6 +99,14 @@ class ServerStats:
     rate_limit_hits: int = 0
     concurrent_requests: int = 0
 
+    # Admission control stats
+    requests_rejected: int = 0
+    requests_degraded: int = 0
+    avg_queue_wait: float = 0.0
+
+    # Batch stats
+    batch_duplicates: int = 0
+
     # Data transfer stats
     bytes_sent: int = 0
     bytes_received: int = 0
@@ -91,10 +137,44 @@ class ServerStats:
         self.requests_total += 1
         self.requests_failed += 1
 
+    def update_queue_wait(self, wait_time: float) -> None:
+        """Update average time spent waiting for admission."""
+        alpha = 0.1
+        self.avg_queue_wait = alpha * wait_time + (1 - alpha) * self.avg_queue_wait
+
+
+@dataclass
+class ClientStats:
+    """Per-client (MCP session) statistics."""
+
+    requests_total: int = 0
+    requests_success: int = 0
+    requests_failed: int = 0
+    requests_rejected: int = 0
+    cache_hits: int = 0
+    in_flight: int = 0
+    avg_queue_wait: float = 0.0
+    last_seen: float = field(default_factory=time.time)
+
+    def update_queue_wait(self, wait_time: float) -> None:
+        """Update average time spent waiting for admission and scheduling."""
+        alpha = 0.1
+        self.avg_queue_wait = alpha * wait_time + (1 - alpha) * self.avg_queue_wait
+
+
+DEFAULT_CLIENT_ID = "anonymous"
+
 
 class BaseMCPServer(ABC):
     """Base class for all MCP servers."""
 
+    # Default values of optional parameters by operation; parameters equal to
+    # their default are left out of cache keys
+    CACHE_KEY_DEFAULTS: Dict[str, Dict[str, Any]] = {}
+
+    # Functions normalizing parameter values in cache keys, by parameter name
+    CACHE_KEY_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {}
+
     def __init__(self, config: Optional[GenomeMCPConfig] = None):
         """Initialize the base server.
 
@@ -103,9 +183,17 @@ class BaseMCPServer(ABC):
         """
         self.config = config or get_config()
         self.stats = ServerStats()
+        self.client_stats: "OrderedDict[str, ClientStats]" = OrderedDict()
         self._http_client: Optional[HTTPClient] = None
         self._rate_limiter: Optional[RateLimiter] = None
-        self._cache: Optional[Dict[str, Any]] = None
+        self._admission_controllers: Dict[str, AdmissionController] = {}
+        self._batch_slots: Dict[str, asyncio.Semaphore] = {}
+        self._scheduler: Optional[PriorityScheduler] = None
+        self._cache: Optional[ResultCache] = None
+        self._parse_offloader: Optional[ParseOffloader] = None
+        self._loop_lag_monitor: Optional[LoopLagMonitor] = None
+        self._cache_warmer: Optional[CacheWarmer] = None
+        self._memory_monitor: Optional[MemoryPressureMonitor] = None
         self._running = False
         self._shutdown_event = asyncio.Event()
 
@@ -130,14 +218,34 @@ class BaseMCPServer(ABC):
     def http_client(self) -> HTTPClient:
         """Get HTTP client instance."""
         if self._http_client is None:
+            response_cache = None
+            if self.config.enable_caching and self.config.cache.raw_responses:
+                response_cache = ResponseCache(
+                    max_size=self.config.cache.max_size,
+                    ttl=self.config.cache.ttl,
+                    decoded_size=self.config.cache.raw_decoded_entries,
+                )
             self._http_client = HTTPClient(
                 base_url=self._get_base_url(),
                 timeout=self.config.api.timeout,
                 max_retries=self.config.api.retry_attempts,
                 user_agent=self.config.api.user_agent,
+                response_cache=response_cache,
+                parse_offloader=self.parse_offloader,
             )
         return self._http_client
 
+    @property
+    def parse_offloader(self) -> ParseOffloader:
+        """Get parse offloader instance."""
+        if self._parse_offloader is None:
+            self._parse_offloader = ParseOffloader(
+                threshold=self.config.parsing.offload_threshold,
+                executor=self.config.parsing.executor,
+                max_workers=self.config.parsing.max_workers,
+            )
+        return self._parse_offloader
+
     @property
     def rate_limiter(self) -> RateLimiter:
         """Get rate limiter instance."""
@@ -150,6 +258,126 @@ class BaseMCPServer(ABC):
             )
         return self._rate_limiter
 
+    def _lane_slots(self, lane: str) -> int:
+        """Get the number of in-flight requests allowed in a lane.
+
+        Unless configured per lane, max_in_flight is split across lanes by
+        lane weight, with at least one slot per lane.
+        """
+        admission = self.config.admission
+        if lane in admission.lane_max_in_flight:
+            return admission.lane_max_in_flight[lane]
+        weights = self.config.scheduling.lane_weights
+        share = admission.max_in_flight * weights.get(lane, 1) // sum(weights.values())
+        return max(1, share)
+
+    def admission_controller(self, lane: str) -> Optional[AdmissionController]:
+        """Get the admission controller of a lane, or None if disabled.
+
+        Every lane has its own slots, so a large batch in one lane never
+        takes the slots of interactive requests in another.
+        """
+        if not self.config.admission.enabled:
+            return None
+        controller = self._admission_controllers.get(lane)
+        if controller is None:
+            controller = AdmissionController(
+                max_in_flight=self._lane_slots(lane),
+                max_queue_size=self.config.admission.max_queue_size,
+                max_queue_wait=self.config.admission.max_queue_wait,
+                default_client=DEFAULT_CLIENT_ID,
+            )
+            self._admission_controllers[lane] = controller
+        return controller
+
+    @property
+    def scheduler(self) -> Optional[PriorityScheduler]:
+        """Get priority lane scheduler instance, or None if disabled."""
+        if self._scheduler is None and self.config.scheduling.enabled:
+            self._scheduler = PriorityScheduler(
+                lane_weights=self.config.scheduling.lane_weights,
+                default_lane=self.config.scheduling.default_lane,
+                default_client=DEFAULT_CLIENT_ID,
+            )
+        return self._scheduler
+
+    def _resolve_lane(self, operation: str, lane: Optional[str] = None) -> str:
+        """Resolve the scheduling lane for an operation."""
+        scheduling = self.config.scheduling
+        lane = lane or scheduling.tool_lanes.get(operation, scheduling.default_lane)
+        if lane not in scheduling.lane_weights:
+            raise ValidationError(
+                f"Unknown scheduling lane: {lane}",
+                field_name="lane",
+                field_value=lane,
+            )
+        return lane
+
+    def _get_client_stats(self, client_id: str) -> ClientStats:
+        """Get statistics for a client, tracking at most max_tracked_clients."""
+        client = self.client_stats.get(client_id)
+        if client is None:
+            client = ClientStats()
+            self.client_stats[client_id] = client
+            max_clients = self.config.scheduling.max_tracked_clients
+            if len(self.client_stats) > max_clients:
+                for stale_id in list(self.client_stats):
+                    if len(self.client_stats) <= max_clients:
+                        break
+                    if self.client_stats[stale_id].in_flight == 0:
+                        del self.client_stats[stale_id]
+        else:
+            self.client_stats.move_to_end(client_id)
+        client.last_seen = time.time()
+        return client
+
+    async def _admit(self, client_id: str, client: ClientStats, lane: str) -> float:
+        """Apply per-client quota and lane admission control to a request.
+
+        Requests count toward their client's quota from the moment they are
+        queued, so queued requests cannot exceed it.
+        """
+        client_limit = self.config.scheduling.client_max_in_flight
+        if client_limit and client.in_flight >= client_limit:
+            raise ServerOverloadedError(
+                f"Client {client_id} exceeded its quota of "
+                f"{client_limit} in-flight requests",
+                reason="client_quota",
+                in_flight=client.in_flight,
+            )
+
+        client.in_flight += 1
+        admission = self.admission_controller(lane)
+        if admission is None:
+            return 0.0
+        try:
+            return await admission.acquire(client_id)
+        except BaseException:
+            client.in_flight -= 1
+            raise
+
+    async def _acquire_upstream(self, lane: str, client_id: str) -> float:
+        """Wait for the rate limiter, ordered by priority lane and client.
+
+        Returns:
+            Seconds spent waiting for the scheduler turn
+        """
+        scheduler = self.scheduler
+        if scheduler is None:
+            await self.rate_limiter.acquire()
+            return 0.0
+
+        async with scheduler.turn(lane, client_id) as turn_wait:
+            await self.rate_limiter.acquire()
+        return turn_wait
+
+    def _release(self, client: ClientStats, lane: str) -> None:
+        """Release resources held by an admitted request."""
+        client.in_flight -= 1
+        admission = self._admission_controllers.get(lane)
+        if admission is not None:
+            admission.release()
+
     @abstractmethod
     def _get_base_url(self) -> str:
         """Get base URL for the service. Must be implemented by subclasses."""
@@ -164,6 +392,41 @@ class BaseMCPServer(ABC):
         self._running = True
         self._shutdown_event.clear()
 
+        if self.config.parsing.loop_lag_interval > 0:
+            self._loop_lag_monitor = LoopLagMonitor(
+                self.config.parsing.loop_lag_interval
+            )
+            self._loop_lag_monitor.start()
+
+        memory = self.config.memory
+        if memory.max_rss_mb > 0:
+            self._memory_monitor = MemoryPressureMonitor(
+                memory.max_rss_mb,
+                self._shrinkable_caches,
+                high_watermark=memory.high_watermark,
+                shrink_fraction=memory.shrink_fraction,
+                interval=memory.check_interval,
+                low_watermark=memory.low_watermark,
+                min_entries=memory.min_entries,
+                max_backoff=memory.max_backoff,
+            )
+            self._memory_monitor.start()
+
+        snapshot_path = self.config.cache.snapshot_path
+        if (
+            self.config.enable_caching
+            and snapshot_path
+            and Path(snapshot_path).expanduser().exists()
+        ):
+            try:
+                self.load_cache_snapshot()
+            except GenomeMCPError as e:
+                self.logger.warning("Starting with a cold cache", error=str(e))
+
+        if self.config.enable_caching and self.config.warmer.enabled:
+            self._cache_warmer = CacheWarmer(self, self.config.warmer)
+            self._cache_warmer.start()
+
         self.logger.info("Server started", capabilities=self.capabilities.__dict__)
 
     async def stop(self) -> None:
@@ -175,13 +438,47 @@ class BaseMCPServer(ABC):
         self._running = False
         self._shutdown_event.set()
 
+        if self._cache_warmer is not None:
+            await self._cache_warmer.stop()
+
         # Close HTTP client
         if self._http_client:
             await self._http_client.close_session()
             self._http_client = None
 
+        if self._loop_lag_monitor is not None:
+            await self._loop_lag_monitor.stop()
+        if self._memory_monitor is not None:
+            await self._memory_monitor.stop()
+        if self._parse_offloader is not None:
+            self._parse_offloader.shutdown()
+            self._parse_offloader = None
+
+        # Persist or release the result cache
+        if self._cache is not None:
+            if self.config.cache.snapshot_path:
+                try:
+                    self.save_cache_snapshot()
+                except OSError as e:
+                    self.logger.error("Failed to save cache snapshot", error=str(e))
+            # Closing the tiered cache writes the memory tier to disk
+            await asyncio.to_thread(self._cache.close)
+            self._cache = None
+
         self.logger.info("Server stopped")
 
+    def _shrinkable_caches(self) -> List[Shrinkable]:
+        """Get the caches released under memory pressure."""
+        caches: List[Shrinkable] = []
+        if self._cache is not None:
+            caches.append(self._cache)
+        if (
+            self._http_client is not None
+            and self._http_client.response_cache is not None
+        ):
+            caches.append(self._http_client.response_cache)
+        return caches
+
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check."""
         health_status = {
@@ -194,6 +491,8 @@ class BaseMCPServer(ABC):
                 "requests_success": self.stats.requests_success,
                 "requests_failed": self.stats.requests_failed,
                 "avg_response_time": self.stats.avg_response_time,
+                "concurrent_requests": self.stats.concurrent_requests,
+                "requests_rejected": self.stats.requests_rejected,
                 "success_rate": (
                     self.stats.requests_success / self.stats.requests_total
                     if self.stats.requests_total > 0
@@ -206,56 +505,98 @@ class BaseMCPServer(ABC):
 
     @log_execution_time("request")
     async def execute_request(
-        self, operation: str, params: Dict[str, Any], use_cache: bool = True
+        self,
+        operation: str,
+        params: Dict[str, Any],
+        use_cache: bool = True,
+        lane: Optional[str] = None,
+        client_id: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Execute a single request."""
+        """Execute a single request.
+
+        Args:
+            operation: Operation name
+            params: Operation parameters
+            use_cache: Whether to use the result cache
+            lane: Scheduling lane (defaults to the lane configured for the operation)
+            client_id: Client identifier, e.g. the MCP session id, used for fair
+                queuing and per-client statistics
+        """
         start_time = time.time()
+        client_id = client_id or DEFAULT_CLIENT_ID
+        client = self._get_client_stats(client_id)
         self.stats.concurrent_requests += 1
 
         try:
-            # Apply rate limiting
-            await self.rate_limiter.acquire()
-
             # Generate cache key
             cache_key = None
             if use_cache and self.config.enable_caching:
-                cache_key = generate_cache_key(
-                    f"{self.capabilities.name}:{operation}", **params
-                )
+                cache_key = self._request_cache_key(operation, params)
 
                 # Check cache
-                cached_result = self._get_from_cache(cache_key)
+                cached_result = await self._get_from_cache(cache_key)
                 if cached_result:
                     self.stats.cache_hits += 1
-                    return cached_result
+                    client.cache_hits += 1
+                    return self._adapt_cached_result(operation, params, cached_result)
 
             self.stats.cache_misses += 1
 
             # Validate request
             self._validate_request(operation, params)
+            lane = self._resolve_lane(operation, lane)
+
+            # Admit request before it queues on the rate limiter
+            try:
+                queue_wait = await self._admit(client_id, client, lane)
+            except ServerOverloadedError:
+                self.stats.requests_rejected += 1
+                client.requests_rejected += 1
+                degraded = await self._degrade_request(cache_key)
+                if degraded is not None:
+                    return self._adapt_cached_result(operation, params, degraded)
+                raise
 
-            # Execute operation
-            result = await self._execute_operation(operation, params)
+            try:
+                # Apply rate limiting, ordered by priority lane and client
+                queue_wait += await self._acquire_upstream(lane, client_id)
+                self.stats.update_queue_wait(queue_wait)
+                client.update_queue_wait(queue_wait)
+
+                # Execute operation
+                result = await self._execute_operation(operation, params)
+            finally:
+                self._release(client, lane)
 
             # Cache result
             if use_cache and cache_key and self.config.enable_caching:
-                self._set_cache(cache_key, result)
+                self._set_cache(
+                    cache_key,
+                    result,
+                    ttl=self.config.cache.operation_ttls.get(operation),
+                    tags=self._cache_tags(operation, params, result),
+                )
 
             # Update stats
             response_time = time.time() - start_time
             self.stats.increment_success(response_time)
+            client.requests_total += 1
+            client.requests_success += 1
 
             return result
 
         except Exception as e:
             response_time = time.time() - start_time
             self.stats.increment_failure()
+            client.requests_total += 1
+            client.requests_failed += 1
 
             # Log error
             self.logger.error(
                 "Request failed",
                 operation=operation,
                 params=params,
+                client_id=client_id,
                 error=str(e),
                 response_time=response_time,
             )
@@ -270,45 +611,144 @@ class BaseMCPServer(ABC):
             self.stats.concurrent_requests -= 1
 
     async def execute_batch(
-        self, requests: List[Dict[str, Any]], use_cache: bool = True
+        self,
+        requests: List[Dict[str, Any]],
+        use_cache: bool = True,
+        client_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Execute multiple requests in batch."""
+        """Execute multiple requests in batch.
+
+        Batches of any size are accepted; they are executed in chunks of
+        ``max_batch_size`` requests via execute_batch_stream. Identical
+        requests are executed once.
+
+        Returns:
+            One result per request, in input order. Results of requests that
+            repeat an earlier one carry ``"deduplicated": True``, so the
+            number of flagged results is the deduplicated count of the batch
+            (also added to ``stats.batch_duplicates``).
+        """
         if not self.capabilities.supports_batch:
             raise ValidationError(
                 f"{self.capabilities.name} does not support batch operations"
             )
 
-        if len(requests) > self.capabilities.max_batch_size:
+        # Deduplicate identical requests so each is executed once
+        unique_requests, request_keys = self._deduplicate_requests(requests)
+
+        # Execute distinct requests chunk by chunk
+        unique_results: List[Dict[str, Any]] = []
+        async for chunk_results in self.execute_batch_stream(
+            unique_requests.values(), use_cache=use_cache, client_id=client_id
+        ):
+            unique_results.extend(chunk_results)
+        results_by_key = dict(zip(unique_requests, unique_results))
+
+        # Fan results back out to every position
+        processed_results = []
+        seen_keys = set()
+        for request_key in request_keys:
+            processed_result = dict(results_by_key[request_key])
+            if request_key in seen_keys:
+                processed_result["deduplicated"] = True
+            seen_keys.add(request_key)
+            processed_results.append(processed_result)
+
+        return processed_results
+
+    async def execute_batch_stream(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        use_cache: bool = True,
+        client_id: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Execute an arbitrarily large batch, yielding results chunk by chunk.
+
+        Requests are consumed lazily and processed in chunks of at most
+        ``chunk_size`` (default ``max_batch_size``) requests. The next chunk is
+        executed while the caller consumes the current one, so memory stays
+        bounded by two chunks regardless of the input size. Identical requests
+        within a chunk are executed once and their repeats flagged with
+        ``"deduplicated": True``; their total is logged when the stream ends.
+
+        Args:
+            requests: Iterable of requests with "operation" and "params"
+            use_cache: Whether to use the result cache
+            client_id: Client identifier for fair queuing
+            chunk_size: Requests per chunk
+            max_concurrency: Maximum requests of this batch executing at the
+                same time (default: limited by the lane slots only)
+
+        Yields:
+            Lists of per-request results, in input order
+        """
+        if not self.capabilities.supports_batch:
             raise ValidationError(
-                f"Batch size {len(requests)} exceeds maximum {self.capabilities.max_batch_size}"
+                f"{self.capabilities.name} does not support batch operations"
             )
 
-        # Execute requests concurrently
-        tasks = []
-        for request in requests:
-            task = self.execute_request(
-                operation=request["operation"],
-                params=request.get("params", {}),
-                use_cache=use_cache,
+        chunk_size = chunk_size or self.capabilities.max_batch_size
+        progress = ProgressTracker.for_items(requests, unit="requests")
+        limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return await self._execute_batch_chunk(chunk, use_cache, client_id, limit)
+
+        deduplicated = 0
+        async for chunk_results in pipeline_chunks(
+            iter_chunks(requests, chunk_size), run_chunk
+        ):
+            deduplicated += len([r for r in chunk_results if r.get("deduplicated")])
+            await progress.advance(len(chunk_results))
+            yield chunk_results
+
+        if deduplicated:
+            self.logger.info(
+                "Deduplicated batch stream requests",
+                requests=progress.completed,
+                deduplicated=deduplicated,
             )
-            tasks.append(task)
+
+    async def _execute_batch_chunk(
+        self,
+        requests: List[Dict[str, Any]],
+        use_cache: bool,
+        client_id: Optional[str],
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute one chunk of batch requests concurrently."""
+        unique_requests, request_keys = self._deduplicate_requests(requests)
+
+        # Execute requests concurrently
+        tasks = [
+            self._execute_batch_item(request, use_cache, client_id, limit)
+            for request in unique_requests.values()
+        ]
 
         try:
             results = await asyncio.gather(*tasks, return_exceptions=True)
+            results_by_key = dict(zip(unique_requests, results))
 
             # Process results and handle exceptions
             processed_results = []
-            for i, result in enumerate(results):
+            seen_keys = set()
+            for request_key in request_keys:
+                result = results_by_key[request_key]
                 if isinstance(result, Exception):
-                    processed_results.append(
-                        {
-                            "success": False,
-                            "error": str(result),
-                            "error_type": type(result).__name__,
-                        }
-                    )
+                    processed_result = {
+                        "success": False,
+                        "error": str(result),
+                        "error_type": type(result).__name__,
+                    }
                 else:
-                    processed_results.append({"success": True, "result": result})
+                    processed_result = {"success": True, "result": result}
+
+                if request_key in seen_keys:
+                    processed_result["deduplicated"] = True
+                seen_keys.add(request_key)
+                processed_results.append(processed_result)
 
             return processed_results
 
@@ -316,6 +756,70 @@ class BaseMCPServer(ABC):
             self.logger.error("Batch execution failed", error=str(e))
             raise
 
+    async def _execute_batch_item(
+        self,
+        request: Dict[str, Any],
+        use_cache: bool,
+        client_id: Optional[str],
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Dict[str, Any]:
+        """Execute one batch request once a slot of its lane is free.
+
+        Batch items wait here without a deadline instead of in the admission
+        queue, so a large batch neither times out nor fills that queue. With
+        a ``limit``, the item also waits for a slot of its batch. Items run
+        in their own lane, else in the lane configured for their operation,
+        else in the batch lane.
+        """
+        scheduling = self.config.scheduling
+        lane = request.get("lane")
+        if lane is None and request["operation"] not in scheduling.tool_lanes:
+            lane = scheduling.batch_lane
+        lane = self._resolve_lane(request["operation"], lane)
+        slots = self._batch_slots.get(lane)
+        if slots is None:
+            slots = self._batch_slots[lane] = asyncio.Semaphore(self._lane_slots(lane))
+        async with limit or nullcontext(), slots:
+            result: Dict[str, Any] = await self.execute_request(
+                operation=request["operation"],
+                params=request.get("params", {}),
+                use_cache=use_cache,
+                lane=lane,
+                client_id=client_id,
+            )
+        return result
+
+    def _deduplicate_requests(
+        self, requests: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Group batch requests by key.
+
+        Returns:
+            Distinct requests by key (in first-seen order) and the key of
+            every input position
+        """
+        unique_requests: Dict[str, Dict[str, Any]] = {}
+        request_keys = []
+        for request in requests:
+            request_key = self._batch_request_key(request)
+            unique_requests.setdefault(request_key, request)
+            request_keys.append(request_key)
+
+        duplicates = len(requests) - len(unique_requests)
+        if duplicates:
+            self.stats.batch_duplicates += duplicates
+            self.logger.debug(
+                "Deduplicated batch requests",
+                total=len(requests),
+                unique=len(unique_requests),
+            )
+
+        return unique_requests, request_keys
+
+    def _batch_request_key(self, request: Dict[str, Any]) -> str:
+        """Build the key used to detect duplicate requests within a batch."""
+        return generate_cache_key(request["operation"], **request.get("params", {}))
+
     async def execute_stream(
         self, operation: str, params: Dict[str, Any]
     ) -> AsyncGenerator[Dict[str, Any], None]:
@@ -346,54 +850,255 @@ class BaseMCPServer(ABC):
                 field_value=operation,
             )
 
-    def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get result from cache."""
-        if not self._cache:
+    def _request_cache_key(self, operation: str, params: Dict[str, Any]) -> str:
+        """Build the result cache key of a request from its canonical parameters."""
+        return canonical_cache_key(
+            self._cache_namespace(operation),
+            params,
+            defaults=self.CACHE_KEY_DEFAULTS.get(operation),
+            normalizers=self.CACHE_KEY_NORMALIZERS,
+        )
+
+    def _cache_namespace(self, operation: str) -> str:
+        """Get the cache key namespace of an operation."""
+        return f"{self.capabilities.name}:{operation}"
+
+    def _cache_tags(
+        self, operation: str, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> List[str]:
+        """Get the invalidation tags of a result (none by default)."""
+        return []
+
+    def _adapt_cached_result(
+        self, operation: str, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Adapt a cached result to a request with the same canonical parameters.
+
+        Requests sharing a cache key may spell their parameters differently;
+        subclasses override this to echo the caller's spelling in the result.
+        """
+        return result
+
+    async def _degrade_request(
+        self, cache_key: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Serve a stale cached result for a shed request, if allowed."""
+        if self.config.admission.overload_mode != "degrade" or not cache_key:
+            return None
+
+        stale_result = await self._get_from_cache(cache_key, allow_stale=True)
+        if stale_result is None:
             return None
 
-        cached = self._cache.get(cache_key)
-        if cached and time.time() < cached.get("expires", 0):
-            data = cached.get("data")
-            return data if data is not None else {}
+        self.stats.requests_degraded += 1
+        return {**stale_result, "degraded": True}
+
+    @property
+    def cache(self) -> ResultCache:
+        """Get result cache instance."""
+        if self._cache is None:
+            cache_config = self.config.cache
+            codec: Optional[ValueCodec] = None
+            if cache_config.compression != "none":
+                codec = CompressedCodec(
+                    cache_config.compression,
+                    level=cache_config.compression_level,
+                    min_size=cache_config.compression_min_size,
+                )
+            elif cache_config.dedup:
+                codec = ContentAddressedCodec()
+            elif cache_config.compact_records:
+                codec = CompactRecordCodec()
+            admission = None
+            if cache_config.admission_policy == "tinylfu":
+                admission = TinyLFU(cache_config.max_size)
+            # Entry sizes are only needed to shrink caches under memory pressure
+            measure_sizes = self.config.memory.max_rss_mb > 0
+            if cache_config.backend == "tiered":
+                self._cache = TieredResultCache(
+                    DiskCache(
+                        cache_config.disk_path,
+                        max_entries=cache_config.disk_max_entries,
+                        compress_min_size=cache_config.compression_min_size,
+                    ),
+                    max_size=cache_config.max_size,
+                    ttl=cache_config.ttl,
+                    codec=codec,
+                    admission=admission,
+                    measure_sizes=measure_sizes,
+                )
+            else:
+                self._cache = ResultCache(
+                    max_size=cache_config.max_size,
+                    ttl=cache_config.ttl,
+                    codec=codec,
+                    admission=admission,
+                    measure_sizes=measure_sizes,
+                )
+        return self._cache
+
+    async def _get_from_cache(
+        self, cache_key: str, allow_stale: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Get result from cache."""
+        if self._cache is None:
+            return None
 
-        return None
+        return await self._cache.get_async(cache_key, allow_stale=allow_stale)
 
-    def _set_cache(self, cache_key: str, data: Dict[str, Any]) -> None:
+    def _set_cache(
+        self,
+        cache_key: str,
+        data: Dict[str, Any],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
         """Set result in cache."""
-        if not self._cache:
-            # Initialize cache
-            self._cache = {}
-
-        # Simple cache with TTL
-        self._cache[cache_key] = {
-            "data": data,
-            "expires": time.time() + self.config.cache.ttl,
-        }
+        self.cache.set(cache_key, data, ttl=ttl, tags=tags)
+
+    def invalidate_cache(
+        self, namespace: Optional[str] = None, tags: Iterable[str] = ()
+    ) -> Dict[str, Any]:
+        """Invalidate cached results.
+
+        Raw upstream responses are keyed by URL and cannot be attributed to an
+        operation or tag, so the response cache is cleared entirely to keep
+        invalidated results from being rebuilt from stale responses.
+
+        Args:
+            namespace: Only invalidate results of this operation
+            tags: Only invalidate results carrying at least one of these tags
+
+        Returns:
+            Number of results and raw responses removed
+        """
+        tags = list(tags)
+        if namespace is None and not tags:
+            raise ValidationError("A namespace or at least one tag is required")
+        if namespace is not None and namespace not in self.capabilities.operations:
+            raise ValidationError(
+                f"Unknown cache namespace: {namespace}",
+                field_name="namespace",
+                field_value=namespace,
+            )
+
+        removed = 0
+        if self._cache is not None:
+            prefix = None
+            if namespace is not None:
+                prefix = self._cache_namespace(namespace) + ":"
+            removed = self._cache.invalidate(prefix, tags)
+
+        responses_removed = 0
+        if (
+            self._http_client is not None
+            and self._http_client.response_cache is not None
+        ):
+            responses_removed = len(self._http_client.response_cache)
+            self._http_client.response_cache.clear()
+
+        self.logger.info(
+            "Cache invalidated", namespace=namespace, tags=tags, removed=removed
+        )
+        return {"removed": removed, "responses_removed": responses_removed}
+
+    def _snapshot_path(self, path: Optional[str]) -> str:
+        """Resolve a cache snapshot path, defaulting to the configured one.
+
+        Other paths must be in the directory of the configured snapshot;
+        relative paths are resolved against it.
+        """
+        configured = self.config.cache.snapshot_path
+        if not configured:
+            raise ValidationError(
+                "cache.snapshot_path is not configured", field_name="path"
+            )
+        if not path:
+            return configured
+
+        snapshot_dir = Path(configured).expanduser().resolve().parent
+        resolved = (snapshot_dir / Path(path).expanduser()).resolve()
+        if not resolved.is_relative_to(snapshot_dir):
+            raise ValidationError(
+                f"Cache snapshots must be in {snapshot_dir}",
+                field_name="path",
+                field_value=path,
+            )
+        return str(resolved)
+
+    def save_cache_snapshot(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Save the result cache to a snapshot file.
 
-        # Clean up expired entries if cache is too large
-        if len(self._cache) > self.config.cache.max_size:
-            current_time = time.time()
-            expired_keys = [
-                key
-                for key, value in self._cache.items()
-                if value.get("expires", 0) < current_time
-            ]
-            for key in expired_keys:
-                del self._cache[key]
+        Args:
+            path: Snapshot file in the directory of cache.snapshot_path
+                (default: cache.snapshot_path)
+
+        Returns:
+            Snapshot path, number of entries and file size
+        """
+        return save_snapshot(self.cache, self._snapshot_path(path))
+
+    def load_cache_snapshot(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Restore the result cache from a snapshot file.
+
+        Args:
+            path: Snapshot file in the directory of cache.snapshot_path
+                (default: cache.snapshot_path)
+
+        Returns:
+            Snapshot path and the numbers of restored and expired entries
+        """
+        path = self._snapshot_path(path)
+        try:
+            return load_snapshot(self.cache, path)
+        except FileNotFoundError:
+            raise ValidationError(
+                f"Cache snapshot not found: {path}", field_name="path", field_value=path
+            )
 
     def get_stats(self) -> Dict[str, Any]:
         """Get server statistics."""
-        return {
+        stats = {
             "server": self.capabilities.name,
             "version": self.capabilities.version,
             "running": self._running,
             "stats": self.stats.__dict__,
             "capabilities": self.capabilities.__dict__,
         }
+        if self._admission_controllers:
+            stats["admission"] = {
+                lane: controller.get_stats()
+                for lane, controller in self._admission_controllers.items()
+            }
+        if self._scheduler is not None:
+            stats["scheduling"] = self._scheduler.get_stats()
+        if self._cache is not None:
+            stats["cache"] = self._cache.get_stats()
+        if (
+            self._http_client is not None
+            and self._http_client.response_cache is not None
+        ):
+            stats["response_cache"] = self._http_client.response_cache.get_stats()
+        if self._parse_offloader is not None:
+            stats["parsing"] = self._parse_offloader.get_stats()
+        if self._loop_lag_monitor is not None:
+            stats["loop_lag"] = self._loop_lag_monitor.get_stats()
+        if self._memory_monitor is not None:
+            stats["memory"] = self._memory_monitor.get_stats()
+        if self._cache_warmer is not None:
+            stats["warmer"] = self._cache_warmer.get_stats()
+        stats["clients"] = {
+            client_id: client.__dict__
+            for client_id, client in self.client_stats.items()
+        }
+        return stats
 
     def reset_stats(self) -> None:
         """Reset server statistics."""
         self.stats = ServerStats()
+        self.client_stats = OrderedDict()
         self.logger.info("Server statistics reset")
 
     async def __aenter__(self) -> "BaseMCPServer":
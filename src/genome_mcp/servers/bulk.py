@@ -0,0 +1,277 @@
+"""
+Bulk file processing for Genome MCP.
+
+This module streams gene IDs from an NDJSON or TSV file through the chunked
+batch operations of the NCBI Gene server and writes per-gene results to an
+NDJSON or TSV file as each chunk completes. Neither the input nor the results
+are held in memory, so memory use stays constant regardless of file size.
+
+Input formats:
+    ndjson: One JSON value per line, either a gene ID string or an object
+            with a "gene_id" field
+    tsv:    Tab-separated lines; the "gene_id" column if a header names one,
+            otherwise the first column. Blank lines and "#" comments are
+            skipped
+
+Output formats:
+    ndjson: One result object per line, in input order
+    tsv:    A header and one flattened row per gene (see TSV_COLUMNS)
+"""
+
+import csv
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+import structlog
+
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.data.parsers import JSONDataParser
+from genome_mcp.exceptions import DataFormatError, ValidationError
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+
+logger = structlog.get_logger(__name__)
+
+FILE_FORMATS = ("ndjson", "tsv")
+
+_FORMAT_EXTENSIONS = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".json": "ndjson",
+    ".tsv": "tsv",
+    ".txt": "tsv",
+}
+
+# TSV output columns per operation: (column name, dotted path into the result)
+TSV_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    "batch_gene_info": [
+        ("gene_id", "gene_id"),
+        ("success", "success"),
+        ("uid", "data.uid"),
+        ("symbol", "data.info.name"),
+        ("description", "data.info.description"),
+        ("chromosome", "data.info.chromosome"),
+        ("map_location", "data.info.maplocation"),
+        ("error", "error"),
+    ],
+    "batch_gene_homologs": [
+        ("gene_id", "gene_id"),
+        ("success", "success"),
+        ("species", "species"),
+        ("homolog_count", "homolog_count"),
+        ("homologs", "homologs"),
+        ("error", "error"),
+    ],
+}
+
+
+def detect_format(path: str, file_format: Optional[str] = None) -> str:
+    """
+    Resolve the format of a bulk file.
+
+    Args:
+        path: File path
+        file_format: Explicit format (optional, otherwise taken from extension)
+
+    Returns:
+        "ndjson" or "tsv"
+    """
+    if file_format is None:
+        file_format = _FORMAT_EXTENSIONS.get(Path(path).suffix.lower())
+        if file_format is None:
+            raise ValidationError(
+                f"Cannot detect file format of {path}; specify ndjson or tsv",
+                field_name="format",
+            )
+
+    file_format = file_format.lower()
+    if file_format not in FILE_FORMATS:
+        raise ValidationError(
+            f"Unsupported file format: {file_format}",
+            field_name="format",
+            field_value=file_format,
+        )
+    return file_format
+
+
+def iter_gene_ids(stream: TextIO, file_format: str) -> Iterator[str]:
+    """
+    Lazily read gene IDs from an NDJSON or TSV stream.
+
+    Args:
+        stream: Text stream to read from
+        file_format: "ndjson" or "tsv"
+
+    Yields:
+        Gene IDs in file order
+    """
+    if file_format == "ndjson":
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                value = json_codec.loads(line)
+            except ValueError as e:
+                raise DataFormatError(
+                    f"Invalid JSON on line {line_number}: {str(e)}"
+                ) from e
+            if isinstance(value, dict):
+                value = value.get("gene_id")
+            if not isinstance(value, (str, int)) or value == "":
+                raise DataFormatError(f"No gene_id on line {line_number}")
+            yield str(value)
+        return
+
+    column = None
+    for line in stream:
+        line = line.rstrip("\r\n")
+        if not line.strip() or line.startswith("#"):
+            continue
+        fields = line.split("\t")
+        if column is None:
+            header = [field.strip().lower() for field in fields]
+            column = header.index("gene_id") if "gene_id" in header else 0
+            if "gene_id" in header:
+                continue
+        if column < len(fields) and fields[column].strip():
+            yield fields[column].strip()
+
+
+class BulkResultWriter:
+    """Write per-gene results incrementally as NDJSON or TSV."""
+
+    def __init__(self, stream: TextIO, file_format: str, operation: str):
+        """
+        Initialize result writer.
+
+        Args:
+            stream: Text stream to write to
+            file_format: "ndjson" or "tsv"
+            operation: Batch operation producing the results
+        """
+        self.stream = stream
+        self.file_format = file_format
+        self.columns = TSV_COLUMNS[operation]
+        self._tsv = None
+        if file_format == "tsv":
+            self._tsv = csv.writer(stream, delimiter="\t", lineterminator="\n")
+            self._tsv.writerow([name for name, _ in self.columns])
+
+    def _row(self, record: Dict[str, Any]) -> List[Any]:
+        """Flatten a result into TSV column values."""
+        if "homologs" in record:
+            record = {**record, "homolog_count": len(record["homologs"])}
+
+        row = []
+        for _, path in self.columns:
+            value = JSONDataParser.extract_nested_value(record, path, "")
+            if isinstance(value, (dict, list)):
+                value = json_codec.dumps_str(value)
+            row.append(value)
+        return row
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        """Write a chunk of results and flush them to the stream."""
+        for record in records:
+            if self._tsv is not None:
+                self._tsv.writerow(self._row(record))
+            else:
+                self.stream.write(json_codec.dumps_str(record) + "\n")
+        self.stream.flush()
+
+
+def resolve_bulk_path(path: str, base_dir: str) -> str:
+    """
+    Resolve a file path given by a client inside the bulk base directory.
+
+    Args:
+        path: File path, absolute or relative to base_dir
+        base_dir: Directory bulk files must be in
+
+    Returns:
+        Absolute file path
+
+    Raises:
+        ValidationError: If the path is outside base_dir
+    """
+    base = Path(base_dir).expanduser().resolve()
+    resolved = (base / Path(path).expanduser()).resolve()
+    if not resolved.is_relative_to(base):
+        raise ValidationError(
+            f"Bulk files must be in {base}",
+            field_name="path",
+            field_value=path,
+        )
+    return str(resolved)
+
+
+async def process_bulk_file(
+    server: NCBIGeneServer,
+    operation: str,
+    input_path: str,
+    output_path: str,
+    params: Optional[Dict[str, Any]] = None,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    client_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Stream gene IDs from a file through a batch operation into a result file.
+
+    Args:
+        server: Gene server used to execute the batch operation
+        operation: Batch operation (batch_gene_info or batch_gene_homologs)
+        input_path: NDJSON or TSV file of gene IDs
+        output_path: NDJSON or TSV file to write results to
+        params: Remaining operation parameters (species etc.)
+        input_format: Input format (default: detected from extension)
+        output_format: Output format (default: detected from extension)
+        chunk_size: Genes per chunk (optional)
+        client_id: Client the gene lookups are scheduled for (optional)
+
+    Returns:
+        Summary with result counts and elapsed time
+    """
+    if operation not in server.BATCH_OPERATIONS:
+        raise ValidationError(
+            f"Unsupported bulk operation: {operation}",
+            field_name="operation",
+            field_value=operation,
+        )
+
+    input_format = detect_format(input_path, input_format)
+    output_format = detect_format(output_path, output_format)
+    start_time = time.time()
+    total = successful = 0
+
+    with (
+        open(input_path, "r", encoding="utf-8") as source,
+        open(output_path, "w", encoding="utf-8", newline="") as target,
+    ):
+        writer = BulkResultWriter(target, output_format, operation)
+        async for chunk in server.iter_batch_operation(
+            operation,
+            iter_gene_ids(source, input_format),
+            params or {},
+            chunk_size,
+            client_id=client_id,
+        ):
+            records = chunk["results"]
+            writer.write(records)
+            total += len(records)
+            successful += len([r for r in records if r.get("success")])
+
+    summary = {
+        "operation": operation,
+        "input_path": input_path,
+        "output_path": output_path,
+        "output_format": output_format,
+        "total_genes": total,
+        "successful": successful,
+        "failed": total - successful,
+        "elapsed": round(time.time() - start_time, 3),
+    }
+    logger.info("Bulk file processed", **summary)
+    return summary
@@ -0,0 +1,390 @@
+"""
+Background batch jobs for Genome MCP.
+
+This module runs large batch operations (e.g. annotating gene panels with
+thousands of genes) as background jobs. Results are appended to an on-disk
+checkpoint after every chunk, so a crashed or restarted server resumes a job
+from the last completed chunk instead of refetching everything, and clients
+fetch results page by page instead of in a single tool response.
+
+Each job is stored in its own directory below the checkpoint directory:
+
+    <checkpoint_dir>/<job_id>/job.json       job metadata and progress
+    <checkpoint_dir>/<job_id>/input.json     gene IDs to process
+    <checkpoint_dir>/<job_id>/results.ndjson one result per line, in input order
+"""
+
+import asyncio
+import os
+import re
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from genome_mcp.configuration import JobsConfig
+from genome_mcp.core import ProgressTracker, progress_reporting
+from genome_mcp.core.json_codec import json_codec
+from genome_mcp.exceptions import DataNotFoundError, ValidationError
+from genome_mcp.servers.base import DEFAULT_CLIENT_ID
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+
+logger = structlog.get_logger(__name__)
+
+JOB_FILE = "job.json"
+INPUT_FILE = "input.json"
+RESULTS_FILE = "results.ndjson"
+
+_JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+class JobStatus(str, Enum):
+    """Batch job states."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+ACTIVE_STATUSES = (JobStatus.PENDING.value, JobStatus.RUNNING.value)
+
+
+@dataclass
+class BatchJob:
+    """Metadata and progress of a background batch job."""
+
+    job_id: str
+    operation: str
+    params: Dict[str, Any]
+    total: int
+    status: str = JobStatus.PENDING.value
+    completed: int = 0
+    successful: int = 0
+    failed: int = 0
+    client_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert job to a progress report."""
+        data = asdict(self)
+        data["progress"] = self.completed / self.total if self.total else 1.0
+        return data
+
+
+class BatchJobManager:
+    """Submit, run, checkpoint and resume background batch jobs."""
+
+    def __init__(self, server: NCBIGeneServer, config: JobsConfig):
+        """
+        Initialize job manager.
+
+        Args:
+            server: Gene server used to execute batch operations
+            config: Job configuration
+        """
+        self.server = server
+        self.config = config
+        self.checkpoint_dir = Path(config.checkpoint_dir).expanduser()
+        self._jobs: Dict[str, BatchJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._progress: Dict[str, ProgressTracker] = {}
+        self._slots = asyncio.Semaphore(config.max_concurrent_jobs)
+        self._stopping = False
+
+    async def start(self) -> List[str]:
+        """
+        Load jobs from the checkpoint directory and resume unfinished ones.
+
+        Returns:
+            IDs of resumed jobs
+        """
+        self._stopping = False
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+        resumed = []
+        for job_file in sorted(self.checkpoint_dir.glob(f"*/{JOB_FILE}")):
+            try:
+                with open(job_file, "rb") as f:
+                    job = BatchJob(**json_codec.loads(f.read()))
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(
+                    "Skipping unreadable job checkpoint",
+                    path=str(job_file),
+                    error=str(e),
+                )
+                continue
+
+            self._jobs[job.job_id] = job
+            if job.status in ACTIVE_STATUSES and job.job_id not in self._tasks:
+                self._launch(job)
+                resumed.append(job.job_id)
+
+        if resumed:
+            logger.info("Resumed batch jobs", job_ids=resumed)
+        return resumed
+
+    async def stop(self) -> None:
+        """Stop running jobs, leaving their checkpoints resumable."""
+        self._stopping = True
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def submit(
+        self,
+        operation: str,
+        gene_ids: List[str],
+        params: Optional[Dict[str, Any]] = None,
+        client_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Submit a batch operation as a background job.
+
+        Args:
+            operation: Batch operation (batch_gene_info or batch_gene_homologs)
+            gene_ids: Gene IDs to process
+            params: Remaining operation parameters (species etc.)
+            client_id: Submitting client, used for scheduling
+
+        Returns:
+            Job progress report including the job ID
+        """
+        if operation not in self.server.BATCH_OPERATIONS:
+            raise ValidationError(
+                f"Unsupported batch job operation: {operation}",
+                field_name="operation",
+                field_value=operation,
+            )
+        if not gene_ids or not isinstance(gene_ids, list):
+            raise ValidationError(
+                "gene_ids must be a non-empty list", field_name="gene_ids"
+            )
+
+        job = BatchJob(
+            job_id=uuid.uuid4().hex,
+            operation=operation,
+            params=dict(params or {}),
+            total=len(gene_ids),
+            client_id=client_id,
+        )
+
+        job_dir = self._job_dir(job.job_id)
+        job_dir.mkdir(parents=True, exist_ok=True)
+        with open(job_dir / INPUT_FILE, "wb") as f:
+            f.write(json_codec.dumps(gene_ids))
+        (job_dir / RESULTS_FILE).touch()
+        self._save(job)
+
+        self._jobs[job.job_id] = job
+        self._launch(job)
+        logger.info(
+            "Batch job submitted",
+            job_id=job.job_id,
+            operation=operation,
+            total=job.total,
+        )
+        return job.to_dict()
+
+    def get_status(self, job_id: str) -> Dict[str, Any]:
+        """Get the progress report of a job, with throughput and ETA if running."""
+        status = self._get_job(job_id).to_dict()
+        progress = self._progress.get(job_id)
+        if progress is not None:
+            snapshot = progress.snapshot()
+            status["throughput"] = snapshot["throughput"]
+            status["eta"] = snapshot["eta"]
+        return status
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Get progress reports of all known jobs, newest first."""
+        jobs = sorted(self._jobs.values(), key=lambda job: -job.created_at)
+        return [job.to_dict() for job in jobs]
+
+    def get_results(
+        self, job_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch a page of job results.
+
+        Results are available as soon as their chunk has completed, so pages
+        can be fetched while the job is still running.
+
+        Args:
+            job_id: Job ID
+            offset: Index of the first result to return
+            limit: Maximum number of results (default: configured page size)
+
+        Returns:
+            Page of results with paging information
+        """
+        job = self._get_job(job_id)
+        limit = limit or self.config.page_size
+        if offset < 0 or limit < 1:
+            raise ValidationError("offset must be >= 0 and limit must be >= 1")
+
+        results = []
+        results_path = self._job_dir(job_id) / RESULTS_FILE
+        if results_path.exists():
+            with open(results_path, "rb") as f:
+                for line in islice(f, offset, offset + limit):
+                    results.append(json_codec.loads(line))
+
+        next_offset = offset + len(results)
+        return {
+            "job_id": job_id,
+            "status": job.status,
+            "offset": offset,
+            "limit": limit,
+            "total": job.total,
+            "available": job.completed,
+            "next_offset": next_offset if next_offset < job.total else None,
+            "results": results,
+        }
+
+    async def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a pending or running job."""
+        job = self._get_job(job_id)
+        if job.status in ACTIVE_STATUSES:
+            job.status = JobStatus.CANCELLED.value
+            self._save(job)
+            task = self._tasks.get(job_id)
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        return job.to_dict()
+
+    def _job_dir(self, job_id: str) -> Path:
+        """Get the checkpoint directory of a job."""
+        return self.checkpoint_dir / job_id
+
+    def _get_job(self, job_id: str) -> BatchJob:
+        """Look up a job by ID."""
+        if not _JOB_ID_PATTERN.match(job_id or "") or job_id not in self._jobs:
+            raise DataNotFoundError(f"Batch job not found: {job_id}")
+        return self._jobs[job_id]
+
+    def _save(self, job: BatchJob) -> None:
+        """Atomically persist job metadata."""
+        job.updated_at = time.time()
+        job_path = self._job_dir(job.job_id) / JOB_FILE
+        tmp_path = job_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json_codec.dumps(asdict(job)))
+        os.replace(tmp_path, job_path)
+
+    def _launch(self, job: BatchJob) -> None:
+        """Start the background task for a job."""
+        # Jobs outlive the submitting request, so they must not report
+        # progress to it; clients poll get_status instead
+        with progress_reporting(None):
+            task = asyncio.create_task(self._run(job))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+
+    def _recover_results(self, job: BatchJob) -> None:
+        """Reconcile job progress with the results checkpoint.
+
+        The results file is the source of truth: complete lines are kept and
+        counted, and a partially written trailing line is truncated.
+        """
+        results_path = self._job_dir(job.job_id) / RESULTS_FILE
+        completed = successful = 0
+        valid_size = 0
+
+        if results_path.exists():
+            with open(results_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json_codec.loads(line)
+                    except ValueError:
+                        break
+                    completed += 1
+                    successful += 1 if record.get("success") else 0
+                    valid_size += len(line)
+
+            if results_path.stat().st_size != valid_size:
+                with open(results_path, "r+b") as f:
+                    f.truncate(valid_size)
+
+        job.completed = completed
+        job.successful = successful
+        job.failed = completed - successful
+
+    def _append_results(self, job: BatchJob, records: List[Dict[str, Any]]) -> None:
+        """Append a completed chunk to the results checkpoint."""
+        results_path = self._job_dir(job.job_id) / RESULTS_FILE
+        with open(results_path, "ab") as f:
+            for record in records:
+                f.write(json_codec.dumps(record) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        job.completed += len(records)
+        successful = len([r for r in records if r.get("success")])
+        job.successful += successful
+        job.failed += len(records) - successful
+        self._save(job)
+
+    async def _run(self, job: BatchJob) -> None:
+        """Run a job from its last checkpoint to completion."""
+        async with self._slots:
+            if job.status not in ACTIVE_STATUSES:
+                return
+
+            try:
+                with open(self._job_dir(job.job_id) / INPUT_FILE, "rb") as f:
+                    gene_ids = json_codec.loads(f.read())
+
+                self._recover_results(job)
+                job.status = JobStatus.RUNNING.value
+                self._save(job)
+
+                progress = ProgressTracker(job.total - job.completed, unit="genes")
+                self._progress[job.job_id] = progress
+                remaining = islice(gene_ids, job.completed, None)
+                async for chunk in self.server.iter_batch_operation(
+                    job.operation,
+                    remaining,
+                    job.params,
+                    chunk_size=self.config.chunk_size,
+                    client_id=job.client_id or DEFAULT_CLIENT_ID,
+                ):
+                    records = chunk["results"]
+                    self._append_results(job, records)
+                    await progress.advance(len(records))
+
+                job.status = JobStatus.COMPLETED.value
+                self._save(job)
+                logger.info(
+                    "Batch job completed",
+                    job_id=job.job_id,
+                    successful=job.successful,
+                    failed=job.failed,
+                )
+
+            except asyncio.CancelledError:
+                if not self._stopping and job.status != JobStatus.CANCELLED.value:
+                    job.status = JobStatus.CANCELLED.value
+                    self._save(job)
+                raise
+
+            except Exception as e:
+                job.status = JobStatus.FAILED.value
+                job.error = str(e)
+                self._save(job)
+                logger.error("Batch job failed", job_id=job.job_id, error=str(e))
+
+            finally:
+                self._progress.pop(job.job_id, None)
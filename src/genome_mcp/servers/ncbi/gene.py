@@ -5,21 +5,308 @@ This module provides MCP server functionality for NCBI Gene database operations.
 """
 
 import asyncio
-from typing import Any, Dict
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 from urllib.parse import urlencode
 
 import structlog
 
-from genome_mcp.data.parsers import GenomicDataParser
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.core import (
+    ProgressTracker,
+    RegionIndex,
+    Shrinkable,
+    iter_chunks,
+    pipeline_chunks,
+)
+from genome_mcp.data.parsers import DataValidator, GenomicDataParser, JSONDataParser
 from genome_mcp.exceptions import APIError, DataNotFoundError, ValidationError
-from genome_mcp.servers.base import BaseMCPServer, ServerCapabilities
+from genome_mcp.servers.base import (
+    DEFAULT_CLIENT_ID,
+    BaseMCPServer,
+    ServerCapabilities,
+)
 
 logger = structlog.get_logger(__name__)
 
 
+# esummary fields returned when the caller does not ask for specific fields
+DEFAULT_GENE_FIELDS = (
+    "name",
+    "description",
+    "chromosome",
+    "maplocation",
+    "otheraliases",
+    "summary",
+    "organism.scientificname",
+    "organism.taxid",
+    "genomicinfo",
+)
+
+# Field selector that disables projection
+ALL_FIELDS = "*"
+
+
+def _resolve_fields(fields: Optional[Any]) -> Optional[Tuple[str, ...]]:
+    """Resolve a fields parameter to the esummary fields to keep.
+
+    Returns None when the full document was requested.
+    """
+    if fields is None:
+        return DEFAULT_GENE_FIELDS
+    if isinstance(fields, str):
+        fields = [fields]
+    if not isinstance(fields, (list, tuple)) or not all(
+        isinstance(field, str) and field for field in fields
+    ):
+        raise ValidationError(
+            "fields must be a list of field names", field_name="fields"
+        )
+    if ALL_FIELDS in fields:
+        return None
+    return tuple(fields)
+
+
+def _project_gene_document(
+    document: Dict[str, Any], fields: Optional[Tuple[str, ...]]
+) -> Dict[str, Any]:
+    """Project an esummary gene document onto the requested fields."""
+    if fields is None:
+        return document
+    return JSONDataParser.project_fields(document, fields)
+
+
+def _normalize_gene_id(gene_id: Any) -> str:
+    """Normalize a gene identifier for duplicate detection.
+
+    NCBI gene symbol searches are case-insensitive, so "TP53", "tp53" and
+    " TP53 " all refer to the same gene.
+    """
+    return str(gene_id).strip().upper()
+
+
+def _normalize_gene_ids(gene_ids: Any) -> Any:
+    """Normalize a gene list for cache keys.
+
+    Lists naming the same genes share a key regardless of spelling, order
+    and repeats; cache hits are fanned out to the requested list (see
+    _fan_out_batch_result).
+    """
+    if not isinstance(gene_ids, list):
+        return gene_ids
+    return sorted({_normalize_gene_id(gene_id) for gene_id in gene_ids})
+
+
+@lru_cache(maxsize=256)
+def _canonical_species(species: str) -> str:
+    """Resolve a species name or alias to its canonical name."""
+    try:
+        return DataValidator.validate_species_name(species)
+    except ValidationError:
+        return species
+
+
+def _normalize_species(species: Any) -> Any:
+    """Normalize a species for cache keys.
+
+    "human", "Human" and "Homo sapiens" all refer to the same organism.
+    """
+    return _canonical_species(species) if isinstance(species, str) else species
+
+
+# Request parameters echoed in results, restored on cache hits
+_ECHOED_PARAMS = ("gene_id", "species")
+
+# Operations searching a genomic region; they share cache entries
+REGION_OPERATIONS = ("search_by_region", "search_by_region_enhanced")
+
+# Parameters that spell out the searched region
+_REGION_PARAMS = ("region", "chromosome", "start", "end")
+
+
+def _canonical_region_params(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Rewrite region search parameters onto canonical coordinates.
+
+    "chr1[1000-2000]", "1:1000-2000" and chromosome "chr1" with start 1000
+    and end 2000 all describe the same search. Returns None when the region
+    cannot be parsed; such requests fail validation anyway.
+    """
+    if "region" in params:
+        position = str(params["region"])
+    else:
+        position = (
+            f"{params.get('chromosome')}:{params.get('start')}-{params.get('end')}"
+        )
+    try:
+        parsed = GenomicDataParser.parse_genomic_position(position)
+    except ValidationError:
+        return None
+    if parsed["start"] is None or parsed["end"] is None:
+        return None
+
+    canonical = {
+        key: value for key, value in params.items() if key not in _REGION_PARAMS
+    }
+    canonical["chromosome"] = parsed["chromosome"]
+    canonical["start"] = parsed["start"]
+    canonical["end"] = parsed["end"]
+    return canonical
+
+
+def _region_term(chromosome: str, start: int, end: int, species: str) -> str:
+    """Build the search term of a genomic region."""
+    return f"{chromosome}:{start}-{end}[chr] AND {species}[Organism]"
+
+
+# Genes requested per search filling the region index; regions holding more
+# genes are not indexed
+REGION_FETCH_SIZE = 100
+
+
+def _gene_span(document: Dict[str, Any], chromosome: str) -> Optional[Tuple[int, int]]:
+    """Get the first and last position of a gene on a chromosome.
+
+    esummary positions are 0-based, while region searches are 1-based.
+    """
+    for location in document.get("genomicinfo") or ():
+        if str(location.get("chrloc", "")).upper() != chromosome:
+            continue
+        try:
+            start = int(location["chrstart"])
+            stop = int(location["chrstop"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        return min(start, stop) + 1, max(start, stop) + 1
+    return None
+
+
+def _region_records(
+    result: Dict[str, Any], chromosome: str
+) -> Optional[List[Tuple[str, int, int, Dict[str, Any]]]]:
+    """Get the genes of a region search with their positions.
+
+    Returns None unless the search returned every gene of the region with
+    its position on the chromosome.
+    """
+    genes = result["results"]
+    if result["total_count"] > len(genes):
+        return None
+
+    records = []
+    for gene in genes:
+        span = _gene_span(gene["summary"], chromosome)
+        if span is None:
+            return None
+        records.append((str(gene["uid"]), span[0], span[1], gene))
+    return records
+
+
+def _fan_out_batch_result(
+    result: Dict[str, Any], gene_ids: List[Any]
+) -> Dict[str, Any]:
+    """Rebuild a batch result for another list of the same genes.
+
+    Per-gene results are repeated for every position of the requested list
+    and echo its spelling; counts are recomputed. Homolog results are keyed
+    by gene ID, gene information results are listed in input order.
+    """
+    cached = result["results"]
+    records = cached.values() if isinstance(cached, dict) else cached
+    by_key = {_normalize_gene_id(record["gene_id"]): record for record in records}
+
+    fanned = [
+        {**by_key[_normalize_gene_id(gene_id)], "gene_id": gene_id}
+        for gene_id in gene_ids
+    ]
+    results: Any = fanned
+    if isinstance(cached, dict):
+        results = {record["gene_id"]: record for record in fanned}
+        fanned = list(results.values())
+    successful = len([record for record in fanned if record["success"]])
+
+    return {
+        **result,
+        "total_genes": len(gene_ids),
+        "unique_genes": len(by_key),
+        "deduplicated": len(gene_ids) - len(by_key),
+        "successful": successful,
+        "failed": len(fanned) - successful,
+        "results": results,
+    }
+
+
+def _gene_tag(gene_id: Any) -> str:
+    """Cache tag of results describing a gene."""
+    return f"gene:{_normalize_gene_id(gene_id)}"
+
+
+def _uid_tag(uid: Any) -> str:
+    """Cache tag of results describing an NCBI Gene UID."""
+    return f"uid:{str(uid).strip()}"
+
+
+def _gene_cache_tags(params: Dict[str, Any], result: Dict[str, Any]) -> List[str]:
+    """Collect the genes and UIDs a request and its result refer to."""
+    records = [params, result]
+    nested = result.get("results")
+    if isinstance(nested, dict):
+        nested = list(nested.values())
+    if isinstance(nested, list):
+        records.extend(record for record in nested if isinstance(record, dict))
+
+    tags = {_gene_tag(gene_id) for gene_id in params.get("gene_ids") or ()}
+    for record in records:
+        if record.get("gene_id"):
+            tags.add(_gene_tag(record["gene_id"]))
+        if record.get("uid"):
+            tags.add(_uid_tag(record["uid"]))
+    return sorted(tags)
+
+
 class NCBIGeneServer(BaseMCPServer):
     """MCP Server for NCBI Gene database operations."""
 
+    # Operations that take a gene_ids list and can be streamed in chunks
+    BATCH_OPERATIONS = ("batch_gene_info", "batch_gene_homologs")
+
+    CACHE_KEY_DEFAULTS = {
+        "get_gene_info": {"species": "human", "include_summary": True},
+        "search_genes": {"species": "human", "max_results": 20, "offset": 0},
+        "get_gene_summary": {"species": "human"},
+        "get_gene_homologs": {"species": "human"},
+        "get_gene_expression": {"species": "human"},
+        "get_gene_pathways": {"species": "human"},
+        "batch_gene_info": {"species": "human"},
+        "search_by_region": {"species": "human", "max_results": 50},
+        "search_by_region_enhanced": {"species": "human", "max_results": 50},
+        "batch_gene_homologs": {"source_species": "human", "max_batch_size": 25},
+    }
+
+    CACHE_KEY_NORMALIZERS = {
+        "gene_id": _normalize_gene_id,
+        "gene_ids": _normalize_gene_ids,
+        "species": _normalize_species,
+        "source_species": _normalize_species,
+    }
+
+    def __init__(self, config: Optional[GenomeMCPConfig] = None):
+        """Initialize the NCBI Gene server.
+
+        Args:
+            config: Configuration object. If None, loads from default config.
+        """
+        super().__init__(config)
+        self._region_index: Optional[RegionIndex] = None
+
     def _define_capabilities(self) -> ServerCapabilities:
         return ServerCapabilities(
             name="NCBIGeneServer",
@@ -38,7 +325,7 @@ class NCBIGeneServer(BaseMCPServer):
                 "batch_gene_homologs",  # Batch homologs search
             ],
             supports_batch=True,
-            supports_streaming=False,
+            supports_streaming=True,  # Batch operations stream chunk results
             max_batch_size=self.config.data_sources.ncbi.max_batch_size,
             rate_limit_requests=10,  # NCBI has strict rate limits
             rate_limit_window=60,
@@ -48,6 +335,181 @@ class NCBIGeneServer(BaseMCPServer):
     def _get_base_url(self) -> str:
         return self.config.data_sources.ncbi.base_url
 
+    @property
+    def region_index(self) -> Optional[RegionIndex]:
+        """Get the region index, or None if disabled."""
+        if (
+            self._region_index is None
+            and self.config.enable_caching
+            and self.config.cache.region_index_max_genes > 0
+        ):
+            cache_config = self.config.cache
+            self._region_index = RegionIndex(
+                max_genes=cache_config.region_index_max_genes,
+                ttl=cache_config.operation_ttls.get(
+                    "search_by_region", cache_config.ttl
+                ),
+            )
+        return self._region_index
+
+    def _shrinkable_caches(self) -> List[Shrinkable]:
+        """Release the region index under memory pressure too."""
+        caches = super()._shrinkable_caches()
+        if self._region_index is not None:
+            caches.append(self._region_index)
+        return caches
+
+    def _request_cache_key(self, operation: str, params: Dict[str, Any]) -> str:
+        """Key region searches by species and chromosome coordinates."""
+        if operation in REGION_OPERATIONS:
+            region_params = _canonical_region_params(params)
+            if region_params is not None:
+                operation, params = "search_by_region", region_params
+        return super()._request_cache_key(operation, params)
+
+    def _cache_namespace(self, operation: str) -> str:
+        """Put all region searches in the search_by_region namespace."""
+        if operation in REGION_OPERATIONS:
+            operation = "search_by_region"
+        return super()._cache_namespace(operation)
+
+    def _cache_tags(
+        self, operation: str, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> List[str]:
+        """Tag cached results with the genes and UIDs they describe."""
+        return _gene_cache_tags(params, result)
+
+    def invalidate(
+        self,
+        namespace: Optional[str] = None,
+        gene_id: Optional[str] = None,
+        uid: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Invalidate cached results by operation, gene and/or NCBI Gene UID.
+
+        Args:
+            namespace: Only invalidate results of this operation
+            gene_id: Invalidate results mentioning this gene symbol or ID
+            uid: Invalidate results mentioning this NCBI Gene UID
+
+        Returns:
+            Number of results and raw responses removed
+        """
+        tags = []
+        if gene_id:
+            tags.append(_gene_tag(gene_id))
+        if uid:
+            tags.append(_uid_tag(uid))
+        return self.invalidate_cache(namespace, tags)
+
+    def invalidate_cache(
+        self, namespace: Optional[str] = None, tags: Iterable[str] = ()
+    ) -> Dict[str, Any]:
+        """Invalidate cached results, including the region index.
+
+        The region index holds genes rather than results, so it is cleared
+        whenever region searches or any gene could be affected.
+        """
+        result = super().invalidate_cache(namespace, tags)
+        if self._region_index is not None and (
+            namespace is None or namespace in REGION_OPERATIONS
+        ):
+            self._region_index.clear()
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get server statistics, including the region index."""
+        stats = super().get_stats()
+        if self._region_index is not None:
+            stats["region_index"] = self._region_index.get_stats()
+        return stats
+
+    def _adapt_cached_result(
+        self, operation: str, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Echo the requested genes and species spelling in a cached result."""
+        gene_ids = params.get("gene_ids")
+        if operation in self.BATCH_OPERATIONS and isinstance(gene_ids, list):
+            result = _fan_out_batch_result(result, gene_ids)
+        defaults = self.CACHE_KEY_DEFAULTS.get(operation, {})
+        echoed = {}
+        for key in _ECHOED_PARAMS:
+            value = params.get(key, defaults.get(key))
+            if value is not None and key in result and result[key] != value:
+                echoed[key] = value
+        return {**result, **echoed} if echoed else result
+
+    async def execute_stream(
+        self, operation: str, params: Dict[str, Any]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Execute streaming request.
+
+        Batch operations yield one result per completed chunk; other
+        operations yield a single result.
+        """
+        gene_ids = params.get("gene_ids", [])
+        if operation not in self.BATCH_OPERATIONS:
+            async for chunk in super().execute_stream(operation, params):
+                yield chunk
+            return
+
+        if not gene_ids or not isinstance(gene_ids, list):
+            raise ValidationError(
+                "gene_ids must be a non-empty list", field_name="gene_ids"
+            )
+
+        async for chunk in self.iter_batch_operation(operation, gene_ids, params):
+            yield {"data": chunk}
+
+    def iter_batch_operation(
+        self,
+        operation: str,
+        gene_ids: Iterable[str],
+        params: Dict[str, Any],
+        chunk_size: Optional[int] = None,
+        lane: Optional[str] = None,
+        client_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a batch operation over gene IDs chunk by chunk.
+
+        Gene lookups are served from the result cache where possible; every
+        other lookup waits for the upstream rate limiter on its own.
+
+        Args:
+            operation: Batch operation name (see BATCH_OPERATIONS)
+            gene_ids: Iterable of gene IDs
+            params: Remaining operation parameters (species etc.)
+            chunk_size: Genes per chunk (optional)
+            lane: Scheduling lane (defaults to the lane of the operation)
+            client_id: Client the lookups are scheduled for (optional)
+
+        Returns:
+            Async iterator of partial batch results, one per chunk
+        """
+        if operation == "batch_gene_info":
+            return self.iter_batch_gene_info(
+                gene_ids,
+                params.get("species", "human"),
+                chunk_size,
+                fields=params.get("fields"),
+                lane=lane,
+                client_id=client_id,
+            )
+        if operation == "batch_gene_homologs":
+            return self.iter_batch_gene_homologs(
+                gene_ids,
+                source_species=params.get("source_species", "human"),
+                target_species=params.get("target_species"),
+                chunk_size=chunk_size or min(params.get("max_batch_size", 25), 50),
+                lane=lane,
+                client_id=client_id,
+            )
+        raise ValidationError(
+            f"Not a batch operation: {operation}",
+            field_name="operation",
+            field_value=operation,
+        )
+
     async def _execute_operation(
         self, operation: str, params: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -76,6 +538,40 @@ class NCBIGeneServer(BaseMCPServer):
         else:
             raise ValidationError(f"Unknown operation: {operation}")
 
+    async def _throttled_lookup(
+        self,
+        operation: str,
+        params: Dict[str, Any],
+        lane: str,
+        client_id: str,
+    ) -> Dict[str, Any]:
+        """Run one gene lookup of a batch through the result cache.
+
+        Cached lookups are served without waiting for the rate limiter;
+        fetched ones are cached like single requests of the same operation.
+        """
+        cache_key = None
+        if self.config.enable_caching:
+            cache_key = self._request_cache_key(operation, params)
+            cached_result = await self._get_from_cache(cache_key)
+            if cached_result:
+                self.stats.cache_hits += 1
+                self._get_client_stats(client_id).cache_hits += 1
+                return self._adapt_cached_result(operation, params, cached_result)
+            self.stats.cache_misses += 1
+
+        await self._acquire_upstream(lane, client_id)
+        result = await self._execute_operation(operation, params)
+
+        if cache_key is not None:
+            self._set_cache(
+                cache_key,
+                result,
+                ttl=self.config.cache.operation_ttls.get(operation),
+                tags=self._cache_tags(operation, params, result),
+            )
+        return result
+
     async def _get_gene_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed information about a specific gene.
 
@@ -84,6 +580,8 @@ class NCBIGeneServer(BaseMCPServer):
                 - gene_id: Gene ID (required)
                 - species: Species name (optional, default: human)
                 - include_summary: Include gene summary (optional, default: true)
+                - fields: esummary fields to return in "info" (optional,
+                  default: DEFAULT_GENE_FIELDS, "*" for the full document)
         """
         gene_id = params.get("gene_id")
         if not gene_id:
@@ -91,6 +589,7 @@ class NCBIGeneServer(BaseMCPServer):
 
         species = params.get("species", "human")
         include_summary = params.get("include_summary", True)
+        fields = _resolve_fields(params.get("fields"))
 
         # Build NCBI EUtils URL
         base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
@@ -123,7 +622,10 @@ class NCBIGeneServer(BaseMCPServer):
                 "gene_id": gene_id,
                 "species": species,
                 "uid": gene_uid,
-                "info": summary_response.get("result", {}).get(str(gene_uid), {}),
+                "info": _project_gene_document(
+                    summary_response.get("result", {}).get(str(gene_uid), {}),
+                    fields,
+                ),
                 "source": "NCBI Gene",
             }
 
@@ -146,11 +648,14 @@ class NCBIGeneServer(BaseMCPServer):
                 - species: Species name (optional, default: human)
                 - max_results: Maximum results (optional, default: 20)
                 - offset: Result offset (optional, default: 0)
+                - fields: esummary fields to return in "summary" (optional)
         """
         term = params.get("term")
         if not term:
             raise ValidationError("term is required", field_name="term")
 
+        fields = _resolve_fields(params.get("fields"))
+
         species = params.get("species", "human")
         max_results = min(params.get("max_results", 20), 100)
         offset = params.get("offset", 0)
@@ -195,7 +700,7 @@ class NCBIGeneServer(BaseMCPServer):
                                 "uid": uid,
                                 "gene_id": gene_data.get("name", ""),
                                 "description": gene_data.get("description", ""),
-                                "summary": gene_data,
+                                "summary": _project_gene_document(gene_data, fields),
                             }
                         )
             else:
@@ -323,10 +828,14 @@ class NCBIGeneServer(BaseMCPServer):
     async def _batch_gene_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get information for multiple genes in batch.
 
+        Lists of any length are accepted and fetched in chunks of
+        ``max_batch_size`` genes.
+
         Args:
             params: Parameters
                 - gene_ids: List of gene IDs (required)
                 - species: Species name (optional, default: human)
+                - fields: esummary fields to return per gene (optional)
         """
         gene_ids = params.get("gene_ids", [])
         if not gene_ids or not isinstance(gene_ids, list):
@@ -334,49 +843,34 @@ class NCBIGeneServer(BaseMCPServer):
                 "gene_ids must be a non-empty list", field_name="gene_ids"
             )
 
-        if len(gene_ids) > self.capabilities.max_batch_size:
-            raise ValidationError(
-                f"Batch size {len(gene_ids)} exceeds maximum {self.capabilities.max_batch_size}",
-                field_name="gene_ids",
-            )
-
         species = params.get("species", "human")
+        fields = params.get("fields")
+        _resolve_fields(fields)
 
-        # Execute requests in parallel
-        tasks = []
+        # Fetch each distinct gene once, even if the list repeats it
+        unique_gene_ids: Dict[str, str] = {}
         for gene_id in gene_ids:
-            task = self._get_gene_info(
-                {
-                    "gene_id": gene_id,
-                    "species": species,
-                    "include_summary": False,  # Skip summary for batch to improve performance
-                }
-            )
-            tasks.append(task)
+            unique_gene_ids.setdefault(_normalize_gene_id(gene_id), gene_id)
 
         try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            processed_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    processed_results.append(
-                        {
-                            "gene_id": gene_ids[i],
-                            "success": False,
-                            "error": str(result),
-                            "error_type": type(result).__name__,
-                        }
-                    )
-                else:
-                    processed_results.append(
-                        {"gene_id": gene_ids[i], "success": True, "data": result}
-                    )
+            results_by_key: Dict[str, Dict[str, Any]] = {}
+            async for chunk in self.iter_batch_gene_info(
+                unique_gene_ids.values(), species, fields=fields
+            ):
+                for result in chunk["results"]:
+                    results_by_key[_normalize_gene_id(result["gene_id"])] = result
+
+            # Fan results out to every requested position
+            processed_results = [
+                {**results_by_key[_normalize_gene_id(gene_id)], "gene_id": gene_id}
+                for gene_id in gene_ids
+            ]
 
             return {
                 "species": species,
                 "total_genes": len(gene_ids),
+                "unique_genes": len(unique_gene_ids),
+                "deduplicated": len(gene_ids) - len(unique_gene_ids),
                 "successful": len([r for r in processed_results if r["success"]]),
                 "failed": len([r for r in processed_results if not r["success"]]),
                 "results": processed_results,
@@ -385,6 +879,109 @@ class NCBIGeneServer(BaseMCPServer):
         except Exception as e:
             raise APIError(f"Failed to execute batch gene info: {str(e)}")
 
+    async def iter_batch_gene_info(
+        self,
+        gene_ids: Iterable[str],
+        species: str = "human",
+        chunk_size: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        lane: Optional[str] = None,
+        client_id: Optional[str] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Fetch gene information for an arbitrarily large gene list in chunks.
+
+        Gene ids are consumed lazily and the next chunk is fetched while the
+        caller consumes the current one, so memory is bounded by two chunks.
+
+        Args:
+            gene_ids: Iterable of gene IDs
+            species: Species name
+            chunk_size: Genes per chunk (default: max_batch_size)
+            fields: esummary fields to return per gene (optional)
+            lane: Scheduling lane (default: lane of batch_gene_info)
+            client_id: Client the lookups are scheduled for (optional)
+
+        Yields:
+            Partial batch results, one per chunk
+        """
+        chunk_size = chunk_size or self.capabilities.max_batch_size
+        lane = self._resolve_lane("batch_gene_info", lane)
+        client_id = client_id or DEFAULT_CLIENT_ID
+        progress = ProgressTracker.for_items(gene_ids, unit="genes")
+        offset = 0
+
+        async def run_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            return await self._batch_gene_info_chunk(
+                chunk, species, fields, lane, client_id
+            )
+
+        async for chunk_results in pipeline_chunks(
+            iter_chunks(gene_ids, chunk_size), run_chunk
+        ):
+            await progress.advance(len(chunk_results))
+            yield {
+                "species": species,
+                "offset": offset,
+                "total_genes": len(chunk_results),
+                "successful": len([r for r in chunk_results if r["success"]]),
+                "failed": len([r for r in chunk_results if not r["success"]]),
+                "results": chunk_results,
+                "progress": progress.snapshot(),
+            }
+            offset += len(chunk_results)
+
+    async def _batch_gene_info_chunk(
+        self,
+        gene_ids: List[str],
+        species: str,
+        fields: Optional[List[str]],
+        lane: str,
+        client_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Fetch gene information for one chunk of genes concurrently."""
+        unique_gene_ids: Dict[str, str] = {}
+        for gene_id in gene_ids:
+            unique_gene_ids.setdefault(_normalize_gene_id(gene_id), gene_id)
+
+        # Execute requests in parallel
+        tasks = []
+        for gene_id in unique_gene_ids.values():
+            task = self._throttled_lookup(
+                "get_gene_info",
+                {
+                    "gene_id": gene_id,
+                    "species": species,
+                    "include_summary": False,  # Skip summary for batch to improve performance
+                    "fields": fields,
+                },
+                lane,
+                client_id,
+            )
+            tasks.append(task)
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results_by_key = dict(zip(unique_gene_ids, results))
+
+        # Process results
+        processed_results = []
+        for gene_id in gene_ids:
+            result = results_by_key[_normalize_gene_id(gene_id)]
+            if isinstance(result, Exception):
+                processed_results.append(
+                    {
+                        "gene_id": gene_id,
+                        "success": False,
+                        "error": str(result),
+                        "error_type": type(result).__name__,
+                    }
+                )
+            else:
+                processed_results.append(
+                    {"gene_id": gene_id, "success": True, "data": result}
+                )
+
+        return processed_results
+
     async def _search_by_region(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search for genes in a genomic region.
 
@@ -415,15 +1012,110 @@ class NCBIGeneServer(BaseMCPServer):
         except Exception as e:
             raise ValidationError(f"Invalid genomic position: {str(e)}")
 
-        # Build search term for genomic region
-        search_term = f"{chromosome}:{start}-{end}[chr] AND {species}[Organism]"
+        search_params = {
+            "term": _region_term(chromosome, start, end, species),
+            "species": species,
+            "max_results": params.get("max_results", 50),
+            "fields": params.get("fields"),
+        }
+        index = self.region_index
+        if index is None:
+            return await self._search_genes(search_params)
+
+        return await self._search_indexed_region(
+            index, chromosome, start, end, species, search_params
+        )
 
-        return await self._search_genes(
-            {
-                "term": search_term,
+    async def _search_indexed_region(
+        self,
+        index: RegionIndex,
+        chromosome: str,
+        start: int,
+        end: int,
+        species: str,
+        search_params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Search a genomic region through the region index.
+
+        Only the parts of the region not covered by the index are fetched;
+        the genes are then taken from the index, ordered by position. The
+        first fetch uses the upstream turn of the region search itself, every
+        further one waits for its own. Regions holding more genes than one
+        search returns are not indexed: once a gap turns out to be that
+        dense, the remaining gaps are skipped and the region is searched
+        directly.
+
+        Returns:
+            Search result
+        """
+        requested_fields = _resolve_fields(search_params["fields"])
+        fetch_fields = requested_fields
+        if fetch_fields is not None and "genomicinfo" not in fetch_fields:
+            fetch_fields += ("genomicinfo",)
+        fetch_selector = list(fetch_fields or (ALL_FIELDS,))
+        scope = f"{_normalize_species(species)}:{','.join(fetch_selector)}"
+        lane = self._resolve_lane("search_by_region")
+
+        gaps = index.gaps(scope, chromosome, start, end)
+        fetches = 0
+        genes: Optional[List[Dict[str, Any]]] = None
+        for gap_start, gap_end in gaps:
+            gap_params = {
+                "term": _region_term(chromosome, gap_start, gap_end, species),
                 "species": species,
-                "max_results": params.get("max_results", 50),
+                "max_results": REGION_FETCH_SIZE,
+                "fields": fetch_selector,
             }
+            gap_result = await self._region_fetch(gap_params, fetches, lane)
+            fetches += 1
+            records = _region_records(gap_result, chromosome)
+            if records is None:
+                if gaps == [(start, end)]:
+                    # Nothing was covered, so the gap search is the region search
+                    genes = gap_result["results"]
+                    total_count = gap_result["total_count"]
+                break
+            index.add(scope, chromosome, gap_start, gap_end, records)
+        else:
+            genes = index.query(scope, chromosome, start, end)
+            if genes is not None:
+                total_count = len(genes)
+
+        if genes is None:
+            # Too dense to index (or evicted meanwhile): search it directly
+            return await self._region_fetch(search_params, fetches, lane)
+
+        max_results = min(search_params["max_results"], 100)
+        results = genes[:max_results]
+        if fetch_fields != requested_fields:
+            for gene in results:
+                gene["summary"] = _project_gene_document(
+                    gene["summary"], requested_fields
+                )
+
+        return {
+            "term": search_params["term"],
+            "species": species,
+            "results": results,
+            "total_count": total_count,
+            "offset": 0,
+            "max_results": max_results,
+        }
+
+    async def _region_fetch(
+        self, params: Dict[str, Any], fetches: int, lane: str
+    ) -> Dict[str, Any]:
+        """Run one search of a region search.
+
+        Args:
+            params: search_genes parameters
+            fetches: Number of searches the region search has already run
+            lane: Scheduling lane of further searches
+        """
+        if not fetches:
+            return await self._search_genes(params)
+        return await self._throttled_lookup(
+            "search_genes", params, lane, DEFAULT_CLIENT_ID
         )
 
     async def _get_gene_expression(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -557,6 +1249,7 @@ class NCBIGeneServer(BaseMCPServer):
                 "end": parsed_region["end"],
                 "species": species,
                 "max_results": max_results,
+                "fields": params.get("fields"),
             }
         )
 
@@ -576,78 +1269,34 @@ class NCBIGeneServer(BaseMCPServer):
                 "gene_ids must be a non-empty list", field_name="gene_ids"
             )
 
-        if len(gene_ids) > 100:  # Safety limit
-            raise ValidationError(
-                f"Batch size {len(gene_ids)} exceeds maximum 100",
-                field_name="gene_ids",
-            )
-
         source_species = params.get("source_species", "human")
         target_species = params.get("target_species")
         max_batch_size = min(params.get("max_batch_size", 25), 50)
 
+        # Fetch each distinct gene once, even if the list repeats it
+        unique_gene_ids: Dict[str, str] = {}
+        for gene_id in gene_ids:
+            unique_gene_ids.setdefault(_normalize_gene_id(gene_id), gene_id)
+
         # Process in batches to avoid overwhelming the API
         all_results = {}
-
-        for i in range(0, len(gene_ids), max_batch_size):
-            batch_gene_ids = gene_ids[i : i + max_batch_size]
-
-            # Create tasks for concurrent execution
-            tasks = []
-            for gene_id in batch_gene_ids:
-                task = self._get_gene_homologs(
-                    {
-                        "gene_id": gene_id,
-                        "species": source_species,
-                        "target_species": target_species,
-                    }
-                )
-                tasks.append(task)
-
-            try:
-                # Execute batch concurrently
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process results
-                for gene_id, result in zip(batch_gene_ids, batch_results):
-                    if isinstance(result, Exception):
-                        all_results[gene_id] = {
-                            "success": False,
-                            "error": str(result),
-                            "error_type": type(result).__name__,
-                            "gene_id": gene_id,
-                            "species": source_species,
-                            "homologs": [],
-                        }
-                    else:
-                        if isinstance(result, dict):
-                            all_results[gene_id] = {
-                                "success": True,
-                                "gene_id": gene_id,
-                                "species": source_species,
-                                "homologs": result.get("homologs", []),
-                            }
-                        else:
-                            all_results[gene_id] = {
-                                "success": False,
-                                "error": f"Unexpected result type: {type(result)}",
-                                "error_type": "TypeError",
-                                "gene_id": gene_id,
-                                "species": source_species,
-                                "homologs": [],
-                            }
-
-            except Exception as e:
-                # If batch fails completely, record error for all genes in batch
-                for gene_id in batch_gene_ids:
-                    all_results[gene_id] = {
-                        "success": False,
-                        "error": f"Batch processing failed: {str(e)}",
-                        "error_type": "BatchError",
-                        "gene_id": gene_id,
-                        "species": source_species,
-                        "homologs": [],
-                    }
+        async for chunk in self.iter_batch_gene_homologs(
+            unique_gene_ids.values(),
+            source_species=source_species,
+            target_species=target_species,
+            chunk_size=max_batch_size,
+        ):
+            for result in chunk["results"]:
+                all_results[result["gene_id"]] = result
+
+        # Fan results out to duplicate spellings of the same gene
+        for gene_id in gene_ids:
+            if gene_id not in all_results:
+                canonical_id = unique_gene_ids[_normalize_gene_id(gene_id)]
+                all_results[gene_id] = {
+                    **all_results[canonical_id],
+                    "gene_id": gene_id,
+                }
 
         # Calculate statistics
         successful_count = len([r for r in all_results.values() if r["success"]])
@@ -657,7 +1306,132 @@ class NCBIGeneServer(BaseMCPServer):
             "source_species": source_species,
             "target_species": target_species,
             "total_genes": len(gene_ids),
+            "unique_genes": len(unique_gene_ids),
+            "deduplicated": len(gene_ids) - len(unique_gene_ids),
             "successful": successful_count,
             "failed": failed_count,
             "results": all_results,
         }
+
+    async def iter_batch_gene_homologs(
+        self,
+        gene_ids: Iterable[str],
+        source_species: str = "human",
+        target_species: Optional[Any] = None,
+        chunk_size: int = 25,
+        lane: Optional[str] = None,
+        client_id: Optional[str] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Fetch homologs for an arbitrarily large gene list in chunks.
+
+        Args:
+            gene_ids: Iterable of gene IDs
+            source_species: Source species
+            target_species: Target species filter (optional)
+            chunk_size: Genes per chunk
+            lane: Scheduling lane (default: lane of batch_gene_homologs)
+            client_id: Client the lookups are scheduled for (optional)
+
+        Yields:
+            Partial batch results with one result per input gene, one per chunk
+        """
+        lane = self._resolve_lane("batch_gene_homologs", lane)
+        client_id = client_id or DEFAULT_CLIENT_ID
+        progress = ProgressTracker.for_items(gene_ids, unit="genes")
+        offset = 0
+
+        async def run_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            return await self._batch_gene_homologs_chunk(
+                chunk, source_species, target_species, lane, client_id
+            )
+
+        async for chunk_results in pipeline_chunks(
+            iter_chunks(gene_ids, chunk_size), run_chunk
+        ):
+            successful_count = len([r for r in chunk_results if r["success"]])
+            await progress.advance(len(chunk_results))
+            yield {
+                "source_species": source_species,
+                "target_species": target_species,
+                "offset": offset,
+                "total_genes": len(chunk_results),
+                "successful": successful_count,
+                "failed": len(chunk_results) - successful_count,
+                "results": chunk_results,
+                "progress": progress.snapshot(),
+            }
+            offset += len(chunk_results)
+
+    async def _batch_gene_homologs_chunk(
+        self,
+        batch_gene_ids: List[str],
+        source_species: str,
+        target_species: Optional[Any],
+        lane: str,
+        client_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Fetch homologs for one chunk of genes concurrently.
+
+        Returns one result per input gene, in input order; repeated genes
+        are fetched once.
+        """
+        unique_gene_ids: Dict[str, str] = {}
+        for gene_id in batch_gene_ids:
+            unique_gene_ids.setdefault(_normalize_gene_id(gene_id), gene_id)
+
+        # Create tasks for concurrent execution
+        tasks = []
+        for gene_id in unique_gene_ids.values():
+            task = self._throttled_lookup(
+                "get_gene_homologs",
+                {
+                    "gene_id": gene_id,
+                    "species": source_species,
+                    "target_species": target_species,
+                },
+                lane,
+                client_id,
+            )
+            tasks.append(task)
+
+        # Execute batch concurrently
+        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        results_by_key = dict(zip(unique_gene_ids, batch_results))
+
+        # Process results
+        chunk_results = []
+        for gene_id in batch_gene_ids:
+            result = results_by_key[_normalize_gene_id(gene_id)]
+            if isinstance(result, Exception):
+                chunk_results.append(
+                    {
+                        "success": False,
+                        "error": str(result),
+                        "error_type": type(result).__name__,
+                        "gene_id": gene_id,
+                        "species": source_species,
+                        "homologs": [],
+                    }
+                )
+            elif isinstance(result, dict):
+                chunk_results.append(
+                    {
+                        "success": True,
+                        "gene_id": gene_id,
+                        "species": source_species,
+                        "homologs": result.get("homologs", []),
+                    }
+                )
+            else:
+                chunk_results.append(
+                    {
+                        "success": False,
+                        "error": f"Unexpected result type: {type(result)}",
+                        "error_type": "TypeError",
+                        "gene_id": gene_id,
+                        "species": source_species,
+                        "homologs": [],
+                    }
+                )
+
+        return chunk_results
@@ -0,0 +1,202 @@
+"""
+Startup cache warming for Genome MCP.
+
+This module pre-populates the result cache with a known gene panel when a
+server starts, so the genes users ask for most are answered from the cache
+instead of waiting on rate-limited upstream APIs. Warming requests run in the
+background through the server's batch path, in a low-priority scheduling
+lane and only a few at a time, so they only use upstream capacity left over
+by interactive requests and never hold all execution slots of their lane.
+Genes that are already cached (e.g. restored from a snapshot) cost nothing.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+import structlog
+
+from genome_mcp.configuration import WarmerConfig
+from genome_mcp.exceptions import DataNotFoundError, ValidationError
+
+if TYPE_CHECKING:
+    from genome_mcp.servers.base import BaseMCPServer
+
+logger = structlog.get_logger(__name__)
+
+WARMER_CLIENT_ID = "cache-warmer"
+
+
+def read_gene_panel(path: str) -> Iterator[str]:
+    """
+    Read gene IDs from a panel file.
+
+    Each line holds a gene ID in its first tab-separated column; blank lines
+    and lines starting with "#" are skipped.
+
+    Args:
+        path: Panel file
+
+    Yields:
+        Gene IDs in file order
+    """
+    panel_path = Path(path).expanduser()
+    if not panel_path.is_file():
+        raise DataNotFoundError(f"Gene panel file not found: {path}")
+
+    with open(panel_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            gene_id = line.split("\t", 1)[0].strip()
+            if gene_id:
+                yield gene_id
+
+
+class CacheWarmer:
+    """Fetch a gene panel in the background to pre-populate the result cache."""
+
+    def __init__(self, server: "BaseMCPServer", config: WarmerConfig):
+        """
+        Initialize cache warmer.
+
+        Args:
+            server: Server whose cache is warmed
+            config: Warmer configuration
+        """
+        unknown = [
+            op for op in config.operations if op not in server.capabilities.operations
+        ]
+        if unknown:
+            raise ValidationError(
+                f"Unknown warmer operations: {', '.join(unknown)}",
+                field_name="operations",
+                field_value=unknown,
+            )
+
+        lane = config.lane or server.config.scheduling.batch_lane
+        if lane not in server.config.scheduling.lane_weights:
+            raise ValidationError(
+                f"Unknown scheduling lane: {lane}", field_name="lane", field_value=lane
+            )
+
+        self.server = server
+        self.config = config
+        self.lane = lane
+        self.status = "idle"
+        self.genes_total = 0
+        self.requests_total = 0
+        self.requests_completed = 0
+        self.requests_successful = 0
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether warming is in progress."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start warming in the background on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop warming."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _gene_panel(self) -> List[str]:
+        """Get the distinct genes of the configured panel, in panel order."""
+        genes = list(self.config.genes)
+        if self.config.panel_file:
+            genes.extend(read_gene_panel(self.config.panel_file))
+        return list(dict.fromkeys(genes))
+
+    def _iter_requests(self, genes: List[str]) -> Iterator[Dict[str, Any]]:
+        """Build the batch requests warming each gene."""
+        for gene_id in genes:
+            for operation in self.config.operations:
+                yield {
+                    "operation": operation,
+                    "params": {"gene_id": gene_id, "species": self.config.species},
+                    "lane": self.lane,
+                }
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Fetch the gene panel through the batch path.
+
+        Returns:
+            Warming statistics
+        """
+        self.status = "running"
+        self.started_at = time.time()
+        self.finished_at = None
+        self.error = None
+        self.requests_completed = 0
+        self.requests_successful = 0
+
+        try:
+            genes = self._gene_panel()
+            self.genes_total = len(genes)
+            self.requests_total = len(genes) * len(self.config.operations)
+            logger.info(
+                "Cache warming started",
+                genes=self.genes_total,
+                operations=self.config.operations,
+            )
+
+            async for results in self.server.execute_batch_stream(
+                self._iter_requests(genes),
+                client_id=WARMER_CLIENT_ID,
+                chunk_size=self.config.chunk_size,
+                max_concurrency=self.config.max_concurrency,
+            ):
+                self.requests_completed += len(results)
+                self.requests_successful += len([r for r in results if r["success"]])
+
+            self.status = "completed"
+            logger.info(
+                "Cache warming completed",
+                successful=self.requests_successful,
+                failed=self.requests_completed - self.requests_successful,
+            )
+
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+            raise
+
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+            logger.error("Cache warming failed", error=str(e))
+
+        finally:
+            self.finished_at = time.time()
+
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get warming progress."""
+        end_time = self.finished_at or time.time()
+        return {
+            "status": self.status,
+            "genes_total": self.genes_total,
+            "requests_total": self.requests_total,
+            "requests_completed": self.requests_completed,
+            "requests_successful": self.requests_successful,
+            "requests_failed": self.requests_completed - self.requests_successful,
+            "progress": (
+                self.requests_completed / self.requests_total
+                if self.requests_total
+                else 0.0
+            ),
+            "elapsed": round(end_time - self.started_at, 3) if self.started_at else 0.0,
+            "error": self.error,
+        }
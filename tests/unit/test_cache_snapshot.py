@@ -0,0 +1,200 @@
+"""
+Tests for result cache snapshots.
+
+This module contains tests for saving result caches to snapshot files and
+restoring them, directly and through server startup and shutdown.
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from genome_mcp import main
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.core import (
+    CompactRecordCodec,
+    DiskCache,
+    ResultCache,
+    TieredResultCache,
+    TinyLFU,
+    load_snapshot,
+    save_snapshot,
+)
+from genome_mcp.exceptions import DataFormatError, ValidationError
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+
+
+def _gene_result(gene_id: str) -> dict:
+    return {
+        "gene_id": gene_id,
+        "species": "human",
+        "uid": "7157",
+        "info": {"name": gene_id, "chromosome": "17"},
+        "source": "NCBI Gene",
+    }
+
+
+class TestCacheSnapshot:
+    """Test saving and loading snapshot files."""
+
+    def test_round_trip(self, tmp_path):
+        """Results, expiry times and tags survive a snapshot."""
+        cache = ResultCache(codec=CompactRecordCodec())
+        cache.set("srv:info:TP53", _gene_result("TP53"), ttl=600, tags=["gene:TP53"])
+        cache.set("srv:info:EGFR", _gene_result("EGFR"))
+        cache.set("srv:info:old", {"v": 1})
+        cache.expire("srv:info:old")
+
+        summary = save_snapshot(cache, tmp_path / "cache.snap")
+        assert summary["entries"] == 2
+
+        restored = ResultCache(codec=CompactRecordCodec())
+        summary = load_snapshot(restored, tmp_path / "cache.snap")
+        assert summary["restored"] == 2
+        assert list(restored.keys()) == ["srv:info:TP53", "srv:info:EGFR"]
+        assert restored.get("srv:info:TP53") == _gene_result("TP53")
+        assert restored.invalidate(tags=["gene:TP53"]) == 1
+
+    def test_expired_entries_are_skipped(self, tmp_path):
+        """Entries that expired after the snapshot are not restored."""
+        cache = ResultCache()
+        cache.set("srv:info:a", {"v": 1}, ttl=0.05)
+        cache.set("srv:info:b", {"v": 2})
+        save_snapshot(cache, tmp_path / "cache.snap")
+        time.sleep(0.1)
+
+        restored = ResultCache()
+        summary = load_snapshot(restored, tmp_path / "cache.snap")
+        assert (summary["restored"], summary["expired"]) == (1, 1)
+        assert list(restored.keys()) == ["srv:info:b"]
+
+    def test_smaller_cache_keeps_recent_entries(self, tmp_path):
+        """Restoring into a smaller cache keeps the most recently used entries."""
+        cache = ResultCache(max_size=10)
+        for i in range(10):
+            cache.set(f"srv:info:{i}", {"v": i})
+        cache.get("srv:info:0")
+        save_snapshot(cache, tmp_path / "cache.snap")
+
+        restored = ResultCache(max_size=3, admission=TinyLFU(3))
+        load_snapshot(restored, tmp_path / "cache.snap")
+        assert list(restored.keys()) == ["srv:info:8", "srv:info:9", "srv:info:0"]
+
+    def test_tiered_cache_includes_disk_tier(self, tmp_path):
+        """Snapshots of a tiered cache include demoted entries."""
+        cache = TieredResultCache(DiskCache(tmp_path / "cache.db"), max_size=2)
+        for gene_id in ("A", "B", "C", "D"):
+            cache.set(f"k:{gene_id}", _gene_result(gene_id))
+
+        assert save_snapshot(cache, tmp_path / "cache.snap")["entries"] == 4
+
+    def test_invalid_snapshot(self, tmp_path):
+        """Files that are not snapshots are rejected."""
+        path = tmp_path / "cache.snap"
+        with gzip.open(path, "wb") as f:
+            f.write(b'{"format": "other"}\n')
+        with pytest.raises(DataFormatError):
+            load_snapshot(ResultCache(), path)
+
+        path.write_bytes(b"not gzip")
+        with pytest.raises(DataFormatError):
+            load_snapshot(ResultCache(), path)
+
+
+class TestServerSnapshots:
+    """Test snapshots at server startup and shutdown."""
+
+    def _server(self, tmp_path) -> NCBIGeneServer:
+        config = GenomeMCPConfig()
+        config.cache.snapshot_path = str(tmp_path / "cache.snap")
+        return NCBIGeneServer(config)
+
+    async def test_warm_start(self, tmp_path):
+        """A server saves its cache at shutdown and reloads it at startup."""
+        server = self._server(tmp_path)
+        await server.start()
+        server.cache.set("ncbi_gene:get_gene_info:TP53", _gene_result("TP53"))
+        await server.stop()
+
+        restarted = self._server(tmp_path)
+        await restarted.start()
+        try:
+            cached = restarted.cache.get("ncbi_gene:get_gene_info:TP53")
+            assert cached == _gene_result("TP53")
+        finally:
+            await restarted.stop()
+
+    def test_snapshot_path_required(self):
+        """Saving without a path fails unless one is configured."""
+        server = NCBIGeneServer(GenomeMCPConfig())
+        with pytest.raises(ValidationError):
+            server.save_cache_snapshot()
+        with pytest.raises(ValidationError):
+            server.load_cache_snapshot("/nonexistent/cache.snap")
+
+    def test_snapshots_stay_in_snapshot_dir(self, tmp_path):
+        """Explicit snapshot paths must be next to the configured snapshot."""
+        server = self._server(tmp_path)
+
+        summary = server.save_cache_snapshot("manual.snap")
+        assert summary["path"] == str(tmp_path / "manual.snap")
+        assert server.load_cache_snapshot(str(tmp_path / "manual.snap"))
+        for path in ("../cache.snap", "/etc/passwd", str(tmp_path.parent / "x")):
+            with pytest.raises(ValidationError):
+                server.save_cache_snapshot(path)
+            with pytest.raises(ValidationError):
+                server.load_cache_snapshot(path)
+
+
+class TestOfflineSnapshots:
+    """Test saving and loading snapshots from the command line."""
+
+    def _config(self, tmp_path, backend: str = "tiered") -> GenomeMCPConfig:
+        config = GenomeMCPConfig()
+        config.cache.backend = backend
+        config.cache.disk_path = str(tmp_path / "cache.db")
+        return config
+
+    def test_round_trip_through_disk_tier(self, tmp_path, monkeypatch):
+        """Snapshots are saved from and loaded into the disk tier."""
+        config = self._config(tmp_path)
+        cache = NCBIGeneServer(config).cache
+        cache.set("ncbi_gene:get_gene_info:TP53", _gene_result("TP53"))
+        cache.close()
+        monkeypatch.setattr(main, "get_config", lambda: self._config(tmp_path))
+        path = str(tmp_path / "cache.snap")
+
+        saved = main._run_cache_snapshot(
+            argparse.Namespace(save_cache_snapshot=path, load_cache_snapshot=None)
+        )
+        os.remove(tmp_path / "cache.db")
+        loaded = main._run_cache_snapshot(
+            argparse.Namespace(save_cache_snapshot=None, load_cache_snapshot=path)
+        )
+
+        assert saved["entries"] == 1
+        assert loaded["restored"] == 1
+        restored = NCBIGeneServer(self._config(tmp_path)).cache
+        try:
+            assert restored.get("ncbi_gene:get_gene_info:TP53") == _gene_result("TP53")
+        finally:
+            restored.close()
+
+    def test_memory_backend_rejected(self, tmp_path, monkeypatch):
+        """Memory caches do not outlive the server, so there is nothing to save."""
+        monkeypatch.setattr(
+            main, "get_config", lambda: self._config(tmp_path, "memory")
+        )
+        with pytest.raises(ValidationError):
+            main._run_cache_snapshot(
+                argparse.Namespace(
+                    save_cache_snapshot=str(tmp_path / "cache.snap"),
+                    load_cache_snapshot=None,
+                )
+            )
@@ -39,6 +39,8 @@ class TestConfigModels:
         assert config.enabled is True
         assert config.ttl == 3600
         assert config.max_size == 1000
+        assert config.admission_policy == "none"
+        assert config.compact_records is False
 
         # Invalid TTL (too small)
         with pytest.raises(ValueError):
@@ -52,6 +54,31 @@ class TestConfigModels:
         with pytest.raises(ValueError):
             CacheConfig(max_size=50)
 
+    def test_cache_codec_validation(self):
+        """Test that CacheConfig selects at most one stored value format."""
+        assert CacheConfig(compression="zlib").compression == "zlib"
+
+        with pytest.raises(ValueError):
+            CacheConfig(compression="zlib", compact_records=True)
+        with pytest.raises(ValueError):
+            CacheConfig(compression="zlib", dedup=True)
+        with pytest.raises(ValueError):
+            CacheConfig(dedup=True, compact_records=True)
+
+    def test_cache_backend_validation(self):
+        """Test CacheConfig backend validation."""
+        assert CacheConfig(backend="tiered").backend == "tiered"
+
+        # Deprecated backends fall back to memory
+        with pytest.warns(DeprecationWarning):
+            assert CacheConfig(backend="redis").backend == "memory"
+        with pytest.warns(DeprecationWarning):
+            assert CacheConfig(backend="file").backend == "memory"
+
+        # Unknown backend
+        with pytest.raises(ValueError):
+            CacheConfig(backend="memcached")
+
     def test_rate_limit_config_validation(self):
         """Test RateLimitConfig validation."""
         # Valid config
@@ -0,0 +1,175 @@
+"""
+Tests for the disk cache tier.
+
+This module contains tests for the SQLite result store and the two-tier
+memory/disk result cache.
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.core import CompactRecordCodec, DiskCache, TieredResultCache, TinyLFU
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+
+
+def _gene_result(gene_id: str) -> dict:
+    return {
+        "gene_id": gene_id,
+        "species": "human",
+        "uid": "7157",
+        "info": {"name": gene_id, "summary": "protein " * 50},
+        "source": "NCBI Gene",
+    }
+
+
+class TestDiskCache:
+    """Test the SQLite result store."""
+
+    def test_put_get_and_compression(self, tmp_path):
+        """Stored results round-trip with their expiry and tags."""
+        disk = DiskCache(tmp_path / "cache.db", compress_min_size=64)
+        expires = time.time() + 60
+        disk.put("srv:info:a", _gene_result("TP53"), expires, ["gene:TP53"])
+        disk.put("srv:info:b", {"small": 1}, expires)
+
+        assert disk.get("srv:info:a") == (_gene_result("TP53"), expires, ("gene:TP53",))
+        assert disk.get("srv:info:b")[0] == {"small": 1}
+        assert disk.get("missing") is None
+        assert disk.get_stats()["hits"] == 2
+        disk.close()
+
+    def test_invalidate(self, tmp_path):
+        """Entries are removed by prefix, tag, or both."""
+        disk = DiskCache(tmp_path / "cache.db")
+        expires = time.time() + 60
+        disk.put("srv:info:1", {}, expires, ["gene:TP53"])
+        disk.put("srv:info:2", {}, expires, ["gene:EGFR"])
+        disk.put("srv:search:1", {}, expires, ["gene:TP53"])
+
+        assert disk.invalidate("srv:search:", ["gene:EGFR"]) == set()
+        assert disk.invalidate("srv:info:", ["gene:TP53"]) == {"srv:info:1"}
+        assert disk.invalidate("srv:info:") == {"srv:info:2"}
+        assert disk.invalidate(tags=["gene:TP53"]) == {"srv:search:1"}
+        assert len(disk) == 0
+
+    def test_trim(self, tmp_path):
+        """The store is trimmed to capacity, expired entries first."""
+        disk = DiskCache(tmp_path / "cache.db", max_entries=2)
+        now = time.time()
+        disk.put("expired", {}, now - 1)
+        disk.put("late", {}, now + 300)
+        disk.put("soon", {}, now + 10)
+        disk.put("later", {}, now + 600)
+
+        assert disk.trim() == 2
+        assert "late" in disk and "later" in disk
+
+
+class TestTieredResultCache:
+    """Test promotion and demotion between memory and disk."""
+
+    def _cache(self, tmp_path, max_size: int = 2) -> TieredResultCache:
+        return TieredResultCache(
+            DiskCache(tmp_path / "cache.db"),
+            max_size=max_size,
+            codec=CompactRecordCodec(),
+        )
+
+    def test_demotion_and_promotion(self, tmp_path):
+        """LRU entries move to disk and come back on access."""
+        cache = self._cache(tmp_path)
+        for gene_id in ("A", "B", "C"):
+            cache.set(f"k:{gene_id}", _gene_result(gene_id), tags=[f"gene:{gene_id}"])
+
+        assert list(cache.keys()) == ["k:B", "k:C"]
+        assert "k:A" in cache
+
+        assert cache.get("k:A") == _gene_result("A")
+        assert list(cache.keys()) == ["k:C", "k:A"]
+
+        stats = cache.get_stats()
+        assert stats["demotions"] == 2
+        assert stats["promotions"] == 1
+        assert stats["pending_demotions"] == 1
+
+        assert cache.flush() == 2
+        assert cache.get_stats()["disk"]["entries"] == 3
+
+        # Tags travel with demoted entries
+        assert cache.invalidate(tags=["gene:A"]) == 1
+        assert cache.get("k:A") is None
+
+    async def test_disk_io_runs_off_the_event_loop(self, tmp_path):
+        """Disk reads and demotion writes run on the disk thread."""
+        cache = self._cache(tmp_path, max_size=1)
+        cache.DEMOTION_BATCH = 1
+        threads = []
+
+        def recorded(function):
+            def wrapper(*args):
+                threads.append(threading.current_thread().name)
+                return function(*args)
+
+            return wrapper
+
+        cache.disk.get = recorded(cache.disk.get)
+        cache.disk.put_many = recorded(cache.disk.put_many)
+        cache.set("k:A", _gene_result("A"))
+        cache.set("k:B", _gene_result("B"))
+
+        assert await cache.get_async("k:A") == _gene_result("A")
+        assert await cache.get_async("k:missing") is None
+        assert len(threads) == 4
+        assert all(name.startswith("disk-cache") for name in threads)
+        assert list(cache.keys()) == ["k:A"]
+
+    def test_expired_entries_are_not_promoted(self, tmp_path):
+        """Expired disk entries are only returned when stale results are allowed."""
+        cache = self._cache(tmp_path, max_size=1)
+        cache.set("k:A", {"v": 1})
+        cache.set("k:B", {"v": 2})
+        cache.expire()
+
+        assert cache.get("k:A") is None
+        assert cache.get("k:A", allow_stale=True) == {"v": 1}
+        assert cache.expire("k:A") is True
+        assert cache.expire("k:missing") is False
+
+    def test_close_persists_memory_tier(self, tmp_path):
+        """Closing the cache writes fresh memory entries to disk."""
+        cache = self._cache(tmp_path, max_size=10)
+        cache.set("k:A", _gene_result("A"))
+        cache.close()
+
+        reopened = self._cache(tmp_path, max_size=10)
+        assert reopened.get("k:A") == _gene_result("A")
+
+    def test_rejected_entries_go_to_disk(self, tmp_path):
+        """Entries not admitted to memory are still kept on disk."""
+        cache = TieredResultCache(
+            DiskCache(tmp_path / "cache.db"), max_size=1, admission=TinyLFU(1)
+        )
+        for _ in range(2):
+            cache.get("k:hot")
+        cache.set("k:hot", {"v": 1})
+        cache.get("k:hot")
+        cache.set("k:scan", {"v": 2})
+
+        assert list(cache.keys()) == ["k:hot"]
+        assert cache.get("k:scan") == {"v": 2}
+        assert list(cache.keys()) == ["k:hot"]
+
+    def test_server_uses_tiered_backend(self, tmp_path):
+        """Servers build a tiered cache when configured."""
+        config = GenomeMCPConfig()
+        config.cache.backend = "tiered"
+        config.cache.disk_path = str(tmp_path / "server.db")
+        server = NCBIGeneServer(config)
+
+        assert isinstance(server.cache, TieredResultCache)
+        assert server.cache.disk.path == tmp_path / "server.db"
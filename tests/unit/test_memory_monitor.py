@@ -0,0 +1,190 @@
+"""
+Tests for memory pressure handling.
+
+This module contains tests for shrinking result caches and for the monitor
+that shrinks them when the process RSS approaches its ceiling.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.core import (
+    CompressedCodec,
+    DiskCache,
+    MemoryPressureMonitor,
+    ResultCache,
+    TieredResultCache,
+)
+from genome_mcp.exceptions import ValidationError
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+
+
+class TestCacheShrink:
+    """Test evicting a fraction of cache entries."""
+
+    def test_expired_then_large_lru_entries_go_first(self):
+        """Expired entries are removed first, then the largest LRU entries."""
+        cache = ResultCache(max_size=100, codec=CompressedCodec(min_size=10**6))
+        cache.set("srv:info:expired", {"v": 0})
+        cache.expire("srv:info:expired")
+        cache.set("srv:info:small", {"v": 1})
+        cache.set("srv:info:large", {"v": "x" * 1000})
+        for i in range(5):
+            cache.set(f"srv:info:recent{i}", {"v": "x" * 5000})
+
+        assert cache.shrink(0.25) == 2
+        assert "srv:info:expired" not in cache
+        assert "srv:info:large" not in cache
+        assert "srv:info:small" in cache
+        assert all(f"srv:info:recent{i}" in cache for i in range(5))
+
+    def test_entry_sizes(self):
+        """Sizes come from stored values; others are only measured on request."""
+        cache = ResultCache()
+        cache.set("srv:info:plain", {"v": "x" * 100})
+        cache.set("srv:raw:body", b"x" * 100)
+        assert cache._entries["srv:info:plain"].size == 0
+        assert cache._entries["srv:raw:body"].size == 100
+
+        cache = ResultCache(measure_sizes=True)
+        cache.set("srv:info:plain", {"v": "x" * 100})
+        assert cache._entries["srv:info:plain"].size == 108
+
+    def test_shrink_bounds(self):
+        """Nothing is evicted from empty caches or for a zero fraction."""
+        cache = ResultCache()
+        assert cache.shrink(0.5) == 0
+        cache.set("srv:info:a", {})
+        assert cache.shrink(0) == 0
+        assert cache.shrink(1.0) == 1
+        assert len(cache) == 0
+
+    def test_shrink_floor(self):
+        """Shrinking never leaves fewer entries than the floor."""
+        cache = ResultCache()
+        for i in range(10):
+            cache.set(f"srv:info:{i}", {"v": i})
+
+        assert cache.shrink(0.5, floor=8) == 2
+        assert cache.shrink(0.5, floor=8) == 0
+        assert len(cache) == 8
+
+    def test_tiered_cache_demotes_shrunk_entries(self, tmp_path):
+        """Shrinking the memory tier keeps entries on disk."""
+        cache = TieredResultCache(DiskCache(tmp_path / "cache.db"), max_size=10)
+        for i in range(4):
+            cache.set(f"k:{i}", {"v": i})
+
+        assert cache.shrink(0.5) == 2
+        assert len(cache) == 2
+        assert cache.get("k:0") == {"v": 0}
+
+
+class TestMemoryPressureMonitor:
+    """Test shrinking caches when RSS nears the ceiling."""
+
+    def _monitor(self, cache: ResultCache, rss: list) -> MemoryPressureMonitor:
+        return MemoryPressureMonitor(
+            100, lambda: [cache], shrink_fraction=0.5, read_rss=rss.pop
+        )
+
+    def test_shrinks_above_high_watermark(self):
+        """Caches are only shrunk once RSS reaches the high watermark."""
+        cache = ResultCache()
+        for i in range(10):
+            cache.set(f"srv:info:{i}", {"v": i})
+        monitor = self._monitor(cache, rss=[95.0, 89.0])
+
+        assert monitor.check() == 0
+        assert monitor.check() == 5
+        assert len(cache) == 5
+
+        stats = monitor.get_stats()
+        assert stats["pressure_events"] == 1
+        assert stats["evicted"] == 5
+        assert stats["peak_rss_mb"] == 95.0
+
+    def test_backoff_under_lasting_pressure(self):
+        """Shrinks back off while RSS stays between the watermarks."""
+        cache = ResultCache()
+        for i in range(100):
+            cache.set(f"srv:info:{i}", {"v": i})
+        rss = [95.0, 50.0, 85.0, 95.0, 95.0]
+        monitor = MemoryPressureMonitor(
+            100,
+            lambda: [cache],
+            shrink_fraction=0.5,
+            low_watermark=0.8,
+            min_entries=30,
+            read_rss=rss.pop,
+        )
+
+        assert monitor.check() == 50
+        assert monitor.check() == 0
+        assert monitor.check() == 0
+        assert monitor._backoff == 2.0
+
+        # Below the low watermark the backoff resets
+        assert monitor.check() == 0
+        assert monitor.check() == 20
+        assert len(cache) == 30
+
+    async def test_check_errors_do_not_stop_monitor(self):
+        """A failing check is logged and the monitor keeps checking."""
+
+        def read_rss() -> float:
+            raise OSError("no /proc")
+
+        monitor = MemoryPressureMonitor(100, list, interval=0.01, read_rss=read_rss)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        assert monitor.running
+        await monitor.stop()
+
+        assert monitor.get_stats()["errors"] >= 2
+
+    async def test_background_checks(self):
+        """The monitor checks periodically until stopped."""
+        cache = ResultCache()
+        cache.set("srv:info:a", {})
+        monitor = MemoryPressureMonitor(
+            100, lambda: [cache], interval=0.01, read_rss=lambda: 99.0
+        )
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert not monitor.running
+        assert monitor.checks >= 2
+        assert len(cache) == 0
+
+    def test_invalid_settings(self):
+        """The ceiling and fractions must be positive."""
+        with pytest.raises(ValidationError):
+            MemoryPressureMonitor(0, list)
+        with pytest.raises(ValidationError):
+            MemoryPressureMonitor(100, list, shrink_fraction=1.5)
+        with pytest.raises(ValidationError):
+            MemoryPressureMonitor(100, list, high_watermark=0.8, low_watermark=0.9)
+
+    async def test_server_monitor(self):
+        """Servers monitor memory when a ceiling is configured."""
+        config = GenomeMCPConfig()
+        config.memory.max_rss_mb = 1_000_000
+        server = NCBIGeneServer(config)
+        await server.start()
+        try:
+            server.cache.set("ncbi_gene:get_gene_info:TP53", {})
+            assert server.cache.measure_sizes
+            assert server._shrinkable_caches() == [server.cache]
+            assert server.region_index is not None
+            assert server._shrinkable_caches() == [server.cache, server.region_index]
+            assert server.get_stats()["memory"]["max_rss_mb"] == 1_000_000
+        finally:
+            await server.stop()
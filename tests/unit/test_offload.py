@@ -0,0 +1,125 @@
+"""
+Tests for event loop offloading utilities.
+
+This module contains tests for offloading large payload parsing to worker
+pools and for measuring event loop lag.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from genome_mcp.core import LoopLagMonitor, ParseOffloader, json_codec
+from genome_mcp.data.parsers import JSONDataParser
+from genome_mcp.exceptions import ValidationError
+from genome_mcp.http_utils import HTTPClient
+
+
+def _blocking_parse(seconds: float) -> str:
+    """Stand-in for a slow parse; returns the thread it ran on."""
+    time.sleep(seconds)
+    return threading.current_thread().name
+
+
+class TestParseOffloader:
+    """Test running parsing inline or in worker pools."""
+
+    async def test_threshold(self):
+        """Small payloads are parsed inline, large ones in the pool."""
+        offloader = ParseOffloader(threshold=100)
+        try:
+            assert await offloader.run(_blocking_parse, 0, size=10) == "MainThread"
+            worker = await offloader.run(_blocking_parse, 0, size=100)
+            assert worker.startswith("genome-mcp-parse")
+
+            stats = offloader.get_stats()
+            assert stats["inline_total"] == 1
+            assert stats["offloaded_total"] == 1
+            assert stats["offloaded_size"] == 100
+        finally:
+            offloader.shutdown()
+
+    async def test_inline_executor(self):
+        """The "none" executor never offloads."""
+        offloader = ParseOffloader(threshold=1, executor="none")
+        assert await offloader.run(_blocking_parse, 0, size=10**9) == "MainThread"
+
+    async def test_process_executor(self):
+        """Response bodies can be decoded in worker processes."""
+        body = json_codec.dumps({"result": {"uids": ["7157"]}})
+        offloader = ParseOffloader(threshold=1, executor="process", max_workers=1)
+        try:
+            result = await offloader.run(HTTPClient._decode_body, body, size=len(body))
+        finally:
+            offloader.shutdown()
+        assert result == {"result": {"uids": ["7157"]}}
+
+    async def test_flatten_offloaded(self):
+        """Recursive parser helpers can run in the pool."""
+        data = {f"gene{i}": {"info": {"chromosome": str(i)}} for i in range(50)}
+        offloader = ParseOffloader(threshold=10)
+        try:
+            flat = await offloader.run(
+                JSONDataParser.flatten_dict, data, size=len(data)
+            )
+        finally:
+            offloader.shutdown()
+        assert flat["gene7.info.chromosome"] == "7"
+
+    async def test_http_client_decode(self):
+        """The HTTP client decodes large bodies through the offloader."""
+        offloader = ParseOffloader(threshold=1024)
+        client = HTTPClient("https://api.test.com", parse_offloader=offloader)
+        large = json_codec.dumps({"uids": [str(i) for i in range(1000)]})
+        try:
+            assert await client._decode(b'{"a": 1}') == {"a": 1}
+            assert len((await client._decode(large))["uids"]) == 1000
+        finally:
+            offloader.shutdown()
+        assert offloader.offloaded_total == 1
+
+    def test_invalid_settings(self):
+        """Unknown executors and empty pools are rejected."""
+        with pytest.raises(ValidationError):
+            ParseOffloader(executor="fiber")
+        with pytest.raises(ValidationError):
+            ParseOffloader(max_workers=0)
+
+
+class TestLoopLagMonitor:
+    """Test event loop lag measurement."""
+
+    async def test_measures_blocking(self):
+        """Blocking the loop shows up as lag; offloaded work does not."""
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+
+        offloader = ParseOffloader(threshold=1)
+        try:
+            await offloader.run(_blocking_parse, 0.2, size=1)
+        finally:
+            offloader.shutdown()
+        offloaded_lag = monitor.max_lag
+
+        _blocking_parse(0.2)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert not monitor.running
+        assert offloaded_lag < 0.1
+        assert monitor.max_lag >= 0.15
+        stats = monitor.get_stats()
+        assert stats["samples"] > 0
+        assert stats["max_lag_ms"] >= 150
+
+    def test_invalid_interval(self):
+        """The sampling interval must be positive."""
+        with pytest.raises(ValidationError):
+            LoopLagMonitor(interval=0)
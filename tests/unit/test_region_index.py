@@ -0,0 +1,115 @@
+"""
+Tests for the genomic region index.
+
+This module contains tests for answering region searches from the genes of
+previously fetched regions.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from genome_mcp.core import RegionIndex
+from genome_mcp.exceptions import ValidationError
+
+GENES = [
+    ("1", 100, 300),
+    ("2", 250, 400),
+    ("3", 900, 5000),
+    ("4", 6000, 6100),
+]
+
+
+def _records(start: int, end: int) -> list:
+    """Genes overlapping a region, as a region search would return them."""
+    return [
+        (uid, gene_start, gene_end, {"uid": uid})
+        for uid, gene_start, gene_end in GENES
+        if gene_start <= end and gene_end >= start
+    ]
+
+
+def _uids(records) -> list:
+    return [record["uid"] for record in records]
+
+
+class TestRegionIndex:
+    """Test region coverage and gene lookups."""
+
+    def test_sub_region_answered_locally(self):
+        """Searches inside a fetched region return the overlapping genes."""
+        index = RegionIndex()
+        index.add("human", "17", 1, 7000, _records(1, 7000))
+
+        assert index.gaps("human", "17", 260, 1000) == []
+        assert _uids(index.query("human", "17", 260, 1000)) == ["1", "2", "3"]
+        assert _uids(index.query("human", "17", 4000, 4500)) == ["3"]
+        assert index.query("human", "17", 5001, 5999) == []
+        assert index.query("human", "17", 6000, 8000) is None
+        assert index.query("human", "1", 260, 1000) is None
+        assert index.query("mouse", "17", 260, 1000) is None
+
+    def test_gaps_between_regions(self):
+        """Only the uncovered parts of a region are reported as gaps."""
+        index = RegionIndex()
+        index.add("human", "17", 100, 200, _records(100, 200))
+        index.add("human", "17", 201, 300, _records(201, 300))
+        index.add("human", "17", 500, 600, _records(500, 600))
+
+        assert index.gaps("human", "17", 50, 700) == [(50, 99), (301, 499), (601, 700)]
+        assert index.gaps("human", "17", 150, 280) == []
+
+        for gap_start, gap_end in index.gaps("human", "17", 50, 700):
+            index.add("human", "17", gap_start, gap_end, _records(gap_start, gap_end))
+        assert _uids(index.query("human", "17", 50, 700)) == ["1", "2"]
+        assert len(index) == 2
+
+        stats = index.get_stats()
+        assert (stats["hits"], stats["partial_hits"]) == (1, 2)
+
+    def test_expired_regions_are_dropped(self):
+        """Genes are dropped with the last region covering them."""
+        index = RegionIndex()
+        index.add("human", "17", 1, 500, _records(1, 500), ttl=0.05)
+        index.add("human", "17", 800, 7000, _records(800, 7000))
+        time.sleep(0.1)
+
+        assert index.gaps("human", "17", 1, 7000) == [(1, 799)]
+        assert len(index) == 2
+        assert _uids(index.query("human", "17", 800, 7000)) == ["3", "4"]
+
+    def test_least_recently_used_chromosomes_are_evicted(self):
+        """The index drops whole chromosomes to stay within max_genes."""
+        index = RegionIndex(max_genes=5)
+        index.add("human", "1", 1, 7000, _records(1, 7000))
+        index.add("human", "2", 1, 7000, _records(1, 7000))
+
+        assert index.query("human", "1", 1, 7000) is None
+        assert len(_uids(index.query("human", "2", 1, 7000))) == 4
+        assert index.get_stats()["evictions"] == 1
+
+        with pytest.raises(ValidationError):
+            RegionIndex(max_genes=0)
+
+    def test_shrink_drops_oldest_chromosomes(self):
+        """Shrinking drops whole chromosomes, keeping at least the floor."""
+        index = RegionIndex()
+        for chromosome in ("1", "2", "3"):
+            index.add("human", chromosome, 1, 7000, _records(1, 7000))
+
+        assert index.shrink(0.25) == 4
+        assert index.query("human", "1", 1, 7000) is None
+        assert index.shrink(0.5, floor=5) == 0
+        assert len(index) == 8
+
+    def test_results_are_independent(self):
+        """Changing a returned record does not change the index."""
+        index = RegionIndex()
+        index.add("human", "17", 1, 7000, _records(1, 7000))
+
+        index.query("human", "17", 100, 200)[0]["uid"] = "changed"
+        assert _uids(index.query("human", "17", 100, 200)) == ["1"]
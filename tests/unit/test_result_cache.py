@@ -0,0 +1,339 @@
+"""
+Tests for the result cache.
+
+This module contains tests for the result cache and its value codecs.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from genome_mcp.core import (
+    CompactRecordCodec,
+    CompressedCodec,
+    ContentAddressedCodec,
+    CountMinSketch,
+    GeneRecord,
+    ResultCache,
+    TinyLFU,
+    json_codec,
+)
+from genome_mcp.exceptions import ValidationError
+
+
+def _gene_result(gene_id: str) -> dict:
+    return {
+        "gene_id": gene_id,
+        "species": "human",
+        "uid": "7157",
+        "info": {
+            "name": gene_id,
+            "chromosome": "17",
+            "organism": {"scientificname": "Homo sapiens", "taxid": 9606},
+        },
+        "source": "NCBI Gene",
+    }
+
+
+class TestResultCache:
+    """Test TTL cache behaviour."""
+
+    def test_set_and_get(self):
+        """Stored results are returned until they expire."""
+        cache = ResultCache(ttl=60)
+        cache.set("key", {"value": 1})
+
+        assert cache.get("key") == {"value": 1}
+        assert "key" in cache
+
+        assert cache.expire("key") is True
+        assert cache.get("key") is None
+        assert cache.get("key", allow_stale=True) == {"value": 1}
+        assert cache.expire("missing") is False
+
+    def test_purge_expired_above_max_size(self):
+        """Expired entries are purged once the cache is over capacity."""
+        cache = ResultCache(max_size=2)
+        cache.set("a", {})
+        cache.set("b", {})
+        cache.expire()
+        cache.set("c", {})
+
+        assert list(cache.keys()) == ["c"]
+
+    def test_invalidate_by_prefix_and_tag(self):
+        """Entries are invalidated by namespace, tag, or both."""
+        cache = ResultCache()
+        cache.set("srv:info:1", {}, tags=["gene:TP53", "uid:7157"])
+        cache.set("srv:info:2", {}, tags=["gene:BRCA1"])
+        cache.set("srv:homologs:1", {}, tags=["gene:TP53"])
+        cache.set("srv:search:1", {}, tags=["gene:TP53", "gene:BRCA1"])
+
+        assert cache.invalidate("srv:homologs:", ["gene:BRCA1"]) == 0
+        assert cache.invalidate("srv:info:", ["gene:TP53"]) == 1
+        assert cache.invalidate(tags=["gene:BRCA1"]) == 2
+        assert cache.invalidate("srv:homologs:") == 1
+        assert len(cache) == 0
+        assert cache.get_stats()["tags"] == 0
+
+    def test_overwrite_replaces_tags(self):
+        """Re-storing a key drops its previous tags."""
+        cache = ResultCache()
+        cache.set("key", {}, tags=["gene:TP53"])
+        cache.set("key", {"value": 1}, ttl=10, tags=["gene:EGFR"])
+
+        assert cache.invalidate(tags=["gene:TP53"]) == 0
+        assert cache.invalidate(tags=["gene:EGFR"]) == 1
+
+
+class TestTinyLFUAdmission:
+    """Test frequency-based admission in front of LRU eviction."""
+
+    def test_sketch_estimates_and_ages(self):
+        """Frequencies are never underestimated and halve on reset."""
+        sketch = CountMinSketch(width=64)
+        for _ in range(6):
+            sketch.increment("hot")
+        sketch.increment("warm")
+
+        assert sketch.estimate("hot") >= 6
+        assert sketch.estimate("warm") >= 1
+        sketch.halve()
+        assert 3 <= sketch.estimate("hot") < 6
+
+    def test_counters_saturate(self):
+        """Counters stop at the 4-bit maximum."""
+        sketch = CountMinSketch(width=16)
+        for _ in range(100):
+            sketch.increment("key")
+        assert sketch.estimate("key") == CountMinSketch.MAX_COUNT
+
+    def test_doorkeeper_absorbs_first_access(self):
+        """Keys seen once only pass the doorkeeper."""
+        admission = TinyLFU(capacity=100)
+        admission.record("once")
+        assert admission.sketch.estimate("once") == 0
+        assert admission.estimate("once") == 1
+
+        admission.record("once")
+        assert admission.estimate("once") == 2
+
+    def test_frequencies_reset_after_sample(self):
+        """Frequencies are aged after sample_size accesses."""
+        admission = TinyLFU(capacity=16, sample_factor=1)
+        for _ in range(admission.sample_size):
+            admission.record("hot")
+        assert admission.resets == 1
+        assert admission.estimate("hot") < admission.sample_size
+
+    def test_scan_does_not_flush_hot_entries(self):
+        """A sweep of one-off keys leaves frequently requested entries cached."""
+        # A sketch sized for 10 entries makes the outcome depend on the string
+        # hash seed through counter collisions
+        cache = ResultCache(max_size=10, admission=TinyLFU(capacity=100))
+        hot_keys = [f"srv:info:hot{i}" for i in range(10)]
+
+        def request(key):
+            if cache.get(key) is None:
+                cache.set(key, {"gene_id": key})
+
+        for _ in range(3):
+            for key in hot_keys:
+                request(key)
+
+        # Interactive requests for the hot keys continue during the sweep
+        for i in range(1000):
+            request(f"srv:info:scan{i}")
+            if i % 2 == 0:
+                request(hot_keys[i // 2 % 10])
+
+        assert all(key in cache for key in hot_keys)
+        assert cache.get_stats()["admission"]["rejected"] >= 900
+
+    def test_without_admission_scan_flushes_cache(self):
+        """Plain LRU evicts the hot set during the same sweep."""
+        cache = ResultCache(max_size=10)
+        for key in (f"srv:info:hot{i}" for i in range(10)):
+            cache.set(key, {})
+        for i in range(10):
+            cache.set(f"srv:info:scan{i}", {})
+        assert not any(key.startswith("srv:info:hot") for key in cache.keys())
+
+    def test_updates_and_expired_victims_are_admitted(self):
+        """Existing keys can be updated and expired victims are replaced."""
+        cache = ResultCache(max_size=1, admission=TinyLFU(capacity=1))
+        cache.set("srv:info:a", {"v": 1})
+        cache.set("srv:info:a", {"v": 2})
+        assert cache.get("srv:info:a") == {"v": 2}
+
+        cache.expire()
+        cache.set("srv:info:b", {"v": 3})
+        assert list(cache.keys()) == ["srv:info:b"]
+
+
+class TestCompactRecordCodec:
+    """Test compact record storage."""
+
+    def test_round_trip(self):
+        """Compact encoding round-trips gene and batch results."""
+        codec = CompactRecordCodec()
+        batch = {
+            "species": "human",
+            "results": [
+                {"gene_id": "TP53", "success": True, "data": _gene_result("TP53")},
+                {"gene_id": "XYZ", "success": False, "error": "not found"},
+            ],
+        }
+
+        stored = codec.encode(batch)
+
+        assert isinstance(stored["results"][0]["data"], GeneRecord)
+        assert codec.decode(stored) == batch
+        assert codec.decode(codec.encode(_gene_result("EGFR"))) == _gene_result("EGFR")
+
+    def test_repeated_strings_are_shared(self):
+        """Repeated short strings are stored once across entries."""
+        codec = CompactRecordCodec()
+        first = codec.encode(_gene_result("TP53"))
+        second = codec.encode(_gene_result("EGFR"))
+
+        first_name = first.info["organism"]["scientificname"]
+        second_name = second.info["organism"]["scientificname"]
+        assert first_name is second_name
+
+    def test_decoded_results_are_independent(self):
+        """Mutating a returned result does not change the cached entry."""
+        cache = ResultCache(codec=CompactRecordCodec())
+        cache.set("key", _gene_result("TP53"))
+
+        cache.get("key")["gene_id"] = "changed"
+        assert cache.get("key")["gene_id"] == "TP53"
+
+
+class TestCompressedCodec:
+    """Test compressed cache values."""
+
+    @pytest.mark.parametrize("algorithm", ["zlib", "lzma", "zstd"])
+    def test_round_trip(self, algorithm):
+        """Compressed values decode to the original result."""
+        codec = CompressedCodec(algorithm, min_size=0)
+        result = {"results": [_gene_result(f"GENE{i}") for i in range(50)]}
+
+        stored = codec.encode(result)
+
+        assert stored.compressed
+        assert len(stored) < len(str(result)) / 4
+        assert codec.decode(stored) == result
+
+    def test_small_values_stay_uncompressed(self):
+        """Values below the size threshold are stored uncompressed."""
+        codec = CompressedCodec("zlib", min_size=1024)
+
+        stored = codec.encode({"value": 1})
+
+        assert not stored.compressed
+        assert codec.decode(stored) == {"value": 1}
+
+    def test_unknown_algorithm(self):
+        """Unknown algorithms are rejected."""
+        with pytest.raises(ValidationError):
+            CompressedCodec("brotli")
+
+    def test_cache_reports_stored_bytes(self):
+        """Caches with compressed values report their stored size."""
+        cache = ResultCache(codec=CompressedCodec("zlib"))
+        cache.set("key", _gene_result("TP53"))
+
+        stats = cache.get_stats()
+        assert stats["compression"] == "zlib"
+        assert stats["stored_bytes"] > 0
+        assert cache.get("key") == _gene_result("TP53")
+
+
+class TestContentAddressedCodec:
+    """Test content-addressed cache values."""
+
+    def _with_summary(self, gene_id: str) -> dict:
+        result = _gene_result(gene_id)
+        result["info"]["summary"] = f"{gene_id} encodes a protein. " * 10
+        return result
+
+    def test_shared_documents_are_stored_once(self):
+        """Results containing the same document share its storage."""
+        codec = ContentAddressedCodec(min_size=64)
+        cache = ResultCache(codec=codec)
+        result = self._with_summary("TP53")
+        cache.set("info:TP53", result)
+        cache.set("batch:TP53", {"results": [result], "total": 1})
+
+        stats = cache.get_stats()["dedup"]
+        assert stats["dedup_ratio"] > 1.5
+        assert cache.get("info:TP53") == result
+        assert cache.get("batch:TP53") == {"results": [result], "total": 1}
+
+    def test_identical_results_count_once(self):
+        """Identical results under different keys hold a single document."""
+        codec = ContentAddressedCodec(min_size=64)
+        cache = ResultCache(codec=codec)
+        cache.set("a", self._with_summary("TP53"))
+        documents = len(codec)
+        cache.set("b", self._with_summary("TP53"))
+
+        assert len(codec) == documents
+        assert cache.get_stats()["dedup"]["dedup_ratio"] == pytest.approx(2.0)
+
+    def test_documents_are_released(self):
+        """Documents are dropped once no cache entry refers to them."""
+        codec = ContentAddressedCodec(min_size=64)
+        cache = ResultCache(max_size=2, codec=codec)
+        cache.set("a", self._with_summary("TP53"))
+        cache.set("b", {"results": [self._with_summary("TP53")]})
+        cache.set("a", self._with_summary("EGFR"))
+        cache.delete("b")
+        assert cache.get("a") == self._with_summary("EGFR")
+
+        cache.set("b", self._with_summary("BRCA1"))
+        cache.set("c", self._with_summary("KRAS"))
+        assert list(cache.keys()) == ["b", "c"]
+
+        cache.clear()
+        assert len(codec) == 0
+        assert codec.get_stats()["stored_bytes"] == 0
+        assert codec.get_stats()["logical_bytes"] == 0
+
+    def test_decoded_results_are_independent(self):
+        """Changing a returned result does not change the shared document."""
+        cache = ResultCache(codec=ContentAddressedCodec(min_size=64))
+        cache.set("a", self._with_summary("TP53"))
+        cache.set("b", self._with_summary("TP53"))
+
+        cache.get("a")["info"]["name"] = "changed"
+        assert cache.get("b")["info"]["name"] == "TP53"
+
+    def test_nested_documents_are_serialized_once(self, monkeypatch):
+        """Encoding serializes each value once, however deep documents nest."""
+        value: dict = {"leaf": "x" * 100}
+        for depth in range(200):
+            value = {"depth": depth, "child": value}
+
+        serialized = []
+        dumps = json_codec.dumps
+
+        def counting_dumps(obj, **kwargs):
+            payload = dumps(obj, **kwargs)
+            serialized.append(len(payload))
+            return payload
+
+        monkeypatch.setattr(json_codec, "dumps", counting_dumps)
+        codec = ContentAddressedCodec(min_size=64)
+        stored = codec.encode(value)
+        monkeypatch.undo()
+
+        size = len(json_codec.dumps(value, sort_keys=True))
+        assert sum(serialized) < size
+        assert codec.get_stats()["logical_bytes"] == size
+        assert codec.get_stats()["stored_bytes"] == size
+        assert codec.decode(stored) == value
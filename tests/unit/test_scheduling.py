@@ -0,0 +1,352 @@
+"""
+Tests for request scheduling utilities.
+
+This module contains tests for admission control, priority lane scheduling
+and their integration with the base MCP server.
+"""
+
+import asyncio
+import os
+import sys
+from typing import Any, Dict
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.core import AdmissionController, PriorityScheduler
+from genome_mcp.exceptions import ServerOverloadedError, ValidationError
+from genome_mcp.servers.base import BaseMCPServer, ServerCapabilities
+
+
+class SlowServer(BaseMCPServer):
+    """Server whose operation blocks until released by the test."""
+
+    def __init__(self, config: GenomeMCPConfig):
+        super().__init__(config)
+        self.release_event = asyncio.Event()
+
+    def _define_capabilities(self) -> ServerCapabilities:
+        return ServerCapabilities(
+            name="SlowServer",
+            version="1.0.0",
+            description="Slow test server",
+            operations=["slow"],
+            rate_limit_requests=1000,
+        )
+
+    def _get_base_url(self) -> str:
+        return "https://api.test.com"
+
+    async def _execute_operation(
+        self, operation: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        await self.release_event.wait()
+        return {"value": params.get("value")}
+
+
+class TestAdmissionController:
+    """Test admission controller behaviour."""
+
+    async def test_admit_within_capacity(self):
+        """Requests under the in-flight limit are admitted immediately."""
+        controller = AdmissionController(max_in_flight=2)
+
+        async with controller.admit() as wait_time:
+            assert wait_time < 0.1
+            assert controller.in_flight == 1
+
+        assert controller.in_flight == 0
+        assert controller.admitted_total == 1
+
+    async def test_reject_when_queue_full(self):
+        """Requests beyond in-flight plus queue capacity are rejected."""
+        controller = AdmissionController(max_in_flight=1, max_queue_size=0)
+
+        await controller.acquire()
+        with pytest.raises(ServerOverloadedError) as exc_info:
+            await controller.acquire()
+
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.error_code == "SERVER_OVERLOADED"
+        assert controller.rejected_total == 1
+        controller.release()
+
+    async def test_reject_after_queue_wait(self):
+        """Queued requests are rejected once the maximum wait elapses."""
+        controller = AdmissionController(
+            max_in_flight=1, max_queue_size=5, max_queue_wait=0.05
+        )
+
+        await controller.acquire()
+        with pytest.raises(ServerOverloadedError) as exc_info:
+            await controller.acquire()
+
+        assert exc_info.value.reason == "queue_timeout"
+        assert controller.queued == 0
+        controller.release()
+
+    async def test_queued_request_admitted_on_release(self):
+        """A queued request proceeds when a slot is released."""
+        controller = AdmissionController(max_in_flight=1, max_queue_wait=1.0)
+
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0.01)
+        assert controller.queued == 1
+
+        controller.release()
+        await waiter
+        assert controller.in_flight == 1
+        controller.release()
+
+    async def test_fair_order_across_clients(self):
+        """Queued clients are granted slots round-robin."""
+        controller = AdmissionController(max_in_flight=1, max_queue_wait=1.0)
+        order = []
+
+        async def worker(client_id: str) -> None:
+            async with controller.admit(client_id):
+                order.append(client_id)
+
+        await controller.acquire()
+        tasks = [asyncio.create_task(worker("greedy")) for _ in range(3)]
+        tasks.append(asyncio.create_task(worker("polite")))
+        await asyncio.sleep(0.01)
+        assert controller.get_stats()["waiting_clients"] == 2
+
+        controller.release()
+        await asyncio.gather(*tasks)
+        assert order[:2] == ["greedy", "polite"]
+
+
+class TestPriorityScheduler:
+    """Test weighted priority lane scheduling."""
+
+    async def test_uncontended_turn_is_immediate(self):
+        """A turn is granted immediately when nobody is waiting."""
+        scheduler = PriorityScheduler({"interactive": 4, "bulk": 1}, "interactive")
+
+        async with scheduler.turn("bulk") as wait_time:
+            assert wait_time == 0.0
+
+        stats = scheduler.get_stats()
+        assert stats["busy"] is False
+        assert stats["lanes"]["bulk"]["granted"] == 1
+
+    async def test_unknown_lane_rejected(self):
+        """Unknown lanes raise ValidationError."""
+        scheduler = PriorityScheduler({"interactive": 1}, "interactive")
+
+        with pytest.raises(ValidationError):
+            await scheduler.acquire("missing")
+
+    async def test_weighted_order_across_lanes(self):
+        """Interactive waiters are served ahead of bulk by weight."""
+        scheduler = PriorityScheduler({"interactive": 3, "bulk": 1}, "interactive")
+        order = []
+
+        async def worker(lane: str) -> None:
+            async with scheduler.turn(lane):
+                order.append(lane)
+
+        await scheduler.acquire("bulk")
+        tasks = [asyncio.create_task(worker("bulk")) for _ in range(4)]
+        tasks += [asyncio.create_task(worker("interactive")) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        # Both lanes progress, interactive gets three turns per bulk turn
+        assert order[:4].count("interactive") == 3
+        assert order[:4].count("bulk") == 1
+        assert sorted(order) == ["bulk"] * 4 + ["interactive"] * 4
+
+    async def test_fair_order_across_clients(self):
+        """Clients in the same lane are served round-robin."""
+        scheduler = PriorityScheduler({"interactive": 1}, "interactive")
+        order = []
+
+        async def worker(client_id: str) -> None:
+            async with scheduler.turn(client_id=client_id):
+                order.append(client_id)
+
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(worker("greedy")) for _ in range(4)]
+        tasks.append(asyncio.create_task(worker("polite")))
+        await asyncio.sleep(0.01)
+        assert scheduler.get_stats()["lanes"]["interactive"]["waiting_clients"] == 2
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order[:2] == ["greedy", "polite"]
+
+    async def test_cancelled_waiter_is_skipped(self):
+        """Cancelled waiters do not block the queue."""
+        scheduler = PriorityScheduler({"interactive": 1}, "interactive")
+
+        await scheduler.acquire()
+        cancelled = asyncio.create_task(scheduler.acquire())
+        waiting = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+
+        scheduler.release()
+        await asyncio.wait_for(waiting, timeout=1.0)
+        scheduler.release()
+        assert scheduler.get_stats()["busy"] is False
+
+
+class TestServerAdmission:
+    """Test admission control in BaseMCPServer.execute_request."""
+
+    def _make_server(self, **admission: Any) -> SlowServer:
+        config = GenomeMCPConfig()
+        config.admission = config.admission.model_copy(update=admission)
+        return SlowServer(config)
+
+    async def test_execute_request_rejects_excess(self):
+        """Excess requests fail fast with ServerOverloadedError."""
+        server = self._make_server(max_in_flight=1, max_queue_size=0)
+
+        first = asyncio.create_task(server.execute_request("slow", {"value": 1}))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ServerOverloadedError):
+            await server.execute_request("slow", {"value": 2})
+
+        server.release_event.set()
+        assert (await first)["value"] == 1
+        assert server.stats.requests_rejected == 1
+
+    async def test_execute_request_degrades_to_stale_cache(self):
+        """Degrade mode serves expired cache entries instead of rejecting."""
+        server = self._make_server(
+            max_in_flight=1, max_queue_size=0, overload_mode="degrade"
+        )
+        server.release_event.set()
+        await server.execute_request("slow", {"value": 2})
+        server.cache.expire()
+
+        server.release_event.clear()
+        first = asyncio.create_task(server.execute_request("slow", {"value": 1}))
+        await asyncio.sleep(0.01)
+
+        result = await server.execute_request("slow", {"value": 2})
+        assert result == {"value": 2, "degraded": True}
+        assert server.stats.requests_degraded == 1
+
+        server.release_event.set()
+        await first
+
+    async def test_bulk_lane_does_not_take_interactive_slots(self):
+        """A large batch cannot starve interactive requests of slots."""
+        server = self._make_server(max_in_flight=4, max_queue_wait=1.0)
+
+        batch = asyncio.create_task(
+            server.execute_batch(
+                [{"operation": "slow", "params": {"value": i}} for i in range(10)],
+                client_id="batch",
+            )
+        )
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(
+            server.execute_request("slow", {"value": "x"}, client_id="user")
+        )
+        await asyncio.sleep(0.01)
+
+        stats = server.get_stats()["admission"]
+        assert stats["bulk"]["in_flight"] == 1
+        assert stats["bulk"]["queued"] == 0
+        assert stats["interactive"]["in_flight"] == 1
+
+        server.release_event.set()
+        assert (await interactive)["value"] == "x"
+        assert all(result["success"] for result in await batch)
+
+
+class TestServerScheduling:
+    """Test lane resolution in BaseMCPServer."""
+
+    def test_resolve_lane_from_config(self):
+        """Operations map to lanes through the tool lane configuration."""
+        config = GenomeMCPConfig()
+        config.scheduling.tool_lanes["slow"] = "bulk"
+        server = SlowServer(config)
+
+        assert server._resolve_lane("slow") == "bulk"
+        assert server._resolve_lane("other") == "interactive"
+        assert server._resolve_lane("slow", "interactive") == "interactive"
+
+        with pytest.raises(ValidationError):
+            server._resolve_lane("slow", "unknown")
+
+    async def test_batch_items_use_tool_lanes(self):
+        """Batch items run in their operation's lane, else in the batch lane."""
+        config = GenomeMCPConfig()
+        server = SlowServer(config)
+        server.release_event.set()
+
+        await server.execute_batch([{"operation": "slow", "params": {"value": 1}}])
+        config.scheduling.tool_lanes["slow"] = "interactive"
+        await server.execute_batch([{"operation": "slow", "params": {"value": 2}}])
+        results = await server.execute_batch(
+            [{"operation": "slow", "params": {"value": 3}, "lane": "unknown"}]
+        )
+
+        lanes = server.scheduler.get_stats()["lanes"]
+        assert lanes["bulk"]["granted"] == 1
+        assert lanes["interactive"]["granted"] == 1
+        assert results[0]["error_type"] == "ValidationError"
+
+    async def test_client_quota_and_stats(self):
+        """Per-client quotas reject excess requests from one session only."""
+        config = GenomeMCPConfig()
+        config.scheduling.client_max_in_flight = 1
+        server = SlowServer(config)
+
+        first = asyncio.create_task(
+            server.execute_request("slow", {"value": 1}, client_id="greedy")
+        )
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ServerOverloadedError) as exc_info:
+            await server.execute_request("slow", {"value": 2}, client_id="greedy")
+        assert exc_info.value.reason == "client_quota"
+
+        server.release_event.set()
+        await server.execute_request("slow", {"value": 3}, client_id="polite")
+        await first
+
+        clients = server.get_stats()["clients"]
+        assert clients["greedy"]["requests_rejected"] == 1
+        assert clients["greedy"]["requests_success"] == 1
+        assert clients["polite"]["requests_success"] == 1
+        assert clients["greedy"]["in_flight"] == 0
+
+    async def test_client_quota_counts_queued_requests(self):
+        """Requests waiting for a slot count toward their client's quota."""
+        config = GenomeMCPConfig()
+        config.admission.lane_max_in_flight = {"interactive": 1}
+        config.scheduling.client_max_in_flight = 2
+        server = SlowServer(config)
+
+        tasks = [
+            asyncio.create_task(
+                server.execute_request("slow", {"value": i}, client_id="greedy")
+            )
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        assert server.get_stats()["admission"]["interactive"]["queued"] == 1
+
+        with pytest.raises(ServerOverloadedError) as exc_info:
+            await server.execute_request("slow", {"value": 2}, client_id="greedy")
+        assert exc_info.value.reason == "client_quota"
+
+        server.release_event.set()
+        await asyncio.gather(*tasks)
+        assert server.client_stats["greedy"].in_flight == 0
@@ -0,0 +1,118 @@
+"""
+Shared fixtures for server tests.
+
+Gene servers built here never reach NCBI: either their per-gene lookups are
+served in memory, or their EUtils requests are answered by an in-memory
+HTTP client. Their rate limiter is effectively unlimited, so batch tests
+never wait on the NCBI request budget.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+import pytest
+
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.exceptions import DataNotFoundError
+from genome_mcp.http_utils import RateLimiter
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+
+# Gene ID that in-memory servers do not find
+MISSING_GENE = "MISSING"
+
+ESUMMARY_DOCUMENT = {
+    "uid": "7157",
+    "name": "TP53",
+    "description": "tumor protein p53",
+    "chromosome": "17",
+    "maplocation": "17p13.1",
+    "organism": {"scientificname": "Homo sapiens", "taxid": 9606, "rank": "x"},
+    "mim": ["191170"],
+    "locationhist": [{"chrstart": i} for i in range(50)],
+}
+
+
+def _unlimited_rate_limiter() -> RateLimiter:
+    return RateLimiter(requests_per_minute=1_000_000, requests_per_hour=1_000_000)
+
+
+class FakeHTTPClient:
+    """HTTP client answering esearch/esummary requests from memory."""
+
+    response_cache = None
+
+    def __init__(self, document: Optional[Dict[str, Any]] = None):
+        self.document = document or ESUMMARY_DOCUMENT
+        self.urls: List[str] = []
+
+    async def get(self, url: str, **kwargs: Any) -> Dict[str, Any]:
+        self.urls.append(url)
+        if "esearch" in url:
+            return {"esearchresult": {"idlist": ["7157"], "count": "1"}}
+        return {"result": {"uids": ["7157"], "7157": dict(self.document)}}
+
+
+class InMemoryGeneServer(NCBIGeneServer):
+    """Gene server whose per-gene lookups are served in memory.
+
+    Looked up gene IDs are recorded in ``calls``; MISSING_GENE is not found.
+    """
+
+    def __init__(self, config: Optional[GenomeMCPConfig] = None):
+        super().__init__(config or GenomeMCPConfig())
+        self.calls: List[str] = []
+        self._rate_limiter = _unlimited_rate_limiter()
+
+    def _lookup(self, params: Dict[str, Any]) -> str:
+        gene_id = params["gene_id"]
+        self.calls.append(gene_id)
+        if gene_id == MISSING_GENE:
+            raise DataNotFoundError(f"Gene not found: {gene_id}")
+        return gene_id
+
+    async def _get_gene_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        gene_id = self._lookup(params)
+        return {
+            "gene_id": gene_id,
+            "species": params.get("species", "human"),
+            "uid": "7157",
+            "info": {"name": gene_id, "chromosome": "17"},
+        }
+
+    async def _get_gene_homologs(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        gene_id = self._lookup(params)
+        return {"gene_id": gene_id, "homologs": [{"species": "mouse"}]}
+
+
+@pytest.fixture
+def make_gene_server() -> Callable[..., InMemoryGeneServer]:
+    """Factory of gene servers with in-memory gene lookups."""
+    return InMemoryGeneServer
+
+
+@pytest.fixture
+def gene_server(make_gene_server: Callable[..., InMemoryGeneServer]):
+    """Gene server with in-memory gene lookups."""
+    return make_gene_server()
+
+
+@pytest.fixture
+def make_ncbi_server() -> Callable[..., NCBIGeneServer]:
+    """Factory of gene servers whose EUtils requests are served in memory."""
+
+    def make(config: Optional[GenomeMCPConfig] = None, http_client: Any = None):
+        server = NCBIGeneServer(config or GenomeMCPConfig())
+        server._http_client = http_client or FakeHTTPClient()
+        server._rate_limiter = _unlimited_rate_limiter()
+        return server
+
+    return make
+
+
+@pytest.fixture
+def ncbi_server(make_ncbi_server: Callable[..., NCBIGeneServer]) -> NCBIGeneServer:
+    """Gene server whose EUtils requests are served in memory."""
+    return make_ncbi_server()
@@ -0,0 +1,295 @@
+"""
+Tests for batch execution in MCP servers.
+
+These tests exercise batch behaviour offline by replacing upstream calls
+with in-memory fakes.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.core import (
+    ProgressTracker,
+    iter_chunks,
+    pipeline_chunks,
+    progress_reporting,
+)
+from genome_mcp.servers.base import BaseMCPServer, ServerCapabilities
+
+
+class CountingServer(BaseMCPServer):
+    """Server that records how often each operation is executed."""
+
+    def __init__(self, config: GenomeMCPConfig):
+        super().__init__(config)
+        self.calls: list = []
+
+    def _define_capabilities(self) -> ServerCapabilities:
+        return ServerCapabilities(
+            name="CountingServer",
+            version="1.0.0",
+            description="Counting test server",
+            operations=["echo"],
+            max_batch_size=10,
+            rate_limit_requests=1000,
+        )
+
+    def _get_base_url(self) -> str:
+        return "https://api.test.com"
+
+    async def _execute_operation(
+        self, operation: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        self.calls.append(params)
+        return {"echo": params.get("message")}
+
+
+class TestBatchDeduplication:
+    """Test in-batch deduplication."""
+
+    async def test_execute_batch_deduplicates(self):
+        """Identical requests are executed once and fanned back out."""
+        server = CountingServer(GenomeMCPConfig())
+        requests = [
+            {"operation": "echo", "params": {"message": "a"}},
+            {"operation": "echo", "params": {"message": "b"}},
+            {"operation": "echo", "params": {"message": "a"}},
+        ]
+
+        results = await server.execute_batch(requests, use_cache=False)
+
+        assert len(server.calls) == 2
+        assert [r["result"]["echo"] for r in results] == ["a", "b", "a"]
+        assert results[2]["deduplicated"] is True
+        assert "deduplicated" not in results[0]
+        assert server.stats.batch_duplicates == 1
+
+    async def test_execute_batch_stream_flags_duplicates(self):
+        """Streamed chunks flag repeated requests and count them."""
+        server = CountingServer(GenomeMCPConfig())
+        requests = [
+            {"operation": "echo", "params": {"message": i % 3}} for i in range(5)
+        ]
+
+        chunks = [
+            chunk
+            async for chunk in server.execute_batch_stream(
+                requests, use_cache=False, chunk_size=5
+            )
+        ]
+
+        assert len(server.calls) == 3
+        assert [bool(r.get("deduplicated")) for r in chunks[0]] == [
+            False,
+            False,
+            False,
+            True,
+            True,
+        ]
+        assert server.stats.batch_duplicates == 2
+
+    async def test_batch_gene_info_deduplicates(self, gene_server):
+        """Gene ids differing only in case or whitespace are fetched once."""
+        server = gene_server
+
+        result = await server._batch_gene_info(
+            {"gene_ids": ["TP53", "tp53", " TP53 ", "BRCA1"]}
+        )
+
+        assert sorted(server.calls) == ["BRCA1", "TP53"]
+        assert result["total_genes"] == 4
+        assert result["unique_genes"] == 2
+        assert result["deduplicated"] == 2
+        assert [r["gene_id"] for r in result["results"]] == [
+            "TP53",
+            "tp53",
+            " TP53 ",
+            "BRCA1",
+        ]
+        assert all(r["success"] for r in result["results"])
+
+    async def test_batch_gene_homologs_deduplicates(self, gene_server):
+        """Homolog batches fetch each distinct gene once."""
+        server = gene_server
+
+        result = await server._batch_gene_homologs({"gene_ids": ["TP53", "tp53"]})
+
+        assert server.calls == ["TP53"]
+        assert result["deduplicated"] == 1
+        assert result["results"]["tp53"]["gene_id"] == "tp53"
+        assert result["results"]["tp53"]["homologs"] == [{"species": "mouse"}]
+
+
+class TestChunkedExecution:
+    """Test chunked execution of batches larger than max_batch_size."""
+
+    def test_iter_chunks_is_lazy(self):
+        """iter_chunks consumes generators chunk by chunk."""
+        consumed = []
+
+        def source():
+            for i in range(5):
+                consumed.append(i)
+                yield i
+
+        chunks = iter_chunks(source(), 2)
+        assert next(chunks) == [0, 1]
+        assert consumed == [0, 1]
+        assert list(chunks) == [[2, 3], [4]]
+
+    async def test_pipeline_chunks_preserves_order(self):
+        """pipeline_chunks yields worker results in chunk order."""
+
+        async def worker(chunk):
+            return sum(chunk)
+
+        results = [r async for r in pipeline_chunks([[1, 2], [3], [4, 5]], worker)]
+        assert results == [3, 3, 9]
+
+    async def test_execute_batch_accepts_oversized_batch(self):
+        """Batches larger than max_batch_size are executed in chunks."""
+        server = CountingServer(GenomeMCPConfig())
+        requests = [{"operation": "echo", "params": {"message": i}} for i in range(25)]
+
+        results = await server.execute_batch(requests, use_cache=False)
+
+        assert len(results) == 25
+        assert [r["result"]["echo"] for r in results] == list(range(25))
+
+    async def test_execute_batch_stream_yields_chunks(self):
+        """execute_batch_stream yields one result list per chunk."""
+        server = CountingServer(GenomeMCPConfig())
+        requests = ({"operation": "echo", "params": {"message": i}} for i in range(25))
+
+        chunk_sizes = [
+            len(chunk)
+            async for chunk in server.execute_batch_stream(requests, use_cache=False)
+        ]
+
+        assert chunk_sizes == [10, 10, 5]
+
+    async def test_iter_batch_gene_info_offsets(self, gene_server):
+        """Gene batches stream chunk results with running offsets."""
+        server = gene_server
+        gene_ids = [f"GENE{i}" for i in range(7)]
+
+        chunks = [
+            chunk async for chunk in server.iter_batch_gene_info(gene_ids, chunk_size=3)
+        ]
+
+        assert [c["offset"] for c in chunks] == [0, 3, 6]
+        assert [c["total_genes"] for c in chunks] == [3, 3, 1]
+        assert server.calls == gene_ids
+
+    async def test_batch_lookups_wait_for_rate_limiter(self, gene_server):
+        """Every gene lookup of a streamed batch takes its own upstream turn."""
+        gene_ids = [f"GENE{i}" for i in range(7)]
+
+        async for _ in gene_server.execute_stream(
+            "batch_gene_info", {"gene_ids": gene_ids}
+        ):
+            pass
+        async for _ in gene_server.iter_batch_gene_homologs(
+            gene_ids[:3], chunk_size=2, lane="interactive"
+        ):
+            pass
+
+        lanes = gene_server.scheduler.get_stats()["lanes"]
+        assert lanes["bulk"]["granted"] == 7
+        assert lanes["interactive"]["granted"] == 3
+
+    async def test_batch_lookups_use_result_cache(self, gene_server):
+        """Streamed batch lookups are cached and served from the result cache."""
+        gene_ids = ["TP53", "BRCA1"]
+
+        async for _ in gene_server.iter_batch_gene_info(gene_ids):
+            pass
+        async for _ in gene_server.iter_batch_gene_homologs(gene_ids):
+            pass
+        gene_server.calls.clear()
+
+        chunks = [chunk async for chunk in gene_server.iter_batch_gene_info(gene_ids)]
+        async for _ in gene_server.iter_batch_gene_homologs(["tp53", "BRCA1"]):
+            pass
+
+        assert gene_server.calls == []
+        assert chunks[0]["successful"] == 2
+        assert gene_server.stats.cache_hits == 4
+        lanes = gene_server.scheduler.get_stats()["lanes"]
+        assert lanes["bulk"]["granted"] == 4
+
+    async def test_batch_gene_info_accepts_oversized_batch(self, gene_server):
+        """batch_gene_info no longer rejects lists above max_batch_size."""
+        server = gene_server
+        gene_ids = [f"GENE{i}" for i in range(server.capabilities.max_batch_size + 5)]
+
+        result = await server._batch_gene_info({"gene_ids": gene_ids})
+
+        assert result["total_genes"] == len(gene_ids)
+        assert result["successful"] == len(gene_ids)
+
+
+class TestProgressReporting:
+    """Test progress reporting from batch paths."""
+
+    async def test_tracker_reports_throughput_and_eta(self):
+        """Trackers report completed/total with throughput and ETA."""
+        reports = []
+
+        async def callback(completed, total, message):
+            reports.append((completed, total, message))
+
+        tracker = ProgressTracker(10, unit="genes", callback=callback)
+        tracker.start_time -= 1.0
+        await tracker.advance(5)
+
+        assert reports[0][:2] == (5, 10)
+        assert "5/10 genes" in reports[0][2]
+        assert "ETA" in reports[0][2]
+        assert tracker.snapshot()["eta"] is not None
+
+    async def test_failing_callback_is_ignored(self):
+        """Progress callback errors never fail the operation."""
+
+        async def callback(completed, total, message):
+            raise RuntimeError("client went away")
+
+        tracker = ProgressTracker(1, callback=callback)
+        await tracker.advance()
+        assert tracker.completed == 1
+
+    async def test_batch_gene_info_reports_per_chunk(self, gene_server):
+        """Batch gene lookups report progress after every chunk."""
+        server = gene_server
+        gene_ids = [f"GENE{i}" for i in range(server.capabilities.max_batch_size + 1)]
+        reports = []
+
+        async def callback(completed, total, message):
+            reports.append((completed, total))
+
+        with progress_reporting(callback):
+            await server._batch_gene_info({"gene_ids": gene_ids})
+
+        assert reports == [
+            (len(gene_ids) - 1, len(gene_ids)),
+            (len(gene_ids), len(gene_ids)),
+        ]
+
+    async def test_execute_batch_stream_reports_progress(self):
+        """Generic batch streams report progress with unknown totals."""
+        server = CountingServer(GenomeMCPConfig())
+        requests = ({"operation": "echo", "params": {"message": i}} for i in range(15))
+        reports = []
+
+        async def callback(completed, total, message):
+            reports.append((completed, total))
+
+        with progress_reporting(callback):
+            async for _ in server.execute_batch_stream(requests, use_cache=False):
+                pass
+
+        assert reports == [(10, None), (15, None)]
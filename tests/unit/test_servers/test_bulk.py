@@ -0,0 +1,149 @@
+"""
+Tests for bulk file processing.
+
+These tests stream gene ID files through an in-memory gene server.
+"""
+
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from genome_mcp.exceptions import DataFormatError, ValidationError
+from genome_mcp.servers.bulk import (
+    detect_format,
+    iter_gene_ids,
+    process_bulk_file,
+    resolve_bulk_path,
+)
+
+
+class TestBulkInput:
+    """Test reading gene IDs from files."""
+
+    def test_detect_format(self):
+        """Formats are detected from extensions or given explicitly."""
+        assert detect_format("genes.jsonl") == "ndjson"
+        assert detect_format("genes.tsv") == "tsv"
+        assert detect_format("genes.dat", "TSV") == "tsv"
+        with pytest.raises(ValidationError):
+            detect_format("genes.dat")
+
+    def test_iter_ndjson(self):
+        """NDJSON lines may be strings or objects with gene_id."""
+        stream = io.StringIO('"TP53"\n\n{"gene_id": "BRCA1", "note": "x"}\n')
+        assert list(iter_gene_ids(stream, "ndjson")) == ["TP53", "BRCA1"]
+
+        with pytest.raises(DataFormatError):
+            list(iter_gene_ids(io.StringIO("{}\n"), "ndjson"))
+
+    def test_iter_tsv(self):
+        """TSV input uses the gene_id column or the first column."""
+        with_header = io.StringIO("# panel\nsample\tgene_id\ns1\tTP53\ns2\tEGFR\n")
+        without_header = io.StringIO("TP53\tx\nEGFR\n")
+
+        assert list(iter_gene_ids(with_header, "tsv")) == ["TP53", "EGFR"]
+        assert list(iter_gene_ids(without_header, "tsv")) == ["TP53", "EGFR"]
+
+    def test_paths_stay_in_base_dir(self, tmp_path):
+        """Client paths resolve inside the base directory or are rejected."""
+        base = tmp_path / "bulk"
+
+        assert resolve_bulk_path("genes.tsv", str(base)) == str(base / "genes.tsv")
+        assert resolve_bulk_path(str(base / "a.tsv"), str(base)) == str(base / "a.tsv")
+        for path in ("../secrets.tsv", "/etc/passwd", str(tmp_path / "x.tsv")):
+            with pytest.raises(ValidationError):
+                resolve_bulk_path(path, str(base))
+
+
+class TestProcessBulkFile:
+    """Test streaming files through batch operations."""
+
+    async def test_ndjson_to_tsv(self, tmp_path, gene_server):
+        """Results are written as flattened TSV rows in input order."""
+        gene_ids = [f"GENE{i}" for i in range(12)]
+        input_path = tmp_path / "genes.ndjson"
+        input_path.write_text("".join(json.dumps(g) + "\n" for g in gene_ids))
+        output_path = tmp_path / "results.tsv"
+
+        summary = await process_bulk_file(
+            gene_server,
+            "batch_gene_info",
+            str(input_path),
+            str(output_path),
+        )
+
+        assert summary["total_genes"] == 12
+        assert summary["successful"] == 12
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f, delimiter="\t"))
+        assert [row["gene_id"] for row in rows] == gene_ids
+        assert rows[0]["uid"] == "7157"
+        assert rows[0]["chromosome"] == "17"
+
+    async def test_tsv_to_ndjson(self, tmp_path, gene_server):
+        """TSV input produces one NDJSON result per gene."""
+        input_path = tmp_path / "genes.tsv"
+        input_path.write_text("gene_id\nTP53\nBRCA1\n")
+        output_path = tmp_path / "results.ndjson"
+
+        await process_bulk_file(
+            gene_server,
+            "batch_gene_info",
+            str(input_path),
+            str(output_path),
+            {"species": "mouse"},
+        )
+
+        lines = output_path.read_text().splitlines()
+        assert [json.loads(line)["gene_id"] for line in lines] == ["TP53", "BRCA1"]
+        assert json.loads(lines[0])["success"] is True
+
+    async def test_duplicate_homolog_rows(self, tmp_path, gene_server):
+        """Homolog output has one row per input line, repeated genes included."""
+        input_path = tmp_path / "genes.tsv"
+        input_path.write_text("TP53\nBRCA1\nTP53\n")
+        output_path = tmp_path / "homologs.ndjson"
+
+        summary = await process_bulk_file(
+            gene_server, "batch_gene_homologs", str(input_path), str(output_path)
+        )
+
+        lines = output_path.read_text().splitlines()
+        assert summary["total_genes"] == 3
+        assert [json.loads(line)["gene_id"] for line in lines] == [
+            "TP53",
+            "BRCA1",
+            "TP53",
+        ]
+        assert gene_server.scheduler.get_stats()["lanes"]["bulk"]["granted"] == 2
+
+    async def test_repeated_file_is_served_from_cache(self, tmp_path, gene_server):
+        """Genes looked up for one file are not fetched again for the next."""
+        input_path = tmp_path / "genes.tsv"
+        input_path.write_text("TP53\nBRCA1\n")
+        output_path = tmp_path / "results.ndjson"
+
+        for _ in range(2):
+            summary = await process_bulk_file(
+                gene_server, "batch_gene_info", str(input_path), str(output_path)
+            )
+
+        assert summary["successful"] == 2
+        assert gene_server.calls == ["TP53", "BRCA1"]
+        assert gene_server.stats.cache_hits == 2
+
+    async def test_unsupported_operation(self, tmp_path, gene_server):
+        """Only batch operations can be run in bulk mode."""
+        with pytest.raises(ValidationError):
+            await process_bulk_file(
+                gene_server,
+                "get_gene_info",
+                str(tmp_path / "in.tsv"),
+                str(tmp_path / "out.tsv"),
+            )
@@ -0,0 +1,95 @@
+"""
+Tests for startup cache warming.
+
+These tests warm the cache of a gene server whose upstream lookups are
+served in memory.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+import pytest
+
+from genome_mcp.configuration import GenomeMCPConfig, WarmerConfig
+from genome_mcp.exceptions import ValidationError
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+from genome_mcp.servers.warmer import WARMER_CLIENT_ID, CacheWarmer
+
+
+class TestCacheWarmer:
+    """Test pre-populating the result cache from a gene panel."""
+
+    async def test_warms_panel_in_bulk_lane(self, tmp_path, gene_server):
+        """Panel genes are fetched once per operation and served from cache."""
+        panel = tmp_path / "panel.tsv"
+        panel.write_text("# top genes\nTP53\textra\n\nEGFR\nTP53\n")
+        config = WarmerConfig(genes=["BRCA1", "MISSING"], panel_file=str(panel))
+        server = gene_server
+
+        stats = await CacheWarmer(server, config).run()
+
+        assert stats["status"] == "completed"
+        assert stats["genes_total"] == 4
+        assert stats["requests_completed"] == 8
+        assert stats["requests_failed"] == 2
+        assert stats["progress"] == 1.0
+        assert len(server.calls) == 8
+
+        client = server.client_stats[WARMER_CLIENT_ID]
+        assert client.requests_success == 6
+        assert server.scheduler.get_stats()["lanes"]["bulk"]["granted"] == 8
+
+        await server.execute_request("get_gene_info", {"gene_id": "tp53"})
+        await server.execute_request("get_gene_homologs", {"gene_id": "EGFR"})
+        assert len(server.calls) == 8
+
+    async def test_started_with_server(self, make_gene_server):
+        """Servers warm their cache in the background and report progress."""
+        config = GenomeMCPConfig()
+        config.warmer.enabled = True
+        config.warmer.genes = ["TP53"]
+        server = make_gene_server(config)
+
+        await server.start()
+        try:
+            await asyncio.wait_for(server._cache_warmer._task, timeout=5)
+            assert server.get_stats()["warmer"]["status"] == "completed"
+        finally:
+            await server.stop()
+        assert server.calls == ["TP53", "TP53"]
+
+    async def test_concurrency_is_capped(self, gene_server):
+        """Warming never executes more requests at once than configured."""
+        running = []
+        peak = 0
+
+        async def slow_get_gene_info(params):
+            nonlocal peak
+            running.append(params["gene_id"])
+            peak = max(peak, len(running))
+            await asyncio.sleep(0.01)
+            running.remove(params["gene_id"])
+            return {"gene_id": params["gene_id"]}
+
+        gene_server._get_gene_info = slow_get_gene_info
+        config = WarmerConfig(
+            genes=[f"GENE{i}" for i in range(8)],
+            operations=["get_gene_info"],
+            max_concurrency=2,
+        )
+
+        stats = await CacheWarmer(gene_server, config).run()
+
+        assert stats["requests_successful"] == 8
+        assert peak == 2
+
+    def test_invalid_settings(self):
+        """Unknown operations and lanes are rejected."""
+        server = NCBIGeneServer(GenomeMCPConfig())
+        with pytest.raises(ValidationError):
+            CacheWarmer(server, WarmerConfig(operations=["drop_tables"]))
+        with pytest.raises(ValidationError):
+            CacheWarmer(server, WarmerConfig(lane="urgent"))
@@ -0,0 +1,333 @@
+"""
+Tests for result caching in the NCBI Gene server.
+
+These tests serve NCBI EUtils responses from an in-memory HTTP client.
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+import pytest
+
+from genome_mcp.configuration import GenomeMCPConfig
+from genome_mcp.exceptions import ValidationError
+from genome_mcp.servers.ncbi import gene as gene_module
+
+
+class RegionHTTPClient:
+    """HTTP client answering region searches on chromosome 17 from memory."""
+
+    response_cache = None
+
+    # Gene UID, symbol and 0-based esummary start and stop
+    GENES = [
+        ("7157", "TP53", 7687489, 7668401),
+        ("8382", "NME4", 396000, 398000),
+        ("4846", "NOS3", 150688000, 150711000),
+        ("1", "WRAP53", 7686000, 7703000),
+    ]
+
+    def __init__(self):
+        self.terms: list = []
+
+    async def get(self, url: str, **kwargs: Any) -> Dict[str, Any]:
+        query = parse_qs(urlparse(url).query)
+        if "esearch" in url:
+            self.terms.append(query["term"][0])
+            match = re.match(r"(\w+):(\d+)-(\d+)\[chr\]", query["term"][0])
+            start, end = int(match.group(2)), int(match.group(3))
+            uids = [
+                uid
+                for uid, _, chrstart, chrstop in self.GENES
+                if min(chrstart, chrstop) + 1 <= end
+                and max(chrstart, chrstop) + 1 >= start
+            ]
+            return {
+                "esearchresult": {
+                    "idlist": uids[: int(query["retmax"][0])],
+                    "count": str(len(uids)),
+                }
+            }
+
+        uids = query["id"][0].split(",")
+        documents = {
+            uid: {
+                "name": name,
+                "description": f"{name} protein",
+                "genomicinfo": [
+                    {"chrloc": "17", "chrstart": chrstart, "chrstop": chrstop}
+                ],
+            }
+            for uid, name, chrstart, chrstop in self.GENES
+            if uid in uids
+        }
+        return {"result": {"uids": uids, **documents}}
+
+
+class TestCanonicalCacheKeys:
+    """Test that equivalent gene requests share cache entries."""
+
+    def test_equivalent_requests_share_key(self, ncbi_server):
+        """Symbol case, species aliases and default values do not change keys."""
+        server = ncbi_server
+        key = server._request_cache_key("get_gene_info", {"gene_id": "TP53"})
+
+        equivalent = [
+            {"gene_id": "tp53"},
+            {"gene_id": " TP53 ", "species": "human"},
+            {"gene_id": "TP53", "species": "Homo sapiens", "include_summary": True},
+            {"gene_id": "TP53", "fields": None},
+        ]
+        for params in equivalent:
+            assert server._request_cache_key("get_gene_info", params) == key
+
+        different = [
+            {"gene_id": "BRCA1"},
+            {"gene_id": "TP53", "species": "mouse"},
+            {"gene_id": "TP53", "include_summary": False},
+        ]
+        for params in different:
+            assert server._request_cache_key("get_gene_info", params) != key
+
+    async def test_cache_hit_echoes_request(self, ncbi_server):
+        """A cache hit for an equivalent request echoes the caller's spelling."""
+        server = ncbi_server
+
+        first = await server.execute_request(
+            "get_gene_info", {"gene_id": "TP53", "include_summary": False}
+        )
+        second = await server.execute_request(
+            "get_gene_info",
+            {"gene_id": "tp53", "species": "Homo sapiens", "include_summary": False},
+        )
+
+        assert len(server._http_client.urls) == 2
+        assert server.stats.cache_hits == 1
+        assert first["gene_id"] == "TP53"
+        assert first["species"] == "human"
+        assert second["gene_id"] == "tp53"
+        assert second["species"] == "Homo sapiens"
+        assert second["info"] == first["info"]
+
+    async def test_batch_gene_lists_share_key(self, gene_server):
+        """Gene lists naming the same genes share an entry fanned out on hits."""
+        server = gene_server
+        first = await server.execute_request(
+            "batch_gene_info", {"gene_ids": ["TP53", "BRCA1", "MISSING"]}
+        )
+        second = await server.execute_request(
+            "batch_gene_info", {"gene_ids": ["brca1", " TP53", "missing", "BRCA1"]}
+        )
+        homologs = await server.execute_request(
+            "batch_gene_homologs", {"gene_ids": ["TP53", "BRCA1"]}
+        )
+        homologs_hit = await server.execute_request(
+            "batch_gene_homologs", {"gene_ids": ["brca1", "tp53", "TP53"]}
+        )
+
+        assert server.stats.cache_hits == 2
+        assert server.calls == ["TP53", "BRCA1", "MISSING", "TP53", "BRCA1"]
+        assert first["successful"] == 2
+        assert [r["gene_id"] for r in second["results"]] == [
+            "brca1",
+            " TP53",
+            "missing",
+            "BRCA1",
+        ]
+        assert [r["success"] for r in second["results"]] == [True, True, False, True]
+        assert second["results"][1]["data"]["uid"] == "7157"
+        assert (second["total_genes"], second["unique_genes"]) == (4, 3)
+        assert (second["successful"], second["failed"]) == (3, 1)
+        assert list(homologs_hit["results"]) == ["brca1", "tp53", "TP53"]
+        assert homologs_hit["results"]["tp53"]["homologs"] == (
+            homologs["results"]["TP53"]["homologs"]
+        )
+        assert homologs_hit["deduplicated"] == 1
+
+
+class TestRegionCacheKeys:
+    """Test that region searches share cache entries across entry points."""
+
+    def test_equivalent_regions_share_key(self, ncbi_server):
+        """Region formats and entry points map to the same key."""
+        server = ncbi_server
+        key = server._request_cache_key(
+            "search_by_region", {"chromosome": "1", "start": 1000, "end": 2000}
+        )
+
+        equivalent = [
+            ("search_by_region", {"chromosome": "chr1", "start": "1000", "end": 2000}),
+            ("search_by_region_enhanced", {"region": "chr1[1000-2000]"}),
+            ("search_by_region_enhanced", {"region": "1:1000-2000", "max_results": 50}),
+            (
+                "search_by_region_enhanced",
+                {"region": "CHR1:1000-2000", "species": "Homo sapiens"},
+            ),
+        ]
+        for operation, params in equivalent:
+            assert server._request_cache_key(operation, params) == key
+
+        different = [
+            ("search_by_region_enhanced", {"region": "chr1[1000-2001]"}),
+            ("search_by_region_enhanced", {"region": "chr2[1000-2000]"}),
+            (
+                "search_by_region_enhanced",
+                {"region": "chr1[1000-2000]", "species": "mouse"},
+            ),
+        ]
+        for operation, params in different:
+            assert server._request_cache_key(operation, params) != key
+
+    async def test_entry_points_share_results(self, ncbi_server):
+        """A region fetched by one tool is served from the cache to the other."""
+        server = ncbi_server
+
+        first = await server.execute_request(
+            "search_by_region", {"chromosome": "17", "start": 7661779, "end": 7687538}
+        )
+        second = await server.execute_request(
+            "search_by_region_enhanced", {"region": "chr17[7661779-7687538]"}
+        )
+
+        assert len(server._http_client.urls) == 2
+        assert server.stats.cache_hits == 1
+        assert second == first
+        assert server.invalidate(namespace="search_by_region_enhanced")["removed"] == 1
+
+
+class TestRegionIndexSearch:
+    """Test region searches answered from previously fetched regions."""
+
+    @pytest.fixture
+    def region_server(self, make_ncbi_server):
+        """Gene server answering region searches on chromosome 17."""
+        return make_ncbi_server(http_client=RegionHTTPClient())
+
+    async def test_sub_region_answered_locally(self, region_server):
+        """A region inside a fetched region is not searched upstream."""
+        server = region_server
+
+        region = await server.execute_request(
+            "search_by_region_enhanced", {"region": "chr17:7600000-7800000"}
+        )
+        zoomed = await server.execute_request(
+            "search_by_region",
+            {"chromosome": "17", "start": 7680000, "end": 7690000, "max_results": 1},
+        )
+
+        assert len(server._http_client.terms) == 1
+        assert [gene["gene_id"] for gene in region["results"]] == ["TP53", "WRAP53"]
+        assert [gene["gene_id"] for gene in zoomed["results"]] == ["TP53"]
+        assert zoomed["total_count"] == 2
+        assert zoomed["term"] == "17:7680000-7690000[chr] AND human[Organism]"
+        assert server.get_stats()["region_index"]["hits"] == 1
+
+    async def test_only_gaps_are_fetched(self, region_server):
+        """A region overlapping fetched regions only fetches uncovered parts."""
+        server = region_server
+        await server.execute_request(
+            "search_by_region",
+            {"chromosome": "17", "start": 1000, "end": 500000, "fields": ["name"]},
+        )
+
+        result = await server.execute_request(
+            "search_by_region",
+            {"chromosome": "17", "start": 1, "end": 7700000, "fields": ["name"]},
+        )
+
+        assert [term.split("[chr]")[0] for term in server._http_client.terms] == [
+            "17:1000-500000",
+            "17:1-999",
+            "17:500001-7700000",
+        ]
+        assert [gene["gene_id"] for gene in result["results"]] == [
+            "NME4",
+            "TP53",
+            "WRAP53",
+        ]
+        assert result["results"][0]["summary"] == {"name": "NME4"}
+
+    async def test_dense_gap_searches_region_directly(self, region_server, monkeypatch):
+        """A gap too dense to index skips the other gaps for a direct search."""
+        server = region_server
+        monkeypatch.setattr(gene_module, "REGION_FETCH_SIZE", 1)
+        await server.execute_request(
+            "search_by_region",
+            {"chromosome": "17", "start": 100000000, "end": 110000000},
+        )
+
+        result = await server.execute_request(
+            "search_by_region", {"chromosome": "17", "start": 1, "end": 160000000}
+        )
+
+        assert [term.split("[chr]")[0] for term in server._http_client.terms] == [
+            "17:100000000-110000000",
+            "17:1-99999999",
+            "17:1-160000000",
+        ]
+        assert result["total_count"] == 4
+        assert len(result["results"]) == 4
+        # The direct search waits for an upstream turn of its own
+        assert server.scheduler.get_stats()["lanes"]["interactive"]["granted"] == 3
+
+    async def test_regions_without_positions_are_not_indexed(self, ncbi_server):
+        """Searches whose genes lack positions are answered but not indexed."""
+        server = ncbi_server
+        params = {"chromosome": "17", "start": 7661779, "end": 7687538}
+
+        result = await server.execute_request("search_by_region", params)
+        assert result["results"][0]["gene_id"] == "TP53"
+
+        server.invalidate(namespace="search_by_region")
+        await server.execute_request("search_by_region", params)
+        assert len(server._http_client.urls) == 4
+        assert len(server.region_index) == 0
+
+
+class TestCacheInvalidation:
+    """Test operation TTLs and cache invalidation."""
+
+    async def test_operation_ttl(self, make_ncbi_server):
+        """Results are cached with the TTL configured for their operation."""
+        config = GenomeMCPConfig()
+        config.cache.operation_ttls["get_gene_summary"] = 120
+        server = make_ncbi_server(config)
+        server._get_gene_text_summary = _fake_text_summary
+
+        await server.execute_request("get_gene_summary", {"gene_id": "TP53"})
+        await server.execute_request("get_gene_info", {"gene_id": "TP53"})
+
+        ttls = {
+            key.split(":")[1]: entry.expires
+            for key, entry in server.cache._entries.items()
+        }
+        assert ttls["get_gene_info"] - ttls["get_gene_summary"] == pytest.approx(
+            config.cache.ttl - 120, abs=5
+        )
+
+    async def test_invalidate_by_namespace_gene_and_uid(self, ncbi_server):
+        """Results are invalidated by operation, gene or UID."""
+        server = ncbi_server
+        server._get_gene_text_summary = _fake_text_summary
+        for operation in ("get_gene_info", "get_gene_summary"):
+            await server.execute_request(operation, {"gene_id": "TP53"})
+        await server.execute_request("get_gene_expression", {"gene_id": "EGFR"})
+
+        assert server.invalidate(namespace="get_gene_summary")["removed"] == 1
+        assert server.invalidate(gene_id="egfr")["removed"] == 1
+        assert server.invalidate(uid="7157")["removed"] == 1
+        assert len(server.cache) == 0
+
+        with pytest.raises(ValidationError):
+            server.invalidate()
+        with pytest.raises(ValidationError):
+            server.invalidate(namespace="unknown")
+
+
+async def _fake_text_summary(gene_uid: str) -> str:
+    return "summary"
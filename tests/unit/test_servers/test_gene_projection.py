@@ -0,0 +1,75 @@
+"""
+Tests for field projection in the NCBI Gene server.
+
+These tests serve NCBI EUtils responses from an in-memory HTTP client.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from genome_mcp.exceptions import ValidationError
+from genome_mcp.servers.ncbi.gene import DEFAULT_GENE_FIELDS
+
+
+class TestFieldProjection:
+    """Test the fields parameter of gene operations."""
+
+    async def test_compact_default(self, ncbi_server):
+        """Gene info keeps only the default fields unless asked otherwise."""
+        server = ncbi_server
+
+        result = await server._get_gene_info(
+            {"gene_id": "TP53", "include_summary": False}
+        )
+
+        assert set(result["info"]) <= {f.split(".")[0] for f in DEFAULT_GENE_FIELDS}
+        assert result["info"]["organism"] == {
+            "scientificname": "Homo sapiens",
+            "taxid": 9606,
+        }
+        assert "locationhist" not in result["info"]
+
+    async def test_explicit_fields_and_full_document(self, ncbi_server):
+        """Explicit fields select keys and "*" returns the full document."""
+        server = ncbi_server
+
+        projected = await server._get_gene_info(
+            {"gene_id": "TP53", "include_summary": False, "fields": ["mim"]}
+        )
+        full = await server._get_gene_info(
+            {"gene_id": "TP53", "include_summary": False, "fields": ["*"]}
+        )
+
+        assert projected["info"] == {"mim": ["191170"]}
+        assert full["info"] == server._http_client.document
+
+    async def test_search_results_are_projected(self, ncbi_server):
+        """Search results carry projected esummary documents."""
+        server = ncbi_server
+
+        result = await server._search_genes({"term": "TP53", "fields": ["name"]})
+
+        assert result["results"][0]["summary"] == {"name": "TP53"}
+
+    async def test_projection_applied_before_caching(self, ncbi_server):
+        """Cached entries hold the projected result."""
+        server = ncbi_server
+
+        await server.execute_request(
+            "get_gene_info",
+            {"gene_id": "TP53", "include_summary": False, "fields": ["name"]},
+        )
+
+        cached = [server.cache.get(key) for key in server.cache.keys()]
+        assert cached[0]["info"] == {"name": "TP53"}
+
+    async def test_invalid_fields_rejected(self, ncbi_server):
+        """Non-string field lists are rejected."""
+        server = ncbi_server
+
+        with pytest.raises(ValidationError):
+            await server._batch_gene_info({"gene_ids": ["TP53"], "fields": [1]})
@@ -0,0 +1,162 @@
+"""
+Tests for background batch jobs.
+
+These tests run jobs against an in-memory gene server and a temporary
+checkpoint directory.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from genome_mcp.configuration import JobsConfig
+from genome_mcp.exceptions import DataNotFoundError, ValidationError
+from genome_mcp.servers.jobs import RESULTS_FILE, BatchJobManager
+from genome_mcp.servers.ncbi.gene import NCBIGeneServer
+
+
+def _make_manager(server: NCBIGeneServer, tmp_path: Path) -> BatchJobManager:
+    config = JobsConfig(checkpoint_dir=str(tmp_path), chunk_size=3, page_size=4)
+    return BatchJobManager(server, config)
+
+
+async def _wait_for_job(manager: BatchJobManager, job_id: str) -> Dict[str, Any]:
+    for _ in range(200):
+        status = manager.get_status(job_id)
+        if status["status"] not in ("pending", "running"):
+            return status
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+class TestBatchJobManager:
+    """Test job submission, progress and paging."""
+
+    async def test_job_runs_to_completion(self, tmp_path, gene_server):
+        """Jobs process all genes and record progress."""
+        manager = _make_manager(gene_server, tmp_path)
+        await manager.start()
+        gene_ids = [f"GENE{i}" for i in range(7)] + ["MISSING"]
+
+        job = await manager.submit("batch_gene_info", gene_ids)
+        status = await _wait_for_job(manager, job["job_id"])
+
+        assert status["status"] == "completed"
+        assert status["completed"] == 8
+        assert status["successful"] == 7
+        assert status["failed"] == 1
+        assert status["progress"] == 1.0
+        assert gene_server.calls == gene_ids
+
+    async def test_results_are_paged(self, tmp_path, gene_server):
+        """Results are fetched in pages in input order."""
+        manager = _make_manager(gene_server, tmp_path)
+        await manager.start()
+        gene_ids = [f"GENE{i}" for i in range(6)]
+
+        job = await manager.submit("batch_gene_homologs", gene_ids)
+        await _wait_for_job(manager, job["job_id"])
+
+        first = manager.get_results(job["job_id"])
+        second = manager.get_results(job["job_id"], offset=first["next_offset"])
+
+        assert [r["gene_id"] for r in first["results"]] == gene_ids[:4]
+        assert [r["gene_id"] for r in second["results"]] == gene_ids[4:]
+        assert second["next_offset"] is None
+
+    async def test_duplicate_genes_keep_their_positions(self, tmp_path, gene_server):
+        """Repeated genes get one result per input position."""
+        manager = _make_manager(gene_server, tmp_path)
+        await manager.start()
+        gene_ids = ["TP53", "TP53", "BRCA1", "EGFR", "EGFR", "KRAS"]
+
+        job = await manager.submit("batch_gene_homologs", gene_ids)
+        status = await _wait_for_job(manager, job["job_id"])
+        results = manager.get_results(job["job_id"], limit=10)
+
+        assert status["completed"] == 6
+        assert status["progress"] == 1.0
+        assert [r["gene_id"] for r in results["results"]] == gene_ids
+        assert results["next_offset"] is None
+        assert gene_server.calls == ["TP53", "BRCA1", "EGFR", "KRAS"]
+
+    async def test_cached_genes_are_not_fetched(self, tmp_path, gene_server):
+        """Job lookups are served from and stored in the result cache."""
+        manager = _make_manager(gene_server, tmp_path)
+        await manager.start()
+        async for _ in gene_server.iter_batch_gene_info(["TP53"]):
+            pass
+        gene_server.calls.clear()
+
+        job = await manager.submit("batch_gene_info", ["TP53", "BRCA1"])
+        await _wait_for_job(manager, job["job_id"])
+        results = manager.get_results(job["job_id"])["results"]
+
+        assert gene_server.calls == ["BRCA1"]
+        assert [r["gene_id"] for r in results] == ["TP53", "BRCA1"]
+        assert all(r["success"] for r in results)
+
+    async def test_invalid_requests_rejected(self, tmp_path, gene_server):
+        """Unknown operations and job IDs raise errors."""
+        manager = _make_manager(gene_server, tmp_path)
+        await manager.start()
+
+        with pytest.raises(ValidationError):
+            await manager.submit("get_gene_info", ["TP53"])
+        with pytest.raises(DataNotFoundError):
+            manager.get_status("../../etc")
+
+    async def test_resume_from_checkpoint(self, tmp_path, make_gene_server):
+        """A restarted manager continues after the last complete result."""
+        manager = _make_manager(make_gene_server(), tmp_path)
+        await manager.start()
+        gene_ids = [f"GENE{i}" for i in range(7)]
+        job = await manager.submit("batch_gene_info", gene_ids)
+        await _wait_for_job(manager, job["job_id"])
+
+        # Simulate a crash after three results and a torn write
+        job_dir = tmp_path / job["job_id"]
+        lines = (job_dir / RESULTS_FILE).read_text().splitlines(keepends=True)
+        (job_dir / RESULTS_FILE).write_text("".join(lines[:3]) + '{"gene_id": "GE')
+        metadata = json.loads((job_dir / "job.json").read_text())
+        metadata["status"] = "running"
+        (job_dir / "job.json").write_text(json.dumps(metadata))
+
+        server = make_gene_server()
+        restarted = _make_manager(server, tmp_path)
+        assert await restarted.start() == [job["job_id"]]
+        status = await _wait_for_job(restarted, job["job_id"])
+
+        assert status["status"] == "completed"
+        assert status["completed"] == 7
+        assert server.calls == gene_ids[3:]
+        results = restarted.get_results(job["job_id"], limit=10)["results"]
+        assert [r["gene_id"] for r in results] == gene_ids
+
+    async def test_cancel_job(self, tmp_path, make_gene_server):
+        """Cancelled jobs stop and are not resumed."""
+        server = make_gene_server()
+        release = asyncio.Event()
+        original = server._get_gene_info
+
+        async def blocking_get_gene_info(params: Dict[str, Any]) -> Dict[str, Any]:
+            await release.wait()
+            return await original(params)
+
+        server._get_gene_info = blocking_get_gene_info
+        manager = _make_manager(server, tmp_path)
+        await manager.start()
+
+        job = await manager.submit("batch_gene_info", ["TP53", "BRCA1"])
+        await asyncio.sleep(0.01)
+        status = await manager.cancel(job["job_id"])
+
+        assert status["status"] == "cancelled"
+        restarted = _make_manager(make_gene_server(), tmp_path)
+        assert await restarted.start() == []
@@ -210,18 +210,15 @@ async def test_ncbi_gene_server():
             assert "Unsupported operation" in str(e)
             print("✓ 不支持操作错误处理正常")
 
-    # Test batch size limits
+    # Test large batches are accepted and processed in chunks
     async with NCBIGeneServer(config) as server:
-        try:
-            # Test with too many genes (should exceed batch size)
-            too_many_genes = ["GENE" + str(i) for i in range(200)]
-            await server.execute_request(
-                "batch_gene_info", {"gene_ids": too_many_genes, "species": "human"}
-            )
-            assert False, "Should have raised ValidationError"
-        except ValidationError as e:
-            assert "exceeds maximum" in str(e)
-            print("✓ 批量大小限制验证正常")
+        chunk_sizes = []
+        async for chunk in server.execute_stream(
+            "batch_gene_info", {"gene_ids": ["TP53", "BRCA1"], "species": "human"}
+        ):
+            chunk_sizes.append(chunk["data"]["total_genes"])
+        assert sum(chunk_sizes) == 2
+        print("✓ 批量分块流式处理正常")
 
     # Test stats
     async with NCBIGeneServer(config) as server:
@@ -258,7 +255,7 @@ async def test_server_capabilities():
     assert caps.name == "NCBIGeneServer"
     assert caps.version == "1.0.0"
     assert caps.supports_batch
-    assert not caps.supports_streaming
+    assert caps.supports_streaming
     assert caps.max_batch_size > 0
     assert caps.rate_limit_requests > 0
 
@@ -18,12 +18,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 from genome_mcp.core import (
     async_timeout,
     calculate_similarity,
+    canonical_cache_key,
+    canonicalize_params,
     chunk_list,
     ensure_directory,
     flatten_list,
     format_duration,
     format_file_size,
     generate_cache_key,
+    get_json_codec,
     get_timestamp,
     log_execution_time,
     memory_usage,
@@ -66,6 +69,61 @@ class TestCacheKeyGeneration:
 
         assert key1 == key2
 
+    def test_canonicalize_params(self):
+        """Test normalizing parameters and dropping defaults."""
+        params = {"symbol": " tp53", "species": "human", "limit": 20, "x": None}
+        canonical = canonicalize_params(
+            params,
+            defaults={"species": "Human", "limit": 10},
+            normalizers={
+                "symbol": lambda value: value.strip().upper(),
+                "species": str.lower,
+            },
+        )
+
+        assert canonical == {"symbol": "TP53", "limit": 20}
+
+    def test_canonical_cache_key(self):
+        """Test that equivalent parameters produce the same key."""
+        normalizers = {"symbol": str.upper}
+        key1 = canonical_cache_key("test", {"symbol": "tp53"}, {"n": 1}, normalizers)
+        key2 = canonical_cache_key(
+            "test", {"n": 1, "symbol": "TP53"}, {"n": 1}, normalizers
+        )
+        key3 = canonical_cache_key("test", {"symbol": "TP53", "n": 2}, {"n": 1})
+
+        assert key1 == key2
+        assert key1 != key3
+        assert key1.startswith("test:")
+
+
+class TestJSONCodec:
+    """Test JSON codec selection and round trips."""
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    def test_round_trip(self, name):
+        """Every codec round-trips data and falls back when not installed."""
+        codec = get_json_codec(name)
+        data = {"gene": "TP53", "ids": [7157, 1.5, None, True], "nested": {"a": "é"}}
+
+        encoded = codec.dumps(data)
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == data
+        assert codec.loads(memoryview(encoded)) == data
+        assert codec.loads(encoded.decode()) == data
+
+    @pytest.mark.parametrize("name", ["orjson", "msgspec"])
+    def test_sorted_output_matches_stdlib(self, name):
+        """Sorted output is identical across codecs, keeping cache keys stable."""
+        data = {"b": [1, 2], "a": {"y": "x", "c": datetime(2024, 1, 1)}}
+        expected = get_json_codec("json").dumps(data, sort_keys=True)
+        assert get_json_codec(name).dumps(data, sort_keys=True) == expected
+
+    def test_unknown_codec(self):
+        """Unknown codec names are rejected."""
+        with pytest.raises(ValidationError):
+            get_json_codec("yaml")
+
 
 class TestFormattingFunctions:
     """Test data formatting functions."""
@@ -15,6 +15,7 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
+from genome_mcp.core import ResponseCache
 from genome_mcp.exceptions import (
     AuthenticationError,
     NetworkError,
@@ -267,6 +268,66 @@ class TestHTTPClient:
                 await http_client.get("/test")
 
 
+class TestResponseCache:
+    """Test caching of raw response bodies."""
+
+    async def test_get_decodes_cached_body(self):
+        """Repeated GETs are served from the cache without decoding again."""
+        cache = ResponseCache()
+        client = HTTPClient("https://api.test.com", response_cache=cache)
+        body = b'{"result": {"uids": ["7157"]}}'
+
+        with (
+            patch.object(
+                client, "_request_body", AsyncMock(return_value=body)
+            ) as request,
+            patch.object(client, "_decode_body", wraps=client._decode_body) as decode,
+        ):
+            first = await client.get("/esummary", params={"id": "7157"})
+            second = await client.get("/esummary", params={"id": "7157"})
+
+        assert first == second == {"result": {"uids": ["7157"]}}
+        request.assert_called_once()
+        decode.assert_called_once()
+        assert cache.get_stats()["decoded_hits"] == 1
+
+    async def test_get_decodes_body_once_evicted(self):
+        """Bodies whose decoded document was dropped are decoded again."""
+        cache = ResponseCache(decoded_size=1)
+        client = HTTPClient("https://api.test.com", response_cache=cache)
+
+        with patch.object(
+            client, "_request_body", AsyncMock(side_effect=[b"[1]", b"[2]"])
+        ) as request:
+            assert await client.get("/a") == [1]
+            assert await client.get("/b") == [2]
+            assert await client.get("/a") == [1]
+
+        assert request.call_count == 2
+        assert cache.get_stats()["decoded_hits"] == 0
+
+    async def test_get_non_json_body(self):
+        """Non-JSON bodies are returned as raw text."""
+        client = HTTPClient("https://api.test.com", response_cache=ResponseCache())
+
+        with patch.object(client, "_request_body", AsyncMock(return_value=b"text")):
+            assert await client.get("/efetch") == {"data": "text"}
+
+    def test_body_sizes_and_eviction(self):
+        """Bodies are measured by length and evicted least recently used first."""
+        cache = ResponseCache(max_size=2)
+        cache.set("a", b"x" * 10)
+        cache.set("b", b"x" * 20)
+        cache.get("a")
+        cache.set("c", b"x" * 30)
+
+        assert "b" not in cache
+        assert cache.get_stats()["stored_bytes"] == 40
+        assert cache.shrink(0.5) == 1
+        assert "c" not in cache
+        assert cache.get_stats()["stored_bytes"] == 10
+
+
 class TestFetchWithRetry:
     """Test fetch_with_retry functionality."""
 
@@ -221,6 +221,13 @@ class TestJSONDataParser:
 
         assert result == "default"
 
+    def test_project_fields(self):
+        """Test projecting dictionary onto dotted field paths."""
+        data = {"a": 1, "b": {"c": 2, "d": 3}, "e": [1, 2]}
+        result = JSONDataParser.project_fields(data, ["a", "b.c", "e", "missing"])
+
+        assert result == {"a": 1, "b": {"c": 2}, "e": [1, 2]}
+
     def test_flatten_dict_simple(self):
         """Test flattening simple dictionary."""
         data = {"a": 1, "b": 2}
@@ -283,6 +290,38 @@ class TestJSONDataParser:
 
         assert result == data
 
+    def test_iter_flatten_dict(self):
+        """Test iterating over flattened pairs lazily."""
+        data = {"a": {"b": 1}, "c": [{"d": 2}, [3]]}
+        pairs = JSONDataParser.iter_flatten_dict(data)
+
+        assert next(pairs) == ("a.b", 1)
+        assert list(pairs) == [("c[0].d", 2), ("c[1]", [3])]
+
+    def test_deep_payloads(self):
+        """Test flattening and cleaning payloads deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() * 2
+        data = {"leaf": "value", "empty": None}
+        for _ in range(depth):
+            data = {"n": data, "items": [None, {"x": None}]}
+
+        flat = JSONDataParser.flatten_dict(data)
+        assert flat[".".join(["n"] * depth) + ".leaf"] == "value"
+
+        cleaned = JSONDataParser.clean_response_data(data)
+        for _ in range(depth):
+            assert cleaned["items"] == [{}]
+            cleaned = cleaned["n"]
+        assert cleaned == {"leaf": "value"}
+
+    def test_iter_clean_response_data(self):
+        """Test cleaning a stream of records."""
+        records = iter([{"a": None, "b": 1}, None, {"c": {"d": None}}])
+        result = JSONDataParser.iter_clean_response_data(records)
+
+        assert next(result) == {"b": 1}
+        assert list(result) == [{}]
+
 
 class TestBatchProcessor:
     """Test batch processing functionality."""